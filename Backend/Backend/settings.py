@@ -13,6 +13,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 from pathlib import Path
 
 from datetime import timedelta
+from celery.schedules import crontab
 import environ
 
 
@@ -63,6 +64,7 @@ INSTALLED_APPS = [
     "flags.apps.FlagsConfig",
     "search_and_export",
     "realtime",
+    "work_queue.apps.WorkQueueConfig",
     # ----- THIRD PARTY APPS -----
     "rest_framework",
     "rest_framework.authtoken",
@@ -94,6 +96,7 @@ MIDDLEWARE = [
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "corsheaders.middleware.CorsMiddleware",
+    "api.middleware.ThrottleHeadersMiddleware",
 ]
 
 ROOT_URLCONF = "Backend.urls"
@@ -177,22 +180,48 @@ CHANNEL_LAYERS = {
 
 CELERY_BROKER_URL = "redis://127.0.0.1:6379/0"
 CELERY_RESULT_BACKEND = "redis://127.0.0.1:6379/2"
+# Email workers run `celery -A Backend worker -Q email_otp,email_bulk`. With
+# the priority strategy queues are polled in that order, so OTPs are sent
+# ahead of bulk notifications.
+CELERY_TASK_ROUTES = {
+    "api.services.send_otp_email_task": {"queue": "email_otp"},
+    "api.services.send_emails_task": {"queue": "email_bulk"},
+}
+CELERY_BROKER_TRANSPORT_OPTIONS = {"queue_order_strategy": "priority"}
+CELERY_BEAT_SCHEDULE = {
+    "purge-expired-tokens": {
+        "task": "api.services.purge_expired_tokens_task",
+        "schedule": crontab(hour=2, minute=30),
+    },
+    # Future dated level|step rates take effect at midnight
+    "sync-level-step-salaries": {
+        "task": "occurance.services.sync_level_step_salaries_task",
+        "schedule": crontab(hour=0, minute=5),
+    },
+}
 
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "api.authentication.CachedJWTAuthentication",
     ),
     "EXCEPTION_HANDLER": "Backend.exception_handler.custom_exception_handler",
+    # Views that set no throttle_classes, e.g. dj_rest_auth's, use the read
+    # budget
     "DEFAULT_THROTTLE_CLASSES": [
         "rest_framework.throttling.AnonRateThrottle",
-        "rest_framework.throttling.UserRateThrottle",
+        "api.throttles.ReadThrottle",
     ],
     "DEFAULT_THROTTLE_RATES": {
         "anon": "10/hour",
-        "user": "12/minute",
-        # login throttles
-        "custom_user": "6/minute",
+        # per view family budgets, see api.throttles.BudgetRateThrottle
+        "read": "120/minute",
+        "search": "60/minute",
+        "write": "12/minute",
+        "bulk": "6/minute",
+        "export": "6/minute",
+        # login throttles, see api.throttles.LockoutRateThrottle
+        "custom_user": "3/minute",
         "custom_anon": "3/minute",
     },
 }
@@ -204,6 +233,7 @@ SIMPLE_JWT = {
     "REFRESH_TOKEN_LIFETIME": timedelta(days=14),
     "ROTATE_REFRESH_TOKENS": True,
     "BLACKLIST_AFTER_ROTATION": True,
+    "TOKEN_REFRESH_SERIALIZER": "api.serializers.CachedTokenRefreshSerializer",
 }
 
 
@@ -215,7 +245,11 @@ OTP_EMAIL_SUBJECT = "Your CiviBase One-Time Password (OTP)"
 OTP_EMAIL_BODY_HTML_TEMPLATE_PATH = "otp/email_otp.html"
 
 
-EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
+# Queues mail sent outside Celery tasks for the email workers, which send
+# over a pooled EMAIL_DELIVERY_BACKEND connection, see api.mail
+EMAIL_BACKEND = "api.mail.QueuedEmailBackend"
+EMAIL_DELIVERY_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
+EMAIL_TIMEOUT = 10
 EMAIL_HOST = "in-v3.mailjet.com"
 EMAIL_PORT = 587
 EMAIL_USE_TLS = True
@@ -271,3 +305,10 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 CORS_ALLOW_ALL_ORIGINS = False
 CORS_ALLOWED_ORIGINS = ["http://localhost:5173"]
 CORS_ALLOW_CREDENTIALS = True
+CORS_EXPOSE_HEADERS = [
+    "Retry-After",
+    "X-RateLimit-Scope",
+    "X-RateLimit-Limit",
+    "X-RateLimit-Remaining",
+    "X-RateLimit-Reset",
+]
@@ -2,7 +2,7 @@ from rest_framework import generics
 import logging
 from . import serializers
 from .models import Absences
-from rest_framework.throttling import UserRateThrottle
+from api.throttles import WriteThrottle
 from rest_framework.permissions import IsAuthenticated
 from employees.permissions import IsAdminUserOrStandardUser
 from activity_feeds.models import ActivityFeeds
@@ -12,6 +12,7 @@ from .utils import absences_changes
 from rest_framework.response import Response
 from rest_framework import status
 from django.db import transaction
+from employees.views import EmployeeResponseCacheMixin
 
 logger = logging.getLogger(__name__)
 
@@ -19,7 +20,7 @@ logger = logging.getLogger(__name__)
 class CreateAbsencesAPIView(generics.CreateAPIView):
     serializer_class = serializers.AbsencesWriteSerializer
     queryset = Absences.objects.all()
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
 
     def create(self, request, *args, **kwargs):
@@ -72,7 +73,7 @@ class EditAbsencesAPIView(generics.UpdateAPIView):
     queryset = Absences.objects.all()
     serializer_class = serializers.AbsencesWriteSerializer
     lookup_field = "pk"
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
 
     def update(self, request, *args, **kwargs):
@@ -105,7 +106,8 @@ class EditAbsencesAPIView(generics.UpdateAPIView):
                 )
 
 
-class ListEmployeeAbsencesAPIView(generics.ListAPIView):
+class ListEmployeeAbsencesAPIView(EmployeeResponseCacheMixin, generics.ListAPIView):
+    cache_resource = "absences"
     serializer_class = serializers.AbsencesReadSerializer
     throttle_classes = []
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
@@ -129,7 +131,7 @@ class DeleteAbsencesAPIView(generics.DestroyAPIView):
     queryset = Absences.objects.all()
     serializer_class = serializers.AbsencesWriteSerializer
     lookup_field = "pk"
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
 
     def perform_destroy(self, instance):
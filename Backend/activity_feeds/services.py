@@ -0,0 +1,27 @@
+import logging
+from django.contrib.postgres.search import SearchVector, Value
+from .models import ActivityFeeds
+from .signals import send_feeds_dashboard_update
+
+logger = logging.getLogger(__name__)
+
+
+def create_activity_feeds(creator, activities):
+    # bulk_create skips post_save, so the search vectors and the dashboard update
+    # normally handled in signals.py are applied once for the whole batch
+    feeds = ActivityFeeds.objects.bulk_create(
+        [ActivityFeeds(creator=creator, activity=activity) for activity in activities]
+    )
+
+    if not feeds:
+        return feeds
+
+    ActivityFeeds.objects.filter(pk__in=[feed.pk for feed in feeds]).update(
+        search_vector=SearchVector("activity", weight="A", config="english")
+        + SearchVector(Value(creator.username), weight="B", config="english")
+    )
+    logger.debug(f"{len(feeds)} Activity feeds created.")
+
+    send_feeds_dashboard_update()
+
+    return feeds
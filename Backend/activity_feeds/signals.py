@@ -2,23 +2,13 @@ from .models import ActivityFeeds
 from django.contrib.postgres.search import SearchVector, Value
 from django.db.models.signals import post_save
 from django.dispatch import receiver
-from asgiref.sync import async_to_sync
-from channels.layers import get_channel_layer
 from employees import services
-
-
-def send_update(data):
-    channel_layer = get_channel_layer()
-
-    async_to_sync(channel_layer.group_send)(
-        "feeds",
-        {"type": "send_dashboard_stats", "event_type": "feeds_update", "data": data},
-    )
+from realtime.broadcast import publish
 
 
 def send_feeds_dashboard_update():
     data = services.get_sample_activity_feeds()
-    send_update(data)
+    publish("feeds", "feeds_update", data)
 
 
 @receiver(post_save, sender=ActivityFeeds)
@@ -2,7 +2,7 @@ from rest_framework import generics
 from . import models
 from . import serializers
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.throttling import UserRateThrottle
+from api.throttles import SearchThrottle
 from django.contrib.postgres.search import SearchQuery, SearchRank
 from .models import ActivityFeeds
 from django.db.models import F
@@ -21,7 +21,7 @@ class ListActivityFeedAPIView(generics.ListAPIView):
 
 class SearchActivityAPIView(generics.ListAPIView):
     serializer_class = serializers.ActivityFeedsSerializer
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [SearchThrottle]
     permission_classes = [IsAuthenticated]
     pagination_class = LargeResultsSetPagination
 
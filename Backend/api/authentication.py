@@ -0,0 +1,117 @@
+import logging
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+logger = logging.getLogger(__name__)
+
+# Kept short so a missed invalidation cannot outlive a minute
+USER_CACHE_TIMEOUT = 60
+
+# Tokens carry the user's token_version; api.signals bumps it to revoke them
+TOKEN_VERSION_CLAIM = "ver"
+
+# Changes to these revoke the user's tokens
+TOKEN_REVOKING_FIELDS = [
+    "role",
+    "is_active",
+    "is_staff",
+    "is_superuser",
+    "division",
+    "password",
+]
+
+# What authentication and permissions read. Anything else is loaded from the
+# users table on first access. username is kept for str(user), which every
+# activity feed entry uses.
+USER_CACHE_FIELDS = [
+    "id",
+    "username",
+    "role",
+    "is_active",
+    "is_staff",
+    "is_superuser",
+    "division",
+    "token_version",
+]
+
+
+def get_user_cache_key(user_id, token_version=0):
+    return f"auth:user:{user_id}:{token_version}"
+
+
+def invalidate_cached_user(user_id, *token_versions):
+    keys = [get_user_cache_key(user_id, version) for version in set(token_versions)]
+    cache.delete_many(keys)
+
+    # Again once committed, in case a request cached the old row meanwhile
+    transaction.on_commit(lambda: cache.delete_many(keys))
+    logger.debug(f"Cached user({user_id}) invalidated.")
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    # JWTAuthentication that resolves the token's user from the cache rather
+    # than the users table on every request. Only USER_CACHE_FIELDS are
+    # cached, under the token's version, and api.signals invalidates the entry
+    # whenever the user is saved or deleted.
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(
+                _("Token contained no recognizable user identification")
+            ) from e
+
+        # Tokens issued before the claim existed match the initial version
+        token_version = validated_token.get(TOKEN_VERSION_CLAIM, 0)
+
+        key = get_user_cache_key(user_id, token_version)
+        fields = cache.get(key)
+
+        if fields is None:
+            try:
+                user = self.user_model.objects.only(*USER_CACHE_FIELDS).get(
+                    **{api_settings.USER_ID_FIELD: user_id}
+                )
+            except self.user_model.DoesNotExist as e:
+                raise AuthenticationFailed(
+                    _("User not found"), code="user_not_found"
+                ) from e
+
+            # Only entries for the current version are ever cached, so a hit
+            # needs no check
+            if user.token_version != token_version:
+                raise AuthenticationFailed(
+                    _("Token has been revoked"), code="token_revoked"
+                )
+
+            fields = {
+                field.attname: getattr(user, field.attname)
+                for field in self.get_cached_fields()
+            }
+            cache.set(key, fields, timeout=USER_CACHE_TIMEOUT)
+
+        else:
+            user = self.user_model.from_db(
+                DEFAULT_DB_ALIAS,
+                list(fields),
+                [fields[field.attname] for field in self.get_cached_fields()],
+            )
+
+        # The same check JWTAuthentication makes, on cached users too
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        return user
+
+    def get_cached_fields(self):
+        # In model order, as from_db expects its values
+        return [
+            field
+            for field in self.user_model._meta.concrete_fields
+            if field.name in USER_CACHE_FIELDS
+        ]
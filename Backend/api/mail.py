@@ -0,0 +1,194 @@
+import logging
+import threading
+import time
+from celery import current_task
+from django.conf import settings
+from django.core.cache import cache
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.core.mail.backends.base import BaseEmailBackend
+from kombu.exceptions import OperationalError
+from . import network_exceptions
+
+logger = logging.getLogger(__name__)
+
+# Messages per SMTP session when sending in bulk
+EMAIL_BATCH_SIZE = 50
+# Seconds an unused connection is kept before it is reopened; SMTP servers
+# drop idle sessions
+EMAIL_CONNECTION_IDLE_TIMEOUT = 30
+# Failures within EMAIL_CIRCUIT_WINDOW seconds that open the circuit, and
+# how long it stays open
+EMAIL_CIRCUIT_THRESHOLD = 5
+EMAIL_CIRCUIT_WINDOW = 60
+EMAIL_CIRCUIT_TIMEOUT = 30
+
+EMAIL_CIRCUIT_KEY = "email:circuit"
+EMAIL_FAILURES_KEY = "email:failures"
+
+DELIVERY_ERRORS = (
+    *network_exceptions.EMAIL_ERRORS,
+    *network_exceptions.SOCKET_CONNECTION_ERRORS,
+)
+
+# One SMTP connection per worker process, kept open between tasks
+_pool = {"connection": None, "last_used": 0.0}
+_pool_lock = threading.RLock()
+
+
+class EmailCircuitOpen(Exception):
+
+    def __init__(self, retry_in):
+        super().__init__(f"Email delivery paused for {retry_in} seconds.")
+        self.retry_in = retry_in
+
+
+def check_circuit():
+    # Shared by every worker, so one failing SMTP server pauses all of them
+    retry_in = cache.ttl(EMAIL_CIRCUIT_KEY)
+
+    if retry_in:
+        raise EmailCircuitOpen(retry_in)
+
+
+def record_failure():
+    cache.add(EMAIL_FAILURES_KEY, 0, timeout=EMAIL_CIRCUIT_WINDOW)
+    failures = cache.incr(EMAIL_FAILURES_KEY)
+
+    if failures >= EMAIL_CIRCUIT_THRESHOLD:
+        cache.set(EMAIL_CIRCUIT_KEY, True, timeout=EMAIL_CIRCUIT_TIMEOUT)
+        cache.delete(EMAIL_FAILURES_KEY)
+        logger.error(
+            f"{failures} email failures, pausing delivery for "
+            f"{EMAIL_CIRCUIT_TIMEOUT} seconds."
+        )
+
+
+def get_smtp_connection():
+    with _pool_lock:
+        connection = _pool["connection"]
+
+        if (
+            connection is not None
+            and time.monotonic() - _pool["last_used"] > EMAIL_CONNECTION_IDLE_TIMEOUT
+        ):
+            close_smtp_connection()
+            connection = None
+
+        if connection is None:
+            connection = get_connection(
+                settings.EMAIL_DELIVERY_BACKEND, fail_silently=False
+            )
+            # Opened here, so send_messages leaves it open afterwards
+            connection.open()
+            _pool["connection"] = connection
+            _pool["last_used"] = time.monotonic()
+            logger.debug("SMTP connection opened.")
+
+        return connection
+
+
+def close_smtp_connection():
+    with _pool_lock:
+        connection, _pool["connection"] = _pool["connection"], None
+
+        if connection is not None:
+            try:
+                connection.close()
+            except DELIVERY_ERRORS:
+                pass
+
+
+def deliver(messages):
+    # Sends EmailMessages over the worker's pooled connection, in batches
+    check_circuit()
+
+    sent = 0
+
+    with _pool_lock:
+        try:
+            connection = get_smtp_connection()
+
+            for start in range(0, len(messages), EMAIL_BATCH_SIZE):
+                sent += connection.send_messages(
+                    messages[start : start + EMAIL_BATCH_SIZE]
+                )
+                _pool["last_used"] = time.monotonic()
+
+        except DELIVERY_ERRORS as e:
+            logger.warning(f"Email delivery failed. Exception({e})")
+            close_smtp_connection()
+            record_failure()
+            raise
+
+    logger.debug(f"{sent} emails delivered.")
+
+    return sent
+
+
+def serialize_message(message):
+    # JSON safe form for task arguments; attachments are not carried
+    return {
+        "subject": message.subject,
+        "body": message.body,
+        "from_email": message.from_email,
+        "to": message.to,
+        "cc": message.cc,
+        "bcc": message.bcc,
+        "reply_to": message.reply_to,
+        "headers": message.extra_headers,
+        "alternatives": [
+            [content, mimetype]
+            for content, mimetype in getattr(message, "alternatives", [])
+        ],
+    }
+
+
+def build_message(data):
+    alternatives = data.pop("alternatives", [])
+    message = EmailMultiAlternatives(**data)
+
+    for content, mimetype in alternatives:
+        message.attach_alternative(content, mimetype)
+
+    return message
+
+
+class PooledEmailBackend(BaseEmailBackend):
+    # Sends over the worker's pooled connection, so the OTP emails django_otp
+    # sends reuse one SMTP session. The connection itself comes from
+    # EMAIL_DELIVERY_BACKEND.
+
+    def send_messages(self, email_messages):
+        try:
+            return deliver(list(email_messages))
+
+        except (EmailCircuitOpen, *DELIVERY_ERRORS):
+            if not self.fail_silently:
+                raise
+
+            return 0
+
+
+class QueuedEmailBackend(PooledEmailBackend):
+    # EMAIL_BACKEND. Celery tasks, such as send_otp_email_task, send over the
+    # worker's pooled connection. Anywhere else, e.g. dj_rest_auth's password
+    # reset in the web process, messages are queued for the email workers, so
+    # requests neither wait on SMTP nor fail while the circuit is open.
+
+    def send_messages(self, email_messages):
+        email_messages = list(email_messages)
+
+        if current_task or not email_messages:
+            return super().send_messages(email_messages)
+
+        # api.services imports this module
+        from .services import queue_emails
+
+        try:
+            queue_emails(email_messages)
+
+        except OperationalError as e:
+            logger.warning(f"Broker unavailable, sending emails inline. Exception({e})")
+            return super().send_messages(email_messages)
+
+        return len(email_messages)
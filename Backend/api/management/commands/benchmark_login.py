@@ -0,0 +1,138 @@
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import override_settings
+from django_otp.plugins.otp_email.models import EmailDevice
+from rest_framework.test import APIRequestFactory
+from Backend.celery import app
+from api.mail import close_smtp_connection
+from api.models import CustomUser
+from api.views import LoginView, VerifyOTPView
+
+
+PASSWORD = "benchmark-password"
+
+
+class Command(BaseCommand):
+    help = (
+        "Run full login and OTP verification cycles concurrently and report "
+        "logins per second. OTP emails are kept in memory and the synthetic "
+        "users are deleted afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--logins", type=int, default=200)
+        parser.add_argument("--concurrency", type=int, default=8)
+
+    def handle(self, *args, **options):
+        template = CustomUser.objects.first()
+
+        if template is None:
+            raise CommandError("Create at least one user before running the benchmark.")
+
+        # Throttles would cap the benchmark at a few logins a minute
+        self.login_view = LoginView.as_view(throttle_classes=[])
+        self.verify_view = VerifyOTPView.as_view(throttle_classes=[])
+        self.factory = APIRequestFactory()
+
+        prefix = f"benchmark-{uuid.uuid4().hex[:8]}"
+        # One user per worker, so concurrent logins do not replace each
+        # other's OTP
+        users = [
+            CustomUser.objects.create_user(
+                fullname=f"{prefix} {index}",
+                username=f"{prefix}-{index}",
+                password=PASSWORD,
+                email=f"{prefix}-{index}@example.com",
+                role=template.role,
+                grade=template.grade,
+                division=template.division,
+            )
+            for index in range(options["concurrency"])
+        ]
+
+        eager = app.conf.task_always_eager
+        app.conf.task_always_eager = True
+
+        try:
+            with override_settings(
+                EMAIL_DELIVERY_BACKEND="django.core.mail.backends.locmem.EmailBackend"
+            ):
+                self.run_benchmark(users, options)
+        finally:
+            app.conf.task_always_eager = eager
+            close_smtp_connection()
+            CustomUser.objects.filter(username__startswith=prefix).delete()
+
+    def run_benchmark(self, users, options):
+        per_user = max(options["logins"] // len(users), 1)
+
+        started = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=len(users)) as executor:
+            timings = sorted(
+                timing
+                for user_timings in executor.map(
+                    lambda user: self.run_worker(user, per_user), users
+                )
+                for timing in user_timings
+            )
+
+        elapsed = time.perf_counter() - started
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{len(timings)} logins in {elapsed:.1f}s: "
+                f"{len(timings) / elapsed:.1f} logins/s, "
+                f"median {timings[len(timings) // 2]:.1f}ms, "
+                f"p95 {timings[int(len(timings) * 0.95)]:.1f}ms"
+            )
+        )
+
+    def run_worker(self, user, logins):
+        timings = []
+
+        try:
+            for _ in range(logins):
+                # Lets the next login send a new OTP straight away
+                cache.delete(f"otp_email_sent:{user.id}")
+
+                started = time.perf_counter()
+                self.login(user)
+                timings.append((time.perf_counter() - started) * 1000)
+        finally:
+            connection.close()
+
+        return timings
+
+    def login(self, user):
+        response = self.login_view(
+            self.factory.post(
+                "/login/",
+                {
+                    "username": user.username,
+                    "password": PASSWORD,
+                    "selectedRole": user.role,
+                },
+                format="json",
+            )
+        )
+        temp_token = response.data["temp_token"]
+
+        otp_token = (
+            EmailDevice.objects.filter(user=user).values_list("token", flat=True).get()
+        )
+
+        response = self.verify_view(
+            self.factory.post(
+                "/verify-otp-token/",
+                {"tokens": {"temp_token": temp_token, "otp_token": otp_token}},
+                format="json",
+            )
+        )
+
+        if response.status_code != 200:
+            raise CommandError(f"Verification failed: {response.data}")
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from api.tokens import restore_token_blacklist
+
+
+class Command(BaseCommand):
+    help = "Copy unexpired blacklisted refresh tokens from the database into the cache"
+
+    def handle(self, *args, **options):
+        restored = restore_token_blacklist()
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Token blacklist: {restored} tokens restored")
+        )
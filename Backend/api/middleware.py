@@ -0,0 +1,20 @@
+class ThrottleHeadersMiddleware:
+    # Reports the tightest throttle budget the request was checked against
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+
+        budgets = getattr(request, "throttle_budgets", None)
+
+        if budgets:
+            budget = min(budgets, key=lambda budget: budget.remaining)
+
+            response["X-RateLimit-Scope"] = budget.scope
+            response["X-RateLimit-Limit"] = budget.num_requests
+            response["X-RateLimit-Remaining"] = budget.remaining
+            response["X-RateLimit-Reset"] = budget.reset
+
+        return response
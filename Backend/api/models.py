@@ -1,5 +1,6 @@
 from django.db import models
 from django.contrib.auth.models import AbstractUser, BaseUserManager
+from django.db.models.functions import Lower
 import logging
 from employees.models import Grades
 
@@ -103,6 +104,10 @@ class CustomUser(AbstractUser):
         related_name="updated_users",
     )
 
+    # Carried by the user's tokens and bumped to revoke them, see
+    # api.authentication
+    token_version = models.PositiveIntegerField(default=0, editable=False)
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -115,6 +120,14 @@ class CustomUser(AbstractUser):
         verbose_name = "user"
         verbose_name_plural = "users"
 
+        indexes = [
+            models.Index(Lower("username"), name="users_username_lower_idx"),
+            # Keyset pages of a division's users, see RetrieveAllUsersView
+            models.Index(
+                fields=["division", "username"], name="users_division_username_idx"
+            ),
+        ]
+
     def __str__(self):
         return f"{self.username}"
 
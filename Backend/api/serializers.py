@@ -1,8 +1,10 @@
 from rest_framework import serializers
 from .models import CustomUser
 from django.contrib.auth.models import Group
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
 import logging
 from . import models
+from .tokens import CachedRefreshToken
 
 
 logger = logging.getLogger(__name__)
@@ -127,6 +129,13 @@ class UserReadSerializer(serializers.ModelSerializer):
         )
 
 
+class UserCompactSerializer(serializers.ModelSerializer):
+
+    class Meta:
+        model = CustomUser
+        fields = ["id", "username", "role", "division"]
+
+
 # AN EXTRA USER READ SERIALIZER
 class LimitedFieldsUserReadSerializer(serializers.ModelSerializer):
     grade_name = serializers.CharField(source="grade.grade_name")
@@ -177,6 +186,10 @@ class LoginSerializer(serializers.Serializer):
     selectedRole = serializers.CharField()
 
 
+class CachedTokenRefreshSerializer(TokenRefreshSerializer):
+    token_class = CachedRefreshToken
+
+
 class LogoutSerializer(serializers.Serializer):
     refresh_token = serializers.CharField()
 
@@ -1,23 +1,73 @@
 from .utils.retry import network_retry, email_retry
+from .mail import EmailCircuitOpen, build_message, deliver, serialize_message
 from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count
+from django_redis import get_redis_connection
 import logging
 from celery import shared_task
 from django_otp.plugins.otp_email.models import EmailDevice
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+from rest_framework_simplejwt.utils import aware_utcnow, datetime_from_epoch
+from .models import CustomUser, Divisions
 
 
 logger = logging.getLogger(__name__)
 
+TEMP_TOKEN_TIMEOUT = 300
+OTP_DEVICE_CACHE_TIMEOUT = 60 * 60 * 24
+TOKEN_PURGE_BATCH_SIZE = 1000
+USER_COUNTS_PER_DIVISION_KEY = "users:counts_per_division"
+
+
+def get_otp_device_cache_key(user_id):
+    return f"otp_device:{user_id}"
+
 
 @network_retry()
-def cache_temp_token(temp_token, user_id):
+def get_otp_device_id(user):
+    # A user keeps one email device, so after the first login its id is
+    # served from the cache instead of get_or_create
+    key = get_otp_device_cache_key(user.id)
+    device_id = cache.get(key)
+
+    if device_id is None:
+        device, _ = EmailDevice.objects.get_or_create(user=user, name="default")
+        device_id = device.id
+        cache.set(key, device_id, timeout=OTP_DEVICE_CACHE_TIMEOUT)
+
+    return device_id
+
+
+def invalidate_otp_device(user_id):
+    cache.delete(get_otp_device_cache_key(user_id))
+
+
+@network_retry()
+def cache_temp_token(temp_token, user_id, device_id):
     logger.debug("Set Temporary token in cache.")
-    cache.set(temp_token, user_id, timeout=300)
+
+    # One hash holds the user and device, written in a single round-trip
+    key = cache.make_key(temp_token)
+    pipeline = get_redis_connection("default").pipeline()
+    pipeline.hset(key, mapping={"user_id": user_id, "device_id": device_id})
+    pipeline.expire(key, TEMP_TOKEN_TIMEOUT)
+    pipeline.execute()
 
 
 @network_retry()
 def get_temp_token(temp_token):
+    # {"user_id", "device_id"} or None once the token has expired
     logger.debug("Retrieving Temporary token from cache.")
-    return cache.get(temp_token)
+    session = get_redis_connection("default").hgetall(cache.make_key(temp_token))
+
+    if not session:
+        return None
+
+    return {field.decode(): int(value) for field, value in session.items()}
 
 
 @network_retry()
@@ -32,6 +82,12 @@ def send_otp_email(device):
     device.generate_challenge()
 
 
+@email_retry()
+def send_emails(messages):
+    return deliver(messages)
+
+
+# Routed to the email_otp queue, which workers poll ahead of email_bulk
 @shared_task(bind=True, max_retries=3, default_retry_delay=5)
 def send_otp_email_task(self, device_id):
     try:
@@ -44,5 +100,94 @@ def send_otp_email_task(self, device_id):
         logger.error(f"EmailDevice {device_id} does not exist.")
         return
 
+    except EmailCircuitOpen as e:
+        # Frees the worker until delivery resumes
+        raise self.retry(exc=e, countdown=e.retry_in)
+
+    except Exception as e:
+        raise self.retry(exc=e)
+
+
+# Notifications queued with queue_emails, routed to email_bulk
+@shared_task(bind=True, max_retries=5, default_retry_delay=30)
+def send_emails_task(self, messages):
+    try:
+        sent = send_emails([build_message(message) for message in messages])
+        logger.info(f"{sent} emails sent.")
+
+    except EmailCircuitOpen as e:
+        raise self.retry(exc=e, countdown=e.retry_in)
+
+    except Exception as e:
+        raise self.retry(exc=e)
+
+
+def queue_emails(messages):
+    # Sends EmailMessages from the email workers, behind any pending OTPs
+    send_emails_task.delay([serialize_message(message) for message in messages])
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=5)
+def record_token_task(self, jti, exp, user_id, created_at, blacklisted=False):
+    # Audit rows for api.tokens.CachedRefreshToken, written off the request
+    # path from the token's claims. The token column is left empty.
+    try:
+        token, _ = OutstandingToken.objects.get_or_create(
+            jti=jti,
+            defaults={
+                # The user may have been deleted since
+                "user": CustomUser.objects.filter(id=user_id).first(),
+                "token": "",
+                "created_at": datetime_from_epoch(created_at),
+                "expires_at": datetime_from_epoch(exp),
+            },
+        )
+
+        if blacklisted:
+            BlacklistedToken.objects.get_or_create(token=token)
+
     except Exception as e:
         raise self.retry(exc=e)
+
+
+@shared_task
+def purge_expired_tokens_task(batch_size=TOKEN_PURGE_BATCH_SIZE):
+    # Expired tokens can no longer be used, blacklisted or not. Deleting an
+    # outstanding token cascades to its blacklist entry.
+    purged = 0
+
+    while True:
+        ids = list(
+            OutstandingToken.objects.filter(expires_at__lte=aware_utcnow())
+            .order_by("id")
+            .values_list("id", flat=True)[:batch_size]
+        )
+        if not ids:
+            break
+
+        OutstandingToken.objects.filter(id__in=ids).delete()
+        purged += len(ids)
+
+    logger.info(f"{purged} expired tokens purged.")
+
+    return purged
+
+
+def get_user_counts_per_division():
+    # Invalidated by api.signals when users join, leave or change division
+    return cache.get_or_set(
+        USER_COUNTS_PER_DIVISION_KEY,
+        lambda: list(
+            Divisions.objects.annotate(total_users=Count("users"))
+            .order_by("division_name")
+            .values("id", "division_name", "total_users")
+        ),
+        timeout=None,
+    )
+
+
+def invalidate_user_counts_per_division():
+    cache.delete(USER_COUNTS_PER_DIVISION_KEY)
+
+    # Again once committed, in case a request cached the old counts meanwhile
+    transaction.on_commit(lambda: cache.delete(USER_COUNTS_PER_DIVISION_KEY))
@@ -1,27 +1,18 @@
 from django.dispatch import receiver
-from django.db.models.signals import post_delete, post_save
-from .models import CustomUser
-from channels.layers import get_channel_layer
-from asgiref.sync import async_to_sync
+from celery.signals import task_failure, task_prerun, task_retry, task_success
+from django.db.models.signals import post_delete, post_save, pre_save
+from .models import CustomUser, Divisions
 from employees import services
-
-
-def send_update(data):
-    channel_layer = get_channel_layer()
-
-    async_to_sync(channel_layer.group_send)(
-        "users",
-        {
-            "type": "send_dashboard_stats",
-            "event_type": "user_update",
-            "data": data,
-        },
-    )
+from realtime.broadcast import publish
+from .authentication import TOKEN_REVOKING_FIELDS, invalidate_cached_user
+from .task_registry import update_task
+from .services import invalidate_otp_device, invalidate_user_counts_per_division
+from django_otp.plugins.otp_email.models import EmailDevice
 
 
 def send_users_dashboard_update():
     data = services.get_users_per_role()
-    send_update(data)
+    publish("users", "user_update", data)
 
 
 @receiver(post_save, sender=CustomUser)
@@ -33,3 +24,91 @@ def handle_new_user_save(sender, instance, created, **kwargs):
 @receiver(post_delete, sender=CustomUser)
 def handle_user_delete(sender, instance, **kwargs):
     send_users_dashboard_update()
+
+
+@receiver(pre_save, sender=CustomUser)
+def track_previous_token_version(sender, instance, update_fields=None, **kwargs):
+    # Logins only save last_login
+    if not instance.pk or (
+        update_fields and not set(update_fields) & set(TOKEN_REVOKING_FIELDS)
+    ):
+        return
+
+    previous = (
+        sender.objects.filter(pk=instance.pk)
+        .values("token_version", *TOKEN_REVOKING_FIELDS)
+        .first()
+    )
+
+    if previous is None:
+        return
+
+    instance._previous_token_version = previous.pop("token_version")
+
+    # Role changes, deactivations and new passwords revoke every token the
+    # user holds. Covers DeactivateUserView, RestoreUserAccountView and
+    # RetrieveUpdateDestroyUserSerializer.
+    if any(
+        previous[field] != instance.serializable_value(field) for field in previous
+    ):
+        instance.token_version = instance._previous_token_version + 1
+
+
+@receiver([post_save, post_delete], sender=CustomUser)
+def handle_user_change(sender, instance, **kwargs):
+    previous_token_version = getattr(
+        instance, "_previous_token_version", instance.token_version
+    )
+
+    invalidate_cached_user(
+        instance.pk, previous_token_version, instance.token_version
+    )
+
+
+@receiver(post_delete, sender=EmailDevice)
+def handle_email_device_delete(sender, instance, **kwargs):
+    invalidate_otp_device(instance.user_id)
+
+
+@receiver([post_save, post_delete], sender=CustomUser)
+def handle_user_division_change(sender, instance, **kwargs):
+    update_fields = kwargs.get("update_fields")
+
+    # Logins only save last_login
+    if update_fields and "division" not in update_fields:
+        return
+
+    invalidate_user_counts_per_division()
+
+
+@receiver([post_save, post_delete], sender=Divisions)
+def handle_division_change(sender, instance, **kwargs):
+    invalidate_user_counts_per_division()
+
+
+# Task registry, see api.task_registry. Tasks not queued with dispatch_task
+# are ignored.
+@task_prerun.connect
+def handle_task_start(task_id, **kwargs):
+    update_task(task_id, status="STARTED")
+
+
+@task_retry.connect
+def handle_task_retry(request, **kwargs):
+    update_task(request.id, status="RETRY")
+
+
+@task_success.connect
+def handle_task_success(sender, result, **kwargs):
+    fields = {"status": "SUCCESS", "progress": 100}
+
+    # Export tasks return the URL of the file they wrote
+    if isinstance(result, str):
+        fields["result_url"] = result
+
+    update_task(sender.request.id, **fields)
+
+
+@task_failure.connect
+def handle_task_failure(task_id, **kwargs):
+    update_task(task_id, status="FAILURE")
@@ -0,0 +1,100 @@
+import logging
+import time
+from asgiref.sync import async_to_sync
+from celery import uuid
+from channels.layers import get_channel_layer
+from django.core.cache import cache
+from django_redis import get_redis_connection
+from realtime.groups import get_user_group
+
+logger = logging.getLogger(__name__)
+
+# Longer than any task runs, so finished tasks stay readable for a while
+TASK_REGISTRY_TIMEOUT = 60 * 60 * 24
+
+FINISHED_STATES = ["SUCCESS", "FAILURE", "REVOKED"]
+
+
+def get_task_key(task_id):
+    return cache.make_key(f"tasks:{task_id}")
+
+
+def get_task_group(task_id):
+    return f"task_{task_id}"
+
+
+def dispatch_task(task, args=None, task_type=None, owner_id=None):
+    # Registers the task before it is queued, so a worker that finishes
+    # first still finds its entry
+    task_id = uuid()
+
+    pipeline = get_redis_connection("default").pipeline()
+    pipeline.hset(
+        get_task_key(task_id),
+        mapping={
+            "id": task_id,
+            "type": task_type or task.name,
+            "owner": owner_id or "",
+            "status": "PENDING",
+            "progress": 0,
+            "result_url": "",
+            "updated_at": time.time(),
+        },
+    )
+    pipeline.expire(get_task_key(task_id), TASK_REGISTRY_TIMEOUT)
+    pipeline.execute()
+
+    return task.apply_async(args=args or [], task_id=task_id)
+
+
+def parse_task(data):
+    if not data:
+        return None
+
+    task = {field.decode(): value.decode() for field, value in data.items()}
+    task["progress"] = int(task["progress"])
+    task["updated_at"] = float(task["updated_at"])
+
+    return task
+
+
+def get_task(task_id, owner_id=None):
+    # None when the task is unknown or belongs to another user. Tasks
+    # without an owner, such as OTP emails sent before login, are readable
+    # by anyone holding their id.
+    task = parse_task(get_redis_connection("default").hgetall(get_task_key(task_id)))
+
+    if task is None or (task["owner"] and task["owner"] != str(owner_id)):
+        return None
+
+    return task
+
+
+def update_task(task_id, **fields):
+    key = get_task_key(task_id)
+    client = get_redis_connection("default")
+
+    # Only tasks queued with dispatch_task are tracked
+    if not client.exists(key):
+        return
+
+    fields["updated_at"] = time.time()
+    pipeline = client.pipeline()
+    pipeline.hset(key, mapping=fields)
+    pipeline.hgetall(key)
+    _, data = pipeline.execute()
+
+    send_task_update(parse_task(data))
+    logger.debug(f"Task({task_id}) {fields}.")
+
+
+def send_task_update(task):
+    channel_layer = get_channel_layer()
+    event = {"type": "task_status", "data": task}
+
+    async_to_sync(channel_layer.group_send)(get_task_group(task["id"]), event)
+
+    # Owners get their tasks' updates on every open socket without
+    # subscribing
+    if task["owner"]:
+        async_to_sync(channel_layer.group_send)(get_user_group(task["owner"]), event)
@@ -5,7 +5,62 @@ from django.urls import reverse
 from django.contrib.auth.models import Group
 from django.core import mail
 import re
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from django.test import SimpleTestCase
+from rest_framework.exceptions import Throttled
+from rest_framework.test import APIRequestFactory
+from rest_framework.request import Request
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework_simplejwt.tokens import RefreshToken
 from employees.models import Grades
+from employees.tests.base import BaseAPITestCase
+from django.core.cache import cache
+from .authentication import get_user_cache_key
+from django_otp.plugins.otp_email.models import EmailDevice
+from .services import (
+    cache_temp_token,
+    delete_temp_token,
+    get_otp_device_id,
+    get_temp_token,
+    invalidate_otp_device,
+    purge_expired_tokens_task,
+    record_token_task,
+    send_emails_task,
+    send_otp_email_task,
+    USER_COUNTS_PER_DIVISION_KEY,
+    get_user_counts_per_division,
+)
+from .tokens import (
+    CachedRefreshToken,
+    get_token_claims,
+    is_blacklisted,
+    restore_token_blacklist,
+)
+from .task_registry import dispatch_task, get_task
+from search_and_export.services import generate_employee_excel_report
+from datetime import timedelta
+from django.utils import timezone
+import socketserver
+import threading
+from django.core.mail import EmailMessage
+from django.test import override_settings
+from .mail import (
+    EMAIL_CIRCUIT_KEY,
+    EMAIL_CIRCUIT_THRESHOLD,
+    EMAIL_FAILURES_KEY,
+    EmailCircuitOpen,
+    close_smtp_connection,
+    deliver,
+    serialize_message,
+)
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+from .throttles import CustomAnonRateThrottle
 
 
 class CreateUserAPITest(APITestCase):
@@ -486,3 +541,558 @@ class LogoutViewAPITest(APITestCase):
 
         # Assertions
         self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+
+class LockoutRateThrottleTest(SimpleTestCase):
+
+    def setUp(self):
+        # A fresh address per test so earlier attempts do not count
+        self.address = f"10.{uuid.uuid4().int % 250}.{uuid.uuid4().int % 250}.1"
+        self.factory = APIRequestFactory()
+
+    def attempt(self):
+        request = Request(
+            self.factory.post("/api/users/login/", REMOTE_ADDR=self.address)
+        )
+
+        try:
+            return CustomAnonRateThrottle().allow_request(request, None)
+        except Throttled as exc:
+            return exc
+
+    def test_limit_holds_under_concurrency(self):
+        with ThreadPoolExecutor(max_workers=20) as executor:
+            results = list(executor.map(lambda _: self.attempt(), range(100)))
+
+        allowed = [result for result in results if result is True]
+        throttled = [result for result in results if isinstance(result, Throttled)]
+
+        # Assertions
+        self.assertEqual(len(allowed), 3)
+        self.assertEqual(len(throttled), 97)
+        self.assertTrue(all(0 < exc.wait <= 180 for exc in throttled))
+
+    def test_lockout_message(self):
+        for _ in range(3):
+            self.attempt()
+
+        exc = self.attempt()
+
+        # Assertions
+        self.assertIsInstance(exc, Throttled)
+        self.assertEqual(
+            exc.detail,
+            "You have exceeded the maximum attempts. Try again in 180 seconds.",
+        )
+
+
+class CachedJWTAuthenticationTest(BaseAPITestCase):
+
+    def setUp(self):
+        self.url = reverse("list-all-genders")
+
+        # The database is rolled back between tests but the cache is not
+        cache.delete(get_user_cache_key(self.admin.pk))
+
+        token = RefreshToken.for_user(self.admin).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def get_user_queries(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.url)
+
+        queries = [
+            query["sql"]
+            for query in context.captured_queries
+            if 'FROM "users"' in query["sql"]
+        ]
+
+        return response, queries
+
+    def test_user_is_cached(self):
+        # Send list requests
+        self.get_user_queries()
+        response, queries = self.get_user_queries()
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(queries, [])
+
+    def test_only_auth_fields_are_cached(self):
+        # Send list request
+        self.get_user_queries()
+
+        # Assertions
+        self.assertEqual(
+            set(cache.get(get_user_cache_key(self.admin.pk))),
+            {
+                "id",
+                "username",
+                "role",
+                "is_active",
+                "is_staff",
+                "is_superuser",
+                "division_id",
+                "token_version",
+            },
+        )
+
+    def test_role_change_revokes_tokens(self):
+        # Send list request
+        self.get_user_queries()
+
+        self.admin.role = "VIEWER"
+        self.admin.save()
+
+        # Send list request
+        response, _ = self.get_user_queries()
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(response.data["code"], "token_revoked")
+
+        token = CachedRefreshToken.for_user(self.admin).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+        # Send list request
+        response, _ = self.get_user_queries()
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_deactivation_invalidates_cached_user(self):
+        # Send list request
+        self.get_user_queries()
+
+        self.admin.is_active = False
+        self.admin.save()
+
+        # Send list request
+        response, queries = self.get_user_queries()
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(len(queries), 1)
+
+
+class OTPSessionTest(BaseAPITestCase):
+
+    def setUp(self):
+        self.verify_token_url = reverse("token-verification")
+        self.temp_token = f"otp_token:{uuid.uuid4()}"
+
+        # The database is rolled back between tests but the cache is not
+        invalidate_otp_device(self.admin.pk)
+
+    def test_device_id_is_cached(self):
+        device_id = get_otp_device_id(self.admin)
+
+        # Assertions
+        with self.assertNumQueries(0):
+            self.assertEqual(get_otp_device_id(self.admin), device_id)
+
+    def test_device_delete_invalidates_cache(self):
+        EmailDevice.objects.get(id=get_otp_device_id(self.admin)).delete()
+
+        # Assertions
+        self.assertTrue(EmailDevice.objects.filter(id=get_otp_device_id(self.admin)))
+
+    def test_temp_token_holds_user_and_device(self):
+        device_id = get_otp_device_id(self.admin)
+        cache_temp_token(self.temp_token, self.admin.id, device_id)
+
+        # Assertions
+        self.assertEqual(
+            get_temp_token(self.temp_token),
+            {"user_id": self.admin.id, "device_id": device_id},
+        )
+        delete_temp_token(self.temp_token)
+        self.assertIsNone(get_temp_token(self.temp_token))
+
+    def test_verify_otp(self):
+        device = EmailDevice.objects.get(id=get_otp_device_id(self.admin))
+        device.generate_token()
+        cache_temp_token(self.temp_token, self.admin.id, device.id)
+
+        # Send verify request
+        response = self.client.post(
+            self.verify_token_url,
+            {"tokens": {"temp_token": self.temp_token, "otp_token": device.token}},
+            format="json",
+        )
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["user_id"], self.admin.id)
+        self.assertIsNone(get_temp_token(self.temp_token))
+
+
+class TokenBlacklistTest(BaseAPITestCase):
+
+    def setUp(self):
+        self.logout_url = reverse("user-logout")
+        self.refresh_url = reverse("refresh-tokens")
+
+        self.refresh = CachedRefreshToken.for_user(self.admin)
+
+        self.authenticate_admin()
+
+    def get_blacklist_queries(self, data):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(self.refresh_url, data, format="json")
+
+        queries = [
+            query["sql"]
+            for query in context.captured_queries
+            if "token_blacklist" in query["sql"]
+        ]
+
+        return response, queries
+
+    def test_logout_blacklists_token(self):
+        # Send logout request
+        response = self.client.post(
+            self.logout_url, {"refresh_token": str(self.refresh)}, format="json"
+        )
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertTrue(is_blacklisted(self.refresh["jti"]))
+        with self.assertRaises(TokenError):
+            CachedRefreshToken(str(self.refresh))
+
+    def test_rotation_skips_blacklist_tables(self):
+        # Send refresh request
+        response, queries = self.get_blacklist_queries({"refresh": str(self.refresh)})
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(queries, [])
+
+        # Send refresh request with the rotated token
+        response, queries = self.get_blacklist_queries({"refresh": str(self.refresh)})
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(queries, [])
+
+    def test_record_token_without_token(self):
+        claims = get_token_claims(self.refresh)
+        record_token_task(**claims, blacklisted=True)
+        token = OutstandingToken.objects.get(jti=self.refresh["jti"])
+
+        # Assertions
+        self.assertNotIn(str(self.refresh), claims.values())
+        self.assertEqual(token.token, "")
+        self.assertEqual(token.user, self.admin)
+        self.assertEqual(token.expires_at.timestamp(), self.refresh["exp"])
+        self.assertTrue(BlacklistedToken.objects.filter(token=token).exists())
+
+    def test_restore_token_blacklist(self):
+        record_token_task(**get_token_claims(self.refresh), blacklisted=True)
+
+        # Assertions
+        self.assertFalse(is_blacklisted(self.refresh["jti"]))
+        self.assertEqual(restore_token_blacklist(), 1)
+        self.assertTrue(is_blacklisted(self.refresh["jti"]))
+
+    def test_purge_expired_tokens(self):
+        for _ in range(3):
+            record_token_task(
+                **get_token_claims(CachedRefreshToken.for_user(self.admin))
+            )
+        OutstandingToken.objects.update(expires_at=timezone.now() - timedelta(days=1))
+        record_token_task(**get_token_claims(self.refresh), blacklisted=True)
+
+        # Assertions
+        self.assertEqual(purge_expired_tokens_task(batch_size=2), 3)
+        self.assertEqual(OutstandingToken.objects.get().jti, self.refresh["jti"])
+        self.assertEqual(BlacklistedToken.objects.count(), 1)
+
+
+class LocalSMTPServer(socketserver.ThreadingTCPServer):
+    # Stand-in SMTP server for delivery tests. Records each connection and
+    # the raw data of every message it accepts.
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), LocalSMTPHandler)
+        self.connections = 0
+        self.messages = []
+
+    @property
+    def port(self):
+        return self.server_address[1]
+
+    def __enter__(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
+        self.server_close()
+
+
+class LocalSMTPHandler(socketserver.StreamRequestHandler):
+
+    def reply(self, line):
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self):
+        self.server.connections += 1
+        self.reply("220 localhost")
+
+        for line in self.rfile:
+            command = line.decode().strip().upper()
+
+            if command.startswith(("EHLO", "HELO")):
+                self.reply("250 localhost")
+            elif command == "DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                data = []
+                for data_line in self.rfile:
+                    if data_line.rstrip(b"\r\n") == b".":
+                        break
+                    data.append(data_line.decode())
+                self.server.messages.append("".join(data))
+                self.reply("250 OK")
+            elif command == "QUIT":
+                self.reply("221 Bye")
+                break
+            else:
+                self.reply("250 OK")
+
+
+@override_settings(
+    EMAIL_BACKEND="api.mail.QueuedEmailBackend",
+    EMAIL_DELIVERY_BACKEND="django.core.mail.backends.smtp.EmailBackend",
+    EMAIL_HOST="127.0.0.1",
+    EMAIL_USE_TLS=False,
+    EMAIL_HOST_USER="",
+    EMAIL_HOST_PASSWORD="",
+)
+class EmailDeliveryTest(BaseAPITestCase):
+
+    def setUp(self):
+        # Circuit state from earlier runs of the suite
+        cache.delete_many([EMAIL_CIRCUIT_KEY, EMAIL_FAILURES_KEY])
+        close_smtp_connection()
+        self.addCleanup(close_smtp_connection)
+
+        invalidate_otp_device(self.admin.pk)
+
+    def create_message(self, index=0):
+        return EmailMessage(f"Notice {index}", "Body", to=["admin@email.com"])
+
+    def test_connection_is_reused(self):
+        with LocalSMTPServer() as server, self.settings(EMAIL_PORT=server.port):
+            for index in range(3):
+                deliver([self.create_message(index)])
+
+        # Assertions
+        self.assertEqual(server.connections, 1)
+        self.assertEqual(len(server.messages), 3)
+
+    def test_otp_email(self):
+        device_id = get_otp_device_id(self.admin)
+
+        with LocalSMTPServer() as server, self.settings(EMAIL_PORT=server.port):
+            send_otp_email_task.apply(args=[device_id])
+
+        token = EmailDevice.objects.get(id=device_id).token
+
+        # Assertions
+        self.assertEqual(len(server.messages), 1)
+        self.assertIn(token, server.messages[0])
+
+    def test_queued_emails(self):
+        with LocalSMTPServer() as server, self.settings(EMAIL_PORT=server.port):
+            send_emails_task.apply(
+                args=[[serialize_message(self.create_message(i)) for i in range(3)]]
+            )
+
+        # Assertions
+        self.assertEqual(server.connections, 1)
+        self.assertEqual(len(server.messages), 3)
+
+    def test_password_reset_queued_while_circuit_open(self):
+        cache.set(EMAIL_CIRCUIT_KEY, True, timeout=30)
+
+        # Send password reset request
+        response = self.client.post(
+            reverse("rest_password_reset"), {"email": "admin@email.com"}
+        )
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_circuit_opens_after_failures(self):
+        # Nothing listens on the port of a closed server
+        with LocalSMTPServer() as server:
+            port = server.port
+
+        with self.settings(EMAIL_PORT=port):
+            for _ in range(EMAIL_CIRCUIT_THRESHOLD):
+                with self.assertRaises(ConnectionRefusedError):
+                    deliver([self.create_message()])
+
+            # Assertions
+            with self.assertRaises(EmailCircuitOpen):
+                deliver([self.create_message()])
+
+
+class UserDirectoryAPITest(BaseAPITestCase):
+
+    def setUp(self):
+        self.users_url = reverse("retrieve-all-users")
+        self.summary_url = reverse("users-per-division-summary")
+
+        self.other_division = Divisions.objects.create(division_name="DCE-HR")
+
+        for index in range(3):
+            CustomUser.objects.create_user(
+                fullname=f"User {index}",
+                username=f"user{index}",
+                password="lovesogreat",
+                email=f"user{index}@email.com",
+                role="VIEWER",
+                grade=self.grade,
+                division=self.other_division,
+            )
+
+        # Counts cached by earlier runs of the suite
+        cache.delete(USER_COUNTS_PER_DIVISION_KEY)
+
+        self.authenticate_admin()
+
+    def test_keyset_pages(self):
+        # Send list request
+        response = self.client.get(self.users_url, {"page_size": 2})
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [user["username"] for user in response.data["results"]],
+            ["Admin", "user0"],
+        )
+
+        # Send list request for the next page
+        response = self.client.get(response.data["next"])
+
+        # Assertions
+        self.assertEqual(
+            [user["username"] for user in response.data["results"]],
+            ["user1", "user2"],
+        )
+        self.assertIsNone(response.data["next"])
+
+    def test_compact_projection(self):
+        # Send list request
+        response = self.client.get(
+            self.users_url,
+            {"projection": "compact", "division": self.other_division.id},
+        )
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]), 3)
+        self.assertEqual(
+            set(response.data["results"][0]), {"id", "username", "role", "division"}
+        )
+
+    def test_division_summary_is_cached(self):
+        # Send summary request
+        response = self.client.get(self.summary_url)
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            {row["division_name"]: row["total_users"] for row in response.data},
+            {"DCE-HR": 3, "DCE-IT": 1},
+        )
+        with self.assertNumQueries(0):
+            get_user_counts_per_division()
+
+    def test_new_user_invalidates_summary(self):
+        get_user_counts_per_division()
+
+        CustomUser.objects.create_user(
+            fullname="User 3",
+            username="user3",
+            password="lovesogreat",
+            email="user3@email.com",
+            role="VIEWER",
+            grade=self.grade,
+            division=self.division,
+        )
+
+        # Send summary request
+        response = self.client.get(self.summary_url)
+
+        # Assertions
+        self.assertEqual(
+            {row["division_name"]: row["total_users"] for row in response.data},
+            {"DCE-HR": 3, "DCE-IT": 2},
+        )
+
+
+class TaskRegistryTest(BaseAPITestCase):
+
+    def setUp(self):
+        self.task = dispatch_task(
+            generate_employee_excel_report,
+            [[]],
+            task_type="employee_export",
+            owner_id=self.admin.id,
+        )
+        self.task_status_url = f"/api/task-status/{self.task.id}/"
+
+    def test_task_is_registered(self):
+        task = get_task(self.task.id, self.admin.id)
+
+        # Assertions
+        self.assertEqual(task["status"], "PENDING")
+        self.assertEqual(task["type"], "employee_export")
+        self.assertIsNone(get_task(self.task.id))
+
+    def test_status_is_scoped_to_owner(self):
+        # Send status request
+        response = self.client.get(self.task_status_url)
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        self.authenticate_admin()
+
+        # Send status request
+        response = self.client.get(self.task_status_url)
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {"status": "PENDING", "progress": 0})
+
+    def test_export_status(self):
+        self.authenticate_admin()
+
+        # Send export status request
+        response = self.client.get(
+            reverse("export-status", kwargs={"task_id": self.task.id})
+        )
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["status"], "PENDING")
+
+    def test_worker_updates_registry(self):
+        task = dispatch_task(send_otp_email_task, [0], task_type="otp_email")
+
+        # Runs the task as a worker would pick it up
+        send_otp_email_task.apply(args=[0], task_id=task.id)
+
+        # Send status request
+        response = self.client.get(f"/api/task-status/{task.id}/")
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {"status": "SUCCESS", "progress": 100})
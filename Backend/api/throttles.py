@@ -1,15 +1,92 @@
-from rest_framework.throttling import AnonRateThrottle, UserRateThrottle
+from rest_framework.throttling import (
+    AnonRateThrottle,
+    SimpleRateThrottle,
+    UserRateThrottle,
+)
 from rest_framework.exceptions import Throttled
+from django_redis import get_redis_connection
+import math
 import time
+import uuid
 import logging
 
 
 logger = logging.getLogger(__name__)
 
 
-class CustomAnonRateThrottle(AnonRateThrottle):
-    scope = "custom_anon"
-    rate = "3/minute"
+# Sliding window of attempts in a sorted set, checked and updated in one
+# round-trip. Returns 0 when the attempt is allowed, otherwise the remaining
+# lockout in milliseconds.
+#
+# KEYS[1] attempts, KEYS[2] lockout
+# ARGV[1] now (ms), ARGV[2] window (ms), ARGV[3] limit, ARGV[4] lockout (ms),
+# ARGV[5] unique attempt id
+LOCKOUT_SCRIPT = """
+local locked = redis.call('PTTL', KEYS[2])
+if locked > 0 then
+    return locked
+end
+
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - window)
+
+if redis.call('ZCARD', KEYS[1]) >= tonumber(ARGV[3]) then
+    redis.call('SET', KEYS[2], 1, 'PX', ARGV[4])
+    redis.call('DEL', KEYS[1])
+    return tonumber(ARGV[4])
+end
+
+redis.call('ZADD', KEYS[1], now, ARGV[5])
+redis.call('PEXPIRE', KEYS[1], window)
+return 0
+"""
+
+
+# Sliding window budget. Returns {allowed, remaining, reset (ms)}.
+#
+# KEYS[1] requests
+# ARGV[1] now (ms), ARGV[2] window (ms), ARGV[3] limit, ARGV[4] unique id
+BUDGET_SCRIPT = """
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - window)
+
+local count = redis.call('ZCARD', KEYS[1])
+local oldest = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+local reset = window
+if oldest[2] then
+    reset = tonumber(oldest[2]) + window - now
+end
+
+if count >= limit then
+    return {0, 0, reset}
+end
+
+redis.call('ZADD', KEYS[1], now, ARGV[4])
+redis.call('PEXPIRE', KEYS[1], window)
+return {1, limit - count - 1, reset}
+"""
+
+_scripts = {}
+
+
+def run_script(source, keys, args, alias="default"):
+    # Scripts are sent once and then run by hash (EVALSHA)
+    client = get_redis_connection(alias)
+
+    if source not in _scripts:
+        _scripts[source] = client.register_script(source)
+
+    return _scripts[source](keys=keys, args=args, client=client)
+
+
+class LockoutRateThrottle(SimpleRateThrottle):
+    # Allows `rate` attempts per sliding window, then locks the key out for
+    # lockout_duration seconds. The limit comes from DEFAULT_THROTTLE_RATES
+    # for the scope.
+    lockout_duration = 180
 
     def allow_request(self, request, view):
         self.key = self.get_cache_key(request, view)
@@ -18,90 +95,94 @@ class CustomAnonRateThrottle(AnonRateThrottle):
             logger.debug("Cache key is 'None'.")
             return True
 
-        data = self.cache.get(self.key, {"attempts": [], "locked_until": 0})
-        logger.debug(f"Data({data}).")
-        now = time.time()
-
-        if data.get("locked_until", 0) > now:
-            wait = int(data["locked_until"] - now)
-            self.wait = wait
-            logger.debug(f"Locked until({self.wait}).")
-            raise Throttled(
-                detail=f"You have exceeded the maximum attempts. Try again in {self.wait} seconds.",
-            )
-
-        attempts = [t for t in data["attempts"] if t > now - 60]
-        logger.debug(f"Attempts({attempts}).")
-
-        if len(attempts) >= 3:
-            logger.debug("Attempts greater than 3.")
-            lockout_until = now + 180
-            self.cache.set(
-                self.key, {"attempts": attempts, "locked_until": lockout_until}, 180
-            )
-            self.wait = 180
+        key = self.cache.make_key(self.key)
+
+        locked_for = run_script(
+            LOCKOUT_SCRIPT,
+            keys=[f"{key}:attempts", f"{key}:lockout"],
+            args=[
+                int(time.time() * 1000),
+                self.duration * 1000,
+                self.num_requests,
+                self.lockout_duration * 1000,
+                uuid.uuid4().hex,
+            ],
+        )
+
+        if locked_for:
+            self.wait = math.ceil(locked_for / 1000)
             logger.debug(f"Locked out until({self.wait}).")
-            raise Throttled(
+            exc = Throttled(
                 detail=f"You have exceeded the maximum attempts. Try again in {self.wait} seconds.",
             )
+            # Set after construction so the detail keeps its wording; the
+            # exception handler turns it into a Retry-After header
+            exc.wait = self.wait
+            raise exc
 
-        attempts.append(now)
-        logger.debug(f"Attempts({attempts}).")
-        self.cache.set(self.key, {"attempts": attempts, "locked_until": 0}, 180)
         return True
 
 
-class CustomUserRateThrottle(UserRateThrottle):
-    scope = "custom_user"
-    rate = "6/minute"
+class BudgetRateThrottle(UserRateThrottle):
+    # Per user budget named by `scope` (read, search, write, bulk, export),
+    # sized in DEFAULT_THROTTLE_RATES. Each budget has its own counter so
+    # reads cannot use up the budget for writes.
 
     def allow_request(self, request, view):
         self.key = self.get_cache_key(request, view)
-        logger.debug(f"Cache key({self.key}).")
         if self.key is None:
-            logger.debug("Cache key is 'None'.")
             return True
 
-        data = self.cache.get(self.key, {"attempts": [], "locked_until": 0})
-        logger.debug(f"Data({data}).")
-        now = time.time()
+        allowed, remaining, reset = run_script(
+            BUDGET_SCRIPT,
+            keys=[self.cache.make_key(self.key)],
+            args=[
+                int(time.time() * 1000),
+                self.duration * 1000,
+                self.num_requests,
+                uuid.uuid4().hex,
+            ],
+        )
+        self.remaining = remaining
+        self.reset = math.ceil(reset / 1000)
 
-        if data.get("locked_until", 0) > now:
-            wait = int(data["locked_until"] - now)
-            self.wait = wait
-            logger.debug(f"Locked until({self.wait}).")
-            raise Throttled(
-                detail=f"You have exceeded the maximum attempts. Try again in {self.wait} seconds.",
-            )
+        # Read by api.middleware.ThrottleHeadersMiddleware
+        budgets = getattr(request._request, "throttle_budgets", [])
+        budgets.append(self)
+        request._request.throttle_budgets = budgets
 
-        attempts = [t for t in data["attempts"] if t > now - 60]
-        logger.debug(f"Attempts({attempts}).")
+        if not allowed:
+            logger.debug(f"Budget({self.scope}) exhausted for {self.key}.")
 
-        if len(attempts) >= 3:
-            logger.debug("Attempts greater than 3.")
-            lockout_until = now + 180
-            self.cache.set(
-                self.key, {"attempts": attempts, "locked_until": lockout_until}, 180
-            )
-            self.wait = 180
-            logger.debug(f"Locked out until({self.wait}).")
-            raise Throttled(
-                detail=f"You have exceeded the maximum attempts. Try again in {self.wait} seconds.",
-            )
+        return bool(allowed)
 
-        attempts.append(now)
-        logger.debug(f"Attempts({attempts}).")
-        self.cache.set(self.key, {"attempts": attempts, "locked_until": 0}, 180)
-        return True
+    def wait(self):
+        return self.reset
+
+
+class ReadThrottle(BudgetRateThrottle):
+    scope = "read"
+
+
+class SearchThrottle(BudgetRateThrottle):
+    scope = "search"
+
+
+class WriteThrottle(BudgetRateThrottle):
+    scope = "write"
 
 
-# class FixedLockoutUserThrottle(UserRateThrottle):
-#     rate = "12/minute"
-#     lockout_period = 60  # seconds to wait after exceeding
+class BulkThrottle(BudgetRateThrottle):
+    scope = "bulk"
 
-#     def allow_request(self, request, view):
-#         allowed = super().allow_request(request, view)
-#         if not allowed:
-#             self.wait = self.lockout_period
-#             raise Throttled(detail=f"Rate limit exceeded. Try again in {self.lockout_period} seconds.")
-#         return True
+
+class ExportThrottle(BudgetRateThrottle):
+    scope = "export"
+
+
+class CustomAnonRateThrottle(LockoutRateThrottle, AnonRateThrottle):
+    scope = "custom_anon"
+
+
+class CustomUserRateThrottle(LockoutRateThrottle, UserRateThrottle):
+    scope = "custom_user"
@@ -0,0 +1,105 @@
+import logging
+import time
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from django_redis.exceptions import ConnectionInterrupted
+from kombu.exceptions import OperationalError
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+from rest_framework_simplejwt.tokens import BlacklistMixin, RefreshToken
+from rest_framework_simplejwt.utils import aware_utcnow
+from . import network_exceptions
+from .authentication import TOKEN_VERSION_CLAIM
+from .services import record_token_task
+
+logger = logging.getLogger(__name__)
+
+
+def get_blacklist_key(jti):
+    return f"auth:blacklist:{jti}"
+
+
+def blacklist_jti(jti, exp):
+    # Kept until the token expires; an expired token is rejected anyway
+    timeout = max(int(exp - time.time()), 1)
+    cache.set(get_blacklist_key(jti), True, timeout=timeout)
+
+
+def is_blacklisted(jti):
+    return cache.get(get_blacklist_key(jti)) is not None
+
+
+def get_token_claims(token):
+    # What the audit rows need. The token itself is never queued, it would sit
+    # in the broker and result backend in plain text.
+    return {
+        "jti": token[api_settings.JTI_CLAIM],
+        "exp": token["exp"],
+        "user_id": token.get(api_settings.USER_ID_CLAIM),
+        "created_at": token.current_time.timestamp(),
+    }
+
+
+def record_token(token, blacklisted=False):
+    claims = get_token_claims(token)
+
+    try:
+        record_token_task.delay(**claims, blacklisted=blacklisted)
+
+    except OperationalError as e:
+        logger.warning(f"Broker unavailable, recording token inline. Exception({e})")
+        record_token_task(**claims, blacklisted=blacklisted)
+
+
+def restore_token_blacklist():
+    # Copies unexpired blacklist entries from the audit tables into the cache,
+    # e.g. after the cache was flushed
+    restored = 0
+
+    for jti, expires_at in (
+        BlacklistedToken.objects.filter(token__expires_at__gt=aware_utcnow())
+        .values_list("token__jti", "token__expires_at")
+        .iterator()
+    ):
+        blacklist_jti(jti, expires_at.timestamp())
+        restored += 1
+
+    return restored
+
+
+class CachedRefreshToken(RefreshToken):
+    # Refresh token whose blacklist lives in the cache, with one key per
+    # blacklisted jti that expires with the token. OutstandingToken and
+    # BlacklistedToken rows are still written, by a task, for audit only.
+
+    def check_blacklist(self):
+        jti = self.payload[api_settings.JTI_CLAIM]
+
+        try:
+            blacklisted = is_blacklisted(jti)
+
+        except (ConnectionInterrupted, *network_exceptions.REDIS_ERRORS) as e:
+            logger.warning(f"Cache unavailable, checking blacklist table. ({e})")
+            return super().check_blacklist()
+
+        if blacklisted:
+            raise TokenError(_("Token is blacklisted"))
+
+    def blacklist(self):
+        blacklist_jti(self.payload[api_settings.JTI_CLAIM], self.payload["exp"])
+        record_token(self, blacklisted=True)
+
+    def outstand(self):
+        record_token(self)
+
+    @classmethod
+    def for_user(cls, user):
+        # Skips BlacklistMixin.for_user, which inserts the outstanding token
+        # on the request path
+        token = super(BlacklistMixin, cls).for_user(user)
+        # Copied into the access tokens made from it
+        token[TOKEN_VERSION_CLAIM] = user.token_version
+        record_token(token)
+
+        return token
@@ -84,6 +84,11 @@ urlpatterns = [
         views.ListUsersPerDivision.as_view(),
         name="list-users-per-division",
     ),
+    path(
+        "divisions/users/summary/",
+        views.UsersPerDivisionSummaryAPIView.as_view(),
+        name="users-per-division-summary",
+    ),
     path(
         "divisions/<int:pk>/detail/",
         views.RetrieveDivisionAPIView.as_view(),
@@ -1,5 +1,5 @@
 from rest_framework.views import APIView
-from rest_framework import generics
+from rest_framework import generics, pagination
 from . import serializers
 from .models import CustomUser
 from rest_framework.response import Response
@@ -8,13 +8,13 @@ from django.contrib.auth import authenticate
 from django_otp.plugins.otp_email.models import EmailDevice
 from django.core.cache import cache
 import uuid
-from rest_framework_simplejwt.tokens import RefreshToken
+from .tokens import CachedRefreshToken
 from rest_framework_simplejwt.exceptions import TokenError
 from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticated
 from django.views.generic.base import RedirectView
 from django.conf import settings
 from . import network_exceptions
-from .throttles import CustomAnonRateThrottle, CustomUserRateThrottle, UserRateThrottle
+from .throttles import CustomAnonRateThrottle, CustomUserRateThrottle, WriteThrottle
 import logging
 from . import models
 from activity_feeds.models import ActivityFeeds
@@ -25,9 +25,14 @@ from .services import (
     send_otp_email_task,
     get_temp_token,
     delete_temp_token,
+    get_otp_device_id,
+    invalidate_otp_device,
+    get_user_counts_per_division,
 )
 from django.db import transaction
+from django.db.models import Prefetch
 from celery.result import AsyncResult
+from .task_registry import FINISHED_STATES, dispatch_task, get_task, update_task
 
 logger = logging.getLogger(__name__)
 
@@ -36,7 +41,7 @@ logger = logging.getLogger(__name__)
 class CreateUserView(generics.CreateAPIView):
     serializer_class = serializers.RetrieveCreateUserSerializer
     queryset = CustomUser.objects.all()
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
     permission_classes = [IsAuthenticated, IsAdminUser]
 
     def create(self, request, *args, **kwargs):
@@ -86,20 +91,53 @@ class RetrieveUserRoleView(APIView):
         return Response({"role": role}, status=status.HTTP_200_OK)
 
 
+class UserDirectoryPagination(pagination.CursorPagination):
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 200
+    # Matches the unique username and (division, username) indexes
+    ordering = ("username",)
+
+
 class RetrieveAllUsersView(generics.ListAPIView):
-    serializer_class = serializers.UserReadSerializer
-    queryset = CustomUser.objects.select_related(
-        "created_by", "updated_by", "grade", "division"
-    )
     throttle_classes = []
     permission_classes = [IsAuthenticated]
+    pagination_class = UserDirectoryPagination
+
+    def is_compact(self):
+        return self.request.query_params.get("projection") == "compact"
+
+    def get_serializer_class(self):
+        if self.is_compact():
+            return serializers.UserCompactSerializer
+
+        return serializers.UserReadSerializer
+
+    def get_queryset(self):
+        division = self.request.query_params.get("division")
+        role = self.request.query_params.get("role")
+
+        if self.is_compact():
+            qs = CustomUser.objects.only("id", "username", "role", "division_id")
+        else:
+            qs = CustomUser.objects.select_related(
+                "created_by", "updated_by", "grade", "division"
+            )
+
+        if division:
+            qs = qs.filter(division=division)
+
+        if role:
+            qs = qs.filter(role=role.upper())
+
+        return qs
 
 
 class UpdateUserView(generics.UpdateAPIView):
     serializer_class = serializers.RetrieveUpdateDestroyUserSerializer
     queryset = CustomUser.objects.all()
     lookup_field = "pk"
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
     permission_classes = [IsAuthenticated, IsAdminUser]
 
     def update(self, request, *args, **kwargs):
@@ -132,7 +170,7 @@ class DeactivateUserView(generics.DestroyAPIView):
     serializer_class = serializers.RetrieveUpdateDestroyUserSerializer
     queryset = CustomUser.objects.all()
     lookup_field = "pk"
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
     permission_classes = [IsAuthenticated, IsAdminUser]
 
     def delete(self, request, *args, **kwargs):
@@ -159,7 +197,7 @@ class RestoreUserAccountView(generics.UpdateAPIView):
     serializer_class = serializers.RetrieveUpdateDestroyUserSerializer
     queryset = CustomUser.objects.all()
     lookup_field = "pk"
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
     permission_classes = [IsAuthenticated, IsAdminUser]
 
     def update(self, request, *args, **kwargs):
@@ -184,7 +222,7 @@ class DeleteUserView(generics.DestroyAPIView):
     serializer_class = serializers.RetrieveUpdateDestroyUserSerializer
     queryset = CustomUser.objects.all()
     lookup_field = "pk"
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
     permission_classes = [IsAuthenticated, IsAdminUser]
 
     def perform_destroy(self, instance):
@@ -207,7 +245,7 @@ class CreateDivisionAPIView(generics.CreateAPIView):
     queryset = models.Divisions.objects.all()
     serializer_class = serializers.DivisionSerializer
     permission_classes = [IsAuthenticated, IsAdminUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def perform_create(self, serializer):
         with transaction.atomic():
@@ -244,7 +282,19 @@ class ListUsersPerDivision(APIView):
     throttle_classes = []
 
     def get(self, request, *args, **kwargs):
-        users_per_division = models.Divisions.objects.prefetch_related("users")
+        users_per_division = models.Divisions.objects.prefetch_related(
+            Prefetch(
+                "users",
+                queryset=CustomUser.objects.select_related("grade").only(
+                    "id",
+                    "fullname",
+                    "username",
+                    "role",
+                    "division_id",
+                    "grade__grade_name",
+                ),
+            )
+        )
         serializer = serializers.ListUsersPerDivisionSerializer(
             users_per_division, many=True
         )
@@ -252,12 +302,21 @@ class ListUsersPerDivision(APIView):
         return Response(serializer.data, status=status.HTTP_200_OK)
 
 
+class UsersPerDivisionSummaryAPIView(APIView):
+    http_method_names = ["get"]
+    permission_classes = [IsAuthenticated]
+    throttle_classes = []
+
+    def get(self, request, *args, **kwargs):
+        return Response(get_user_counts_per_division(), status=status.HTTP_200_OK)
+
+
 class EditDivisionAPIView(generics.UpdateAPIView):
     queryset = models.Divisions.objects.all()
     lookup_field = "pk"
     serializer_class = serializers.DivisionSerializer
     permission_classes = [IsAuthenticated, IsAdminUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def perform_update(self, serializer):
         with transaction.atomic():
@@ -284,7 +343,7 @@ class DeleteDivisionAPIView(generics.DestroyAPIView):
     lookup_field = "pk"
     serializer_class = serializers.DivisionSerializer
     permission_classes = [IsAuthenticated, IsAdminUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def perform_destroy(self, instance):
         with transaction.atomic():
@@ -336,7 +395,9 @@ class LoginView(APIView):
             )
 
         otp_cache_key = f"otp_email_sent:{user.id}"
-        if cache.get(otp_cache_key):
+        # Checks and sets the flag in one step, so concurrent logins send a
+        # single OTP
+        if not cache.add(otp_cache_key, True, timeout=60):
 
             logger.debug(f"OTP already sent to your email.")
 
@@ -346,23 +407,20 @@ class LoginView(APIView):
 
         logger.debug(f"Temporary token has been created for user({user}).")
 
-        device = None
-
         try:
-            cache_temp_token(temp_token, user.id)
+            device_id = get_otp_device_id(user)
+            cache_temp_token(temp_token, user.id, device_id)
 
             logger.info(f"OTP will be dully sent to user's({user}'s) email.")
 
-            device, _ = EmailDevice.objects.get_or_create(user=user, name="default")
-            task = send_otp_email_task.delay(device.id)
-
-            cache.set(otp_cache_key, True, timeout=60)
+            task = dispatch_task(
+                send_otp_email_task, [device_id], task_type="otp_email"
+            )
 
         except Exception as e:
             logger.exception(f"Temporary server error: {e}")
 
-            if device:
-                device.delete()
+            cache.delete(otp_cache_key)
 
             return Response(
                 {"detail": "Temporary server issue - Please try again shortly"},
@@ -402,9 +460,9 @@ class VerifyOTPView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        user_id = get_temp_token(temp_token)
+        session = get_temp_token(temp_token)
 
-        if user_id is None:
+        if session is None:
             logger.warning(
                 "Token expired or invalid. Please start the login process again."
             )
@@ -414,11 +472,20 @@ class VerifyOTPView(APIView):
                 },
                 status=status.HTTP_400_BAD_REQUEST,
             )
-        user = CustomUser.objects.get(id=user_id)
-        device = EmailDevice.objects.filter(user=user, name="default").first()
+        # The device and its user in one query
+        device = (
+            EmailDevice.objects.select_related("user")
+            .filter(id=session["device_id"], user_id=session["user_id"])
+            .first()
+        )
+
+        if device is None:
+            # Deleted since it was cached; the next login creates a new one
+            invalidate_otp_device(session["user_id"])
 
         if device and device.verify_token(otp_token):
-            refresh = RefreshToken.for_user(user)
+            user = device.user
+            refresh = CachedRefreshToken.for_user(user)
 
             delete_temp_token(temp_token)
             logger.info(
@@ -456,9 +523,9 @@ class ResendOTPView(APIView):
 
         tokens = serializer.validated_data.get("tokens", None)
         temp_token = tokens.get("temp_token", None)
-        user_id = get_temp_token(temp_token)
+        session = get_temp_token(temp_token)
 
-        if user_id is None:
+        if session is None:
             logger.warning(
                 "Your session has expired. Please start the login process again."
             )
@@ -469,34 +536,29 @@ class ResendOTPView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+        user_id, device_id = session["user_id"], session["device_id"]
+
         otp_cache_key = f"otp_email_sent:{user_id}"
-        if cache.get(otp_cache_key):
+        if not cache.add(otp_cache_key, True, timeout=60):
 
             logger.debug(f"OTP already sent to your email.")
 
             return Response({"detail": "OTP already sent"}, status=status.HTTP_200_OK)
 
-        user = CustomUser.objects.get(id=user_id)
-        device = EmailDevice.objects.filter(user=user, name="default").first()
-
-        if device:
-            device.delete()
-
         try:
-            cache_temp_token(temp_token, user_id)
-
-            logger.info(f"OTP will be dully sent to user's({user}'s) email.")
+            cache_temp_token(temp_token, user_id, device_id)
 
-            device, _ = EmailDevice.objects.get_or_create(user=user, name="default")
-            task = send_otp_email_task.delay(device.id)
+            logger.info(f"OTP will be dully sent to user's({user_id}'s) email.")
 
-            cache.set(otp_cache_key, True, timeout=60)
+            # A new challenge replaces the device's previous OTP
+            task = dispatch_task(
+                send_otp_email_task, [device_id], task_type="otp_email"
+            )
 
         except Exception as e:
             logger.exception(f"Temporary server error: {e}")
 
-            if device:
-                device.delete()
+            cache.delete(otp_cache_key)
 
             return Response(
                 {"detail": "Temporary server issue - Please try again shortly"},
@@ -548,7 +610,7 @@ class LogoutView(APIView):
 
         try:
 
-            token = RefreshToken(refresh_token)
+            token = CachedRefreshToken(refresh_token)
             token.blacklist()
 
             logger.info("You have been successfully logged out.")
@@ -581,10 +643,16 @@ class TaskStatusView(APIView):
     throttle_classes = []
 
     def get(self, request, task_id):
-        result = AsyncResult(task_id)
-        print("RESULT STATUS -> ", result.status)
+        # Clients can subscribe to the task_<id> group on the dashboard
+        # socket instead of polling
+        task = get_task(task_id, request.user.id)
+
+        if task is None:
+            return Response(
+                {"detail": "Task not found"}, status=status.HTTP_404_NOT_FOUND
+            )
 
-        return Response({"status": result.status})
+        return Response({"status": task["status"], "progress": task["progress"]})
 
 
 class RevokeTaskView(APIView):
@@ -592,11 +660,16 @@ class RevokeTaskView(APIView):
     throttle_classes = []
 
     def delete(self, request, task_id):
-        task = AsyncResult(task_id)
+        task = get_task(task_id, request.user.id)
+
+        if task is None:
+            return Response(
+                {"detail": "Task not found"}, status=status.HTTP_404_NOT_FOUND
+            )
 
         logger.debug(f"Revoking OTP task {task_id}")
 
-        if task.state in ["SUCCESS", "FAILURE"]:
+        if task["status"] in FINISHED_STATES:
             logger.debug(f"Task already completed.")
 
             return Response(
@@ -604,7 +677,8 @@ class RevokeTaskView(APIView):
                 status=status.HTTP_200_OK,
             )
 
-        task.revoke(terminate=True)
+        AsyncResult(task_id).revoke(terminate=True)
+        update_task(task_id, status="REVOKED")
         logger.debug(f"Task revoked successfully")
 
         return Response(
@@ -2,7 +2,7 @@ from rest_framework import generics
 import logging
 from . import serializers
 from .models import Children, InCompleteChildRecords
-from rest_framework.throttling import UserRateThrottle
+from api.throttles import WriteThrottle
 from rest_framework.permissions import IsAuthenticated
 from employees.permissions import IsAdminUserOrStandardUser
 from activity_feeds.models import ActivityFeeds
@@ -10,7 +10,7 @@ from django.shortcuts import get_object_or_404
 from employees.models import Employee
 from .utils import child_record_changes, incomplete_child_record_changes
 from flags.services import create_flag, delete_flag
-from employees.views import LargeResultsSetPagination
+from employees.views import EmployeeResponseCacheMixin, LargeResultsSetPagination
 from rest_framework import status
 from rest_framework.response import Response
 from django.db import transaction
@@ -21,7 +21,7 @@ logger = logging.getLogger(__name__)
 class CreateChildRecordAPIView(generics.CreateAPIView):
     serializer_class = serializers.ChildrenWriteSerializer
     queryset = Children.objects.all()
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
 
     def create(self, request, *args, **kwargs):
@@ -54,7 +54,7 @@ class EditChildRecordAPIView(generics.UpdateAPIView):
     queryset = Children.objects.all()
     serializer_class = serializers.ChildrenWriteSerializer
     lookup_field = "pk"
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
 
     def update(self, request, *args, **kwargs):
@@ -89,7 +89,8 @@ class EditChildRecordAPIView(generics.UpdateAPIView):
                 )
 
 
-class ListEmployeeChildrenAPIView(generics.ListAPIView):
+class ListEmployeeChildrenAPIView(EmployeeResponseCacheMixin, generics.ListAPIView):
+    cache_resource = "children"
     serializer_class = serializers.ChildrenReadSerializer
     throttle_classes = []
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
@@ -115,7 +116,7 @@ class DeleteChildRecordAPIView(generics.DestroyAPIView):
     queryset = Children.objects.all()
     serializer_class = serializers.ChildrenWriteSerializer
     lookup_field = "pk"
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
 
     def perform_destroy(self, instance):
@@ -137,7 +138,7 @@ class CreateInCompleteChildRecordsAPIView(generics.CreateAPIView):
     queryset = InCompleteChildRecords.objects.all()
     serializer_class = serializers.InCompleteChildRecordsWriteSerializer
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
@@ -188,7 +189,10 @@ class ListInCompleteChildRecordsAPIView(generics.ListAPIView):
     pagination_class = LargeResultsSetPagination
 
 
-class ListEmployeeInCompleteChildRecordsAPIView(generics.ListAPIView):
+class ListEmployeeInCompleteChildRecordsAPIView(
+    EmployeeResponseCacheMixin, generics.ListAPIView
+):
+    cache_resource = "incomplete_children"
     serializer_class = serializers.InCompleteChildRecordsReadSerializer
     throttle_classes = []
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
@@ -207,7 +211,7 @@ class EditInCompleteChildRecordsAPIView(generics.UpdateAPIView):
     lookup_field = "pk"
     serializer_class = serializers.InCompleteChildRecordsWriteSerializer
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def update(self, request, *args, **kwargs):
         partial = kwargs.pop("partial", False)
@@ -245,7 +249,7 @@ class DeleteInCompleteChildRecordsAPIView(generics.DestroyAPIView):
     lookup_field = "pk"
     serializer_class = serializers.InCompleteChildRecordsWriteSerializer
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def perform_destroy(self, instance):
         with transaction.atomic():
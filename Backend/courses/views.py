@@ -2,7 +2,7 @@ from rest_framework import generics
 import logging
 from . import serializers
 from .models import Courses, IncompleteCourseRecords
-from rest_framework.throttling import UserRateThrottle
+from api.throttles import WriteThrottle
 from rest_framework.permissions import IsAuthenticated
 from employees.permissions import IsAdminUserOrStandardUser
 from activity_feeds.models import ActivityFeeds
@@ -12,7 +12,7 @@ from .utils import course_record_changes, incomplete_course_changes
 from rest_framework.response import Response
 from rest_framework import status
 from flags.services import create_flag, delete_flag
-from employees.views import LargeResultsSetPagination
+from employees.views import EmployeeResponseCacheMixin, LargeResultsSetPagination
 from django.db import transaction
 
 logger = logging.getLogger(__name__)
@@ -21,7 +21,7 @@ logger = logging.getLogger(__name__)
 class CreateCourseAPIView(generics.CreateAPIView):
     serializer_class = serializers.CoursesWriteSerializer
     queryset = Courses.objects.all()
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
 
     def create(self, request, *args, **kwargs):
@@ -72,7 +72,7 @@ class EditCourseAPIView(generics.UpdateAPIView):
     queryset = Courses.objects.all()
     serializer_class = serializers.CoursesWriteSerializer
     lookup_field = "pk"
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
 
     def update(self, request, *args, **kwargs):
@@ -105,7 +105,8 @@ class EditCourseAPIView(generics.UpdateAPIView):
                 )
 
 
-class ListEmployeeCoursesAPIView(generics.ListAPIView):
+class ListEmployeeCoursesAPIView(EmployeeResponseCacheMixin, generics.ListAPIView):
+    cache_resource = "courses"
     serializer_class = serializers.CoursesReadSerializer
     throttle_classes = []
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
@@ -129,7 +130,7 @@ class DeleteCourseAPIView(generics.DestroyAPIView):
     queryset = Courses.objects.all()
     serializer_class = serializers.CoursesWriteSerializer
     lookup_field = "pk"
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
 
     def perform_destroy(self, instance):
@@ -151,7 +152,7 @@ class CreateIncompleteCourseRecordsAPIView(generics.CreateAPIView):
     queryset = IncompleteCourseRecords.objects.all()
     serializer_class = serializers.IncompleteCourseRecordsWriteSerializer
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
@@ -200,7 +201,10 @@ class ListIncompleteCourseRecordsAPIView(generics.ListAPIView):
     pagination_class = LargeResultsSetPagination
 
 
-class ListEmployeeIncompleteCourseRecordsAPIView(generics.ListAPIView):
+class ListEmployeeIncompleteCourseRecordsAPIView(
+    EmployeeResponseCacheMixin, generics.ListAPIView
+):
+    cache_resource = "incomplete_courses"
     serializer_class = serializers.IncompleteCourseRecordsReadSerializer
     throttle_classes = []
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
@@ -219,7 +223,7 @@ class EditIncompleteCourseRecordsAPIView(generics.UpdateAPIView):
     lookup_field = "pk"
     serializer_class = serializers.IncompleteCourseRecordsWriteSerializer
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def update(self, request, *args, **kwargs):
         partial = kwargs.pop("partial", False)
@@ -253,7 +257,7 @@ class DeleteIncompleteCourseRecordsAPIView(generics.DestroyAPIView):
     lookup_field = "pk"
     serializer_class = serializers.IncompleteCourseRecordsWriteSerializer
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def perform_destroy(self, instance):
         with transaction.atomic():
@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand
+from employees.services import (
+    get_response_cache_stats,
+    is_response_cache_enabled,
+    reset_response_cache_stats,
+    set_response_cache_enabled,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Report hits and misses of the employee response cache, or switch it "
+        "off and on. While off, employee responses are read from the database."
+    )
+
+    def add_arguments(self, parser):
+        switch = parser.add_mutually_exclusive_group()
+        switch.add_argument("--enable", action="store_true")
+        switch.add_argument("--disable", action="store_true")
+        parser.add_argument("--reset-stats", action="store_true")
+
+    def handle(self, *args, **options):
+        if options["enable"] or options["disable"]:
+            set_response_cache_enabled(options["enable"])
+
+        if options["reset_stats"]:
+            reset_response_cache_stats()
+
+        self.stdout.write(
+            f"Employee response cache: {'on' if is_response_cache_enabled() else 'off'}"
+        )
+
+        for resource, stats in sorted(get_response_cache_stats().items()):
+            requests = stats["hits"] + stats["misses"]
+
+            self.stdout.write(
+                f"{resource}: {stats['hits']} hits, {stats['misses']} misses "
+                f"({stats['hits'] / requests:.0%} hit rate)"
+            )
@@ -37,6 +37,8 @@ class Employee(models.Model):
     confirmation_date = models.DateField(null=True, blank=True)
     probation = models.CharField(null=True, blank=True)
     entry_qualification = models.CharField(max_length=255, null=True, blank=True)
+    # Maintained by flags.signals
+    flag_count = models.PositiveIntegerField(default=0, editable=False)
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -0,0 +1,227 @@
+from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import F, Prefetch
+from django.shortcuts import get_object_or_404
+from abscences.models import Absences
+from abscences.serializers import AbsencesReadSerializer
+from children.models import Children, InCompleteChildRecords
+from children.serializers import (
+    ChildrenReadSerializer,
+    InCompleteChildRecordsReadSerializer,
+)
+from courses.models import Courses, IncompleteCourseRecords
+from courses.serializers import (
+    CoursesReadSerializer,
+    IncompleteCourseRecordsReadSerializer,
+)
+from identity.models import Identity
+from identity.serializers import IdentityReadSerializer
+from marriage.models import Spouse
+from marriage.serializers import SpouseReadSerializer
+from next_of_kin.models import EmergencyOrNextOfKin
+from next_of_kin.serializers import EmergencyOrNextOfKinReadSerializer
+from occurance.models import IncompleteOccurrence, Occurrence
+from occurance.serializers import (
+    IncompleteOccurrenceReadSerializer,
+    OccurrenceReadSerializer,
+)
+from previous_government_service.models import (
+    IncompletePreviousGovernmentServiceRecords,
+    PreviousGovernmentService,
+)
+from previous_government_service.serializers import (
+    IncompletePreviousGovernmentServiceReadSerializer,
+    PreviousGovernmentServiceReadSerializer,
+)
+from service_with_forces.models import (
+    IncompleteServiceWithForcesRecords,
+    ServiceWithForces,
+)
+from service_with_forces.serializers import (
+    IncompleteServiceWithForcesReadSerializer,
+    ServiceWithForcesReadSerializer,
+)
+from termination_of_appointment.models import (
+    IncompleteTerminationOfAppointmentRecords,
+    TerminationOfAppointment,
+)
+from termination_of_appointment.serializers import (
+    IncompleteTerminationOfAppointmentReadSerializer,
+    TerminationOfAppointmentReadSerializer,
+)
+from .models import Employee
+from .serializers import EmployeeReadSerializer
+from .services import get_cached_responses
+
+EMPLOYEE_RELATED_FIELDS = [
+    "gender",
+    "region",
+    "religion",
+    "marital_status",
+    "unit",
+    "grade",
+    "structure",
+    "blood_group",
+    "created_by",
+    "updated_by",
+]
+
+OCCURRENCE_ORDERING = [F("authority_serial_number").desc(nulls_last=True), "-id"]
+
+# Section: (related name on Employee, queryset it is prefetched with,
+# serializer). The querysets select what the matching ListEmployee* views do.
+PROFILE_SECTIONS = {
+    "occurrences": (
+        "occurrences",
+        Occurrence.objects.select_related(
+            "created_by", "updated_by", "grade", "level_step", "event"
+        ).order_by(*OCCURRENCE_ORDERING),
+        OccurrenceReadSerializer,
+    ),
+    "incomplete_occurrences": (
+        "incomplete_occurrence",
+        IncompleteOccurrence.objects.select_related(
+            "created_by", "updated_by", "grade", "level_step", "event"
+        ).order_by(*OCCURRENCE_ORDERING),
+        IncompleteOccurrenceReadSerializer,
+    ),
+    "absences": (
+        "absences",
+        Absences.objects.select_related("created_by", "updated_by"),
+        AbsencesReadSerializer,
+    ),
+    "children": (
+        "children",
+        Children.objects.select_related("created_by", "updated_by", "gender"),
+        ChildrenReadSerializer,
+    ),
+    "incomplete_children": (
+        "incomplete_child_records",
+        InCompleteChildRecords.objects.select_related(
+            "created_by", "updated_by", "gender"
+        ),
+        InCompleteChildRecordsReadSerializer,
+    ),
+    "courses": (
+        "courses",
+        Courses.objects.select_related("created_by", "updated_by"),
+        CoursesReadSerializer,
+    ),
+    "incomplete_courses": (
+        "incomplete_course_records",
+        IncompleteCourseRecords.objects.select_related("created_by", "updated_by"),
+        IncompleteCourseRecordsReadSerializer,
+    ),
+    "identity": (
+        "identity",
+        Identity.objects.select_related("created_by", "updated_by"),
+        IdentityReadSerializer,
+    ),
+    "spouse": (
+        "spouse",
+        Spouse.objects.select_related("created_by", "updated_by"),
+        SpouseReadSerializer,
+    ),
+    "next_of_kin": (
+        "next_of_kin",
+        EmergencyOrNextOfKin.objects.select_related("created_by", "updated_by"),
+        EmergencyOrNextOfKinReadSerializer,
+    ),
+    "previous_government_service": (
+        "previous_government_service",
+        PreviousGovernmentService.objects.select_related("created_by", "updated_by"),
+        PreviousGovernmentServiceReadSerializer,
+    ),
+    "incomplete_previous_government_service": (
+        "incomplete_previous_government_service_records",
+        IncompletePreviousGovernmentServiceRecords.objects.select_related(
+            "created_by", "updated_by"
+        ),
+        IncompletePreviousGovernmentServiceReadSerializer,
+    ),
+    "service_with_forces": (
+        "service_with_forces",
+        ServiceWithForces.objects.select_related(
+            "created_by", "updated_by", "military_rank", "last_unit"
+        ),
+        ServiceWithForcesReadSerializer,
+    ),
+    "incomplete_service_with_forces": (
+        "incomplete_service_with_forces_records",
+        IncompleteServiceWithForcesRecords.objects.select_related(
+            "created_by", "updated_by", "military_rank", "last_unit"
+        ),
+        IncompleteServiceWithForcesReadSerializer,
+    ),
+    "termination": (
+        "termination_of_appointment",
+        TerminationOfAppointment.objects.select_related(
+            "cause", "status", "created_by", "updated_by"
+        ),
+        TerminationOfAppointmentReadSerializer,
+    ),
+    "incomplete_termination": (
+        "incomplete_termination_of_appointment",
+        IncompleteTerminationOfAppointmentRecords.objects.select_related(
+            "cause", "status", "created_by", "updated_by"
+        ),
+        IncompleteTerminationOfAppointmentReadSerializer,
+    ),
+}
+
+# Models whose writes change a profile section
+PROFILE_MODELS = [records.model for _, records, _ in PROFILE_SECTIONS.values()]
+
+
+def serialize_section(employee, section):
+    related_name, _, serializer_class = PROFILE_SECTIONS[section]
+
+    try:
+        related = getattr(employee, related_name)
+    except ObjectDoesNotExist:
+        # One-to-one records the employee does not have yet
+        return None
+
+    if Employee._meta.get_field(related_name).one_to_one:
+        return serializer_class(related).data
+
+    return serializer_class(related.all(), many=True).data
+
+
+def load_employee_profile(service_id, sections):
+    # One query for the employee and one per section
+    queryset = Employee.objects.prefetch_related(
+        *[
+            Prefetch(related_name, queryset=records.all())
+            for section, (related_name, records, _) in PROFILE_SECTIONS.items()
+            if section in sections
+        ]
+    )
+
+    if "employee" in sections:
+        queryset = queryset.select_related(*EMPLOYEE_RELATED_FIELDS)
+
+    employee = get_object_or_404(queryset, pk=service_id)
+
+    return {
+        section: (
+            EmployeeReadSerializer(employee).data
+            if section == "employee"
+            else serialize_section(employee, section)
+        )
+        for section in sections
+    }
+
+
+def get_employee_profile(service_id, sections):
+    # Sections are cached under the same keys as the ListEmployee* views
+    # they stand in for, so either one warms the other
+    serializers = {
+        "employee": EmployeeReadSerializer,
+        **{section: PROFILE_SECTIONS[section][2] for section in sections},
+    }
+
+    return get_cached_responses(
+        service_id,
+        serializers,
+        lambda missing: load_employee_profile(service_id, missing),
+    )
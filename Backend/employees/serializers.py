@@ -394,6 +394,7 @@ class EmployeeDTOReadSerializer(serializers.ModelSerializer):
             "category",
             "appointment_date",
             "termination_status",
+            "flag_count",
         ]
 
     def get_termination_status(self, obj):
@@ -1,4 +1,10 @@
+import hashlib
+import logging
+from functools import lru_cache
+from django.core.cache import cache
+from django.db import transaction
 from django.db.models import Count, Q
+from django_redis import get_redis_connection
 from employees import models
 from datetime import datetime
 from django.db.models.functions import ExtractYear
@@ -7,6 +13,18 @@ from activity_feeds.models import ActivityFeeds
 from termination_of_appointment.models import TerminationOfAppointment
 from api.models import CustomUser, Divisions
 
+logger = logging.getLogger(__name__)
+
+RETIREMENT_AGE = 60
+# Writes retire cached employee responses through the employee's version;
+# the timeout only bounds how long renamed lookups such as units or grades
+# show their old names
+RESPONSE_CACHE_TIMEOUT = 60 * 60
+# Set with `manage.py employee_response_cache --disable` to serve every
+# employee response from the database
+RESPONSE_CACHE_DISABLED_KEY = "employees:response_cache:disabled"
+RESPONSE_CACHE_STATS_KEY = "employees:response_cache:stats"
+
 
 def get_users_per_role():
     return CustomUser.objects.aggregate(
@@ -50,7 +68,9 @@ def get_forecasted_retirees():
 
     # Annotate retirement year
     employees = (
-        models.Employee.objects.annotate(retirement_year=ExtractYear(F("dob")) + 60)
+        models.Employee.objects.annotate(
+            retirement_year=ExtractYear(F("dob")) + RETIREMENT_AGE
+        )
         .filter(retirement_year__range=(current_year, end_year))
         .values("service_id", "retirement_year")
     )
@@ -127,3 +147,138 @@ def get_religion():
 
 def get_blood_group():
     return models.BloodGroup.objects.all()
+
+
+def get_profile_version_key(service_id):
+    return f"employees:profile_version:{service_id}"
+
+
+def get_profile_version(service_id):
+    return cache.get_or_set(get_profile_version_key(service_id), 1, timeout=None)
+
+
+@lru_cache(maxsize=None)
+def get_serializer_version(serializer_class):
+    # Changes whenever the serializer's fields do, so a deploy never serves
+    # responses cached in the old shape
+    return hashlib.md5(repr(serializer_class()).encode()).hexdigest()[:8]
+
+
+def get_response_cache_key(resource, service_id, version, serializer_class):
+    return (
+        f"employees:response:{resource}:{service_id}:{version}:"
+        f"{get_serializer_version(serializer_class)}"
+    )
+
+
+def get_response_cache_state(service_id):
+    # Whether the cache is on, and the employee's version, in one round trip
+    version_key = get_profile_version_key(service_id)
+    state = cache.get_many([RESPONSE_CACHE_DISABLED_KEY, version_key])
+    version = state.get(version_key) or get_profile_version(service_id)
+
+    return RESPONSE_CACHE_DISABLED_KEY not in state, version
+
+
+def is_response_cache_enabled():
+    return cache.get(RESPONSE_CACHE_DISABLED_KEY) is None
+
+
+def set_response_cache_enabled(enabled):
+    if enabled:
+        cache.delete(RESPONSE_CACHE_DISABLED_KEY)
+    else:
+        cache.set(RESPONSE_CACHE_DISABLED_KEY, True, timeout=None)
+
+    logger.warning(f"Employee response cache {'enabled' if enabled else 'disabled'}.")
+
+
+def record_response_cache_stats(hits, misses):
+    pipeline = get_redis_connection("default").pipeline()
+    key = cache.make_key(RESPONSE_CACHE_STATS_KEY)
+
+    for resource in hits:
+        pipeline.hincrby(key, f"{resource}:hits")
+
+    for resource in misses:
+        pipeline.hincrby(key, f"{resource}:misses")
+
+    pipeline.execute()
+
+
+def get_response_cache_stats():
+    # {resource: {"hits": ..., "misses": ...}}
+    stats = {}
+    counters = get_redis_connection("default").hgetall(
+        cache.make_key(RESPONSE_CACHE_STATS_KEY)
+    )
+
+    for field, count in counters.items():
+        resource, result = field.decode().rsplit(":", 1)
+        stats.setdefault(resource, {"hits": 0, "misses": 0})[result] = int(count)
+
+    return stats
+
+
+def reset_response_cache_stats():
+    cache.delete(RESPONSE_CACHE_STATS_KEY)
+
+
+def get_cached_responses(service_id, serializers, load):
+    # Read-through cache of one employee's responses. serializers maps each
+    # resource to the serializer it is rendered with; load(resources)
+    # renders the missing ones.
+    enabled, version = get_response_cache_state(service_id)
+
+    if not enabled:
+        return load(list(serializers))
+
+    keys = {
+        resource: get_response_cache_key(
+            resource, service_id, version, serializer_class
+        )
+        for resource, serializer_class in serializers.items()
+    }
+
+    cached = cache.get_many(keys.values())
+    responses = {
+        resource: cached[key] for resource, key in keys.items() if key in cached
+    }
+    missing = [resource for resource in keys if resource not in responses]
+
+    if missing:
+        loaded = load(missing)
+        entries = {keys[resource]: loaded[resource] for resource in missing}
+
+        # Cached once committed, so rows a rolled back transaction read are
+        # never served
+        transaction.on_commit(
+            lambda: cache.set_many(entries, timeout=RESPONSE_CACHE_TIMEOUT)
+        )
+        responses.update(loaded)
+
+    record_response_cache_stats(
+        [resource for resource in keys if resource not in missing], missing
+    )
+
+    return {resource: responses[resource] for resource in keys}
+
+
+def bump_profile_versions(service_ids):
+    # Cached sections are keyed by the employee's version, so bumping it
+    # retires all of them. One round trip for a whole batch of employees.
+    pipeline = get_redis_connection("default").pipeline()
+
+    for service_id in service_ids:
+        pipeline.incr(cache.make_key(get_profile_version_key(service_id)))
+
+    pipeline.execute()
+
+
+def invalidate_employee_profiles(service_ids):
+    service_ids = list(service_ids)
+    bump_profile_versions(service_ids)
+
+    # Again once committed, in case a request cached the old rows meanwhile
+    transaction.on_commit(lambda: bump_profile_versions(service_ids))
+    logger.debug(f"Cached profile of Employee({', '.join(service_ids)}) invalidated.")
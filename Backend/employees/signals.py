@@ -1,23 +1,10 @@
 from django.dispatch import receiver
-from django.db.models.signals import post_save, post_delete
+from django.db.models.signals import post_init, post_save, post_delete
 from django.contrib.postgres.search import SearchVector
 from .models import Employee
 from . import services
-from channels.layers import get_channel_layer
-from asgiref.sync import async_to_sync
-
-
-def send_update(data):
-    channel_layer = get_channel_layer()
-
-    async_to_sync(channel_layer.group_send)(
-        "employees",
-        {
-            "type": "send_dashboard_stats",
-            "event_type": "employee_update",
-            "data": data,
-        },
-    )
+from .profile import PROFILE_MODELS
+from realtime.broadcast import publish
 
 
 def send_employees_dashboard_update():
@@ -40,7 +27,7 @@ def send_employees_dashboard_update():
             "forecasted_retirees": forecasted_retirees,
         },
     }
-    send_update(data)
+    publish("employees", "employee_update", data)
 
 
 @receiver(post_save, sender=Employee)
@@ -61,3 +48,32 @@ def handle_new_employee_save(sender, instance, created, **kwargs):
 @receiver(post_delete, sender=Employee)
 def handle_delete_employee(sender, instance, **kwargs):
     send_employees_dashboard_update()
+
+
+@receiver(post_save, sender=Employee)
+@receiver(post_delete, sender=Employee)
+def handle_employee_profile_change(sender, instance, **kwargs):
+    services.invalidate_employee_profiles([instance.pk])
+
+
+def handle_profile_record_load(sender, instance, **kwargs):
+    # Kept so a record moved to another employee invalidates both profiles.
+    # Read from __dict__, so querysets that defer employee_id, e.g. with
+    # only(), do not load it for every row.
+    instance._profile_employee_id = instance.__dict__.get("employee_id")
+
+
+def handle_profile_record_change(sender, instance, **kwargs):
+    # Incomplete records may not be linked to an employee yet
+    service_ids = {instance._profile_employee_id, instance.employee_id} - {None}
+
+    if service_ids:
+        services.invalidate_employee_profiles(service_ids)
+
+    instance._profile_employee_id = instance.employee_id
+
+
+for model in PROFILE_MODELS:
+    post_init.connect(handle_profile_record_load, sender=model)
+    post_save.connect(handle_profile_record_change, sender=model)
+    post_delete.connect(handle_profile_record_change, sender=model)
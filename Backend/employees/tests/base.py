@@ -1,3 +1,8 @@
+import uuid
+from copy import deepcopy
+from django.conf import settings
+from django.core.cache import cache
+from django.test import override_settings
 from rest_framework.test import APITestCase
 from api.models import CustomUser, Divisions
 from django.contrib.auth.models import Group
@@ -98,3 +103,14 @@ class EmployeeBaseAPITestCase(APITestCase):
 
     def authenticate_admin(self):
         self.client.force_authenticate(user=self.admin)
+
+    def isolate_cache(self):
+        # Gives the test a cache prefix of its own, so nothing cached by an
+        # earlier test or run of the suite is served, and clears it afterwards
+        caches = deepcopy(settings.CACHES)
+        caches["default"]["KEY_PREFIX"] = f"test:{uuid.uuid4().hex}"
+
+        cache_settings = override_settings(CACHES=caches)
+        cache_settings.enable()
+        self.addCleanup(cache_settings.disable)
+        self.addCleanup(cache.delete_pattern, "*")
@@ -0,0 +1,104 @@
+from django.urls import reverse
+from rest_framework import status
+from children.models import Children
+from employees.profile import PROFILE_SECTIONS
+from .base import EmployeeBaseAPITestCase
+
+
+class EmployeeProfileAPITest(EmployeeBaseAPITestCase):
+
+    def setUp(self):
+        self.create_employee_url = reverse("create-employee")
+        self.create_child_record_url = reverse("create-child")
+        self.profile_url = reverse("employee-profile", kwargs={"pk": "000993"})
+
+        self.isolate_cache()
+
+        self.child_record_data = {
+            "employee": "000993",
+            "child_name": "Ama",
+            "authority": "CEM 20/24",
+            "dob": "2025-08-07",
+            "other_parent": "John Doe",
+            "gender": self.gender.id,
+        }
+
+        self.authenticate_admin()
+
+        # Send create employee request
+        self.client.post(self.create_employee_url, self.employee_data, format="json")
+
+    def create_child(self, child_name="Ama"):
+        self.child_record_data.update(child_name=child_name)
+
+        return self.client.post(
+            self.create_child_record_url, self.child_record_data, format="json"
+        )
+
+    def test_profile(self):
+        self.create_child()
+
+        # Send retrieve request
+        response = self.client.get(self.profile_url)
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(set(response.data), {"employee", *PROFILE_SECTIONS})
+        self.assertEqual(response.data["employee"]["service_id"], "000993")
+        self.assertEqual(response.data["children"][0]["child_name"], "Ama")
+        self.assertEqual(response.data["courses"], [])
+        self.assertIsNone(response.data["identity"])
+
+    def test_include_sections(self):
+        # Send retrieve request
+        response = self.client.get(self.profile_url, {"include": "children,courses"})
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(set(response.data), {"employee", "children", "courses"})
+
+    def test_unknown_section(self):
+        # Send retrieve request
+        response = self.client.get(self.profile_url, {"include": "children,pets"})
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("pets", response.data["include"][0])
+
+    def test_employee_not_found(self):
+        # Send retrieve request
+        response = self.client.get(
+            reverse("employee-profile", kwargs={"pk": "000000"})
+        )
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_cached_until_related_write(self):
+        self.create_child()
+
+        # Responses are cached once the transaction commits
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.get(self.profile_url, {"include": "children"})
+
+        # Bypasses the signals, so the cached section is still served
+        Children.objects.update(child_name="Kofi")
+        cached = self.client.get(self.profile_url, {"include": "children"})
+
+        self.create_child("Esi")
+        response = self.client.get(self.profile_url, {"include": "children"})
+
+        # Assertions
+        self.assertEqual(cached.data["children"][0]["child_name"], "Ama")
+        self.assertEqual(
+            sorted(child["child_name"] for child in response.data["children"]),
+            ["Esi", "Kofi"],
+        )
+
+    def test_deferred_employee_not_loaded(self):
+        self.create_child()
+        self.create_child("Esi")
+
+        # Assertions
+        with self.assertNumQueries(1):
+            self.assertEqual(len(Children.objects.only("id", "child_name")), 2)
@@ -0,0 +1,113 @@
+from django.urls import reverse
+from rest_framework import status
+from children.models import Children
+from employees.services import get_response_cache_stats, set_response_cache_enabled
+from flags.models import FlagType
+from flags.services import create_flag
+from .base import EmployeeBaseAPITestCase
+
+
+class EmployeeResponseCacheAPITest(EmployeeBaseAPITestCase):
+
+    def setUp(self):
+        self.create_employee_url = reverse("create-employee")
+        self.create_child_record_url = reverse("create-child")
+        self.list_children_url = reverse(
+            "list-employee-children", kwargs={"pk": "000993"}
+        )
+        self.profile_url = reverse("employee-profile", kwargs={"pk": "000993"})
+
+        self.isolate_cache()
+
+        self.child_record_data = {
+            "employee": "000993",
+            "child_name": "Ama",
+            "authority": "CEM 20/24",
+            "dob": "2025-08-07",
+            "other_parent": "John Doe",
+            "gender": self.gender.id,
+        }
+
+        self.authenticate_admin()
+
+        # Send create requests
+        self.client.post(self.create_employee_url, self.employee_data, format="json")
+        self.client.post(
+            self.create_child_record_url, self.child_record_data, format="json"
+        )
+
+    def warm_cache(self, url, data=None):
+        # Responses are cached once the transaction commits
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.get(url, data)
+
+    def test_hits_and_misses(self):
+        # Send list requests
+        self.warm_cache(self.list_children_url)
+        response = self.client.get(self.list_children_url)
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data[0]["child_name"], "Ama")
+        self.assertEqual(
+            get_response_cache_stats(), {"children": {"hits": 1, "misses": 1}}
+        )
+
+    def test_shared_with_profile(self):
+        # Send retrieve requests
+        self.warm_cache(self.profile_url, {"include": "children,identity"})
+        response = self.client.get(self.list_children_url)
+        identity_response = self.client.get(
+            reverse("retrieve-identity", kwargs={"pk": "000993"})
+        )
+
+        # Assertions
+        self.assertEqual(response.data[0]["child_name"], "Ama")
+        self.assertEqual(get_response_cache_stats()["children"]["hits"], 1)
+        self.assertEqual(identity_response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_invalidated_by_write(self):
+        self.warm_cache(self.list_children_url)
+
+        # Send create request
+        self.child_record_data.update(child_name="Esi")
+        self.client.post(
+            self.create_child_record_url, self.child_record_data, format="json"
+        )
+
+        # Send list request
+        response = self.client.get(self.list_children_url)
+
+        # Assertions
+        self.assertEqual(len(response.data), 2)
+
+    def test_invalidated_by_flag(self):
+        FlagType.objects.create(flag_type="Incomplete Record")
+        retrieve_employee_url = reverse("retrieve-employee", kwargs={"pk": "000993"})
+        self.warm_cache(retrieve_employee_url)
+
+        create_flag(Children.objects.get(child_name="Ama"), self.admin)
+
+        # Send retrieve request
+        response = self.client.get(retrieve_employee_url)
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["flag_count"], 1)
+
+    def test_kill_switch(self):
+        self.warm_cache(self.list_children_url)
+        set_response_cache_enabled(False)
+        self.addCleanup(set_response_cache_enabled, True)
+
+        # Bypasses the signals, so only an uncached response shows it
+        Children.objects.update(child_name="Kofi")
+
+        # Send list request
+        response = self.client.get(self.list_children_url)
+
+        # Assertions
+        self.assertEqual(response.data[0]["child_name"], "Kofi")
+        self.assertEqual(
+            get_response_cache_stats(), {"children": {"hits": 0, "misses": 1}}
+        )
@@ -0,0 +1,71 @@
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from .base import BaseAPITestCase
+
+
+class ThrottleBudgetsAPITest(BaseAPITestCase):
+
+    def setUp(self):
+        self.create_gender_url = reverse("create-gender")
+        self.search_employees_url = reverse("search-employees")
+
+        self.authenticate_admin()
+
+        # Budgets from earlier runs of the suite
+        cache.delete_many(
+            [
+                f"throttle_{scope}_{self.admin.pk}"
+                for scope in ["read", "search", "write"]
+            ]
+        )
+
+    def create_gender(self, sex="Male"):
+        return self.client.post(self.create_gender_url, {"sex": sex}, format="json")
+
+    def test_write_budget_headers(self):
+        # Send create request
+        response = self.create_gender()
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response["X-RateLimit-Scope"], "write")
+        self.assertEqual(response["X-RateLimit-Limit"], "12")
+        self.assertEqual(response["X-RateLimit-Remaining"], "11")
+        self.assertLessEqual(int(response["X-RateLimit-Reset"]), 60)
+
+    def test_searches_leave_write_budget(self):
+        # Send search requests
+        for _ in range(13):
+            response = self.client.get(self.search_employees_url)
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["X-RateLimit-Scope"], "search")
+        self.assertEqual(response["X-RateLimit-Remaining"], "47")
+
+        # Send create request
+        response = self.create_gender()
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response["X-RateLimit-Remaining"], "11")
+
+    def test_exhausted_budget(self):
+        # Send create requests
+        for _ in range(13):
+            response = self.create_gender()
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertEqual(response["X-RateLimit-Remaining"], "0")
+        self.assertIn("Retry-After", response)
+
+    def test_default_budget(self):
+        # Send user details request; dj_rest_auth sets no throttle_classes
+        response = self.client.get(reverse("rest_user_details"))
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["X-RateLimit-Scope"], "read")
+        self.assertEqual(response["X-RateLimit-Limit"], "120")
@@ -17,6 +17,11 @@ urlpatterns = [
         views.RetrieveEmployeeAPIView.as_view(),
         name="retrieve-employee",
     ),
+    path(
+        "staff/<str:pk>/profile/",
+        views.EmployeeProfileAPIView.as_view(),
+        name="employee-profile",
+    ),
     path(
         "staff/total/",
         views.TotalNumberOfEmployeesAPIView.as_view(),
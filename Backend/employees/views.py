@@ -2,7 +2,7 @@ from rest_framework import generics, pagination
 from . import models
 from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from . import serializers
-from rest_framework.throttling import UserRateThrottle
+from api.throttles import ReadThrottle, SearchThrottle, WriteThrottle
 from .permissions import IsAdminUserOrStandardUser, RestrictFields, CanEditEmployee
 import logging
 from rest_framework.response import Response
@@ -19,6 +19,9 @@ from django.contrib.postgres.search import SearchQuery, SearchRank
 import random
 from . import services
 import random
+from .profile import PROFILE_SECTIONS, get_employee_profile
+from .services import get_cached_responses
+from django.http import Http404
 
 logger = logging.getLogger(__name__)
 
@@ -36,12 +39,47 @@ class StandardResultsSetPagination(pagination.PageNumberPagination):
     max_page_size = 200
 
 
+class EmployeeResponseCacheMixin:
+    # For list and retrieve views of one employee, whose service ID is the pk
+    # URL kwarg. Responses are cached until the employee or one of their
+    # records changes, under cache_resource, which is shared with the
+    # matching profile section.
+    cache_resource = None
+
+    def get_cached_response_data(self, load):
+        return get_cached_responses(
+            self.kwargs.get("pk"),
+            {self.cache_resource: self.get_serializer_class()},
+            lambda missing: {self.cache_resource: load()},
+        )[self.cache_resource]
+
+    def list(self, request, *args, **kwargs):
+        data = self.get_cached_response_data(
+            lambda: self.get_serializer(
+                self.filter_queryset(self.get_queryset()), many=True
+            ).data
+        )
+
+        return Response(data)
+
+    def retrieve(self, request, *args, **kwargs):
+        data = self.get_cached_response_data(
+            lambda: self.get_serializer(self.get_object()).data
+        )
+
+        # Profiles cache a missing one-to-one record as None
+        if data is None:
+            raise Http404
+
+        return Response(data)
+
+
 # * EMPLOYEES
 class CreateEmployeeAPIView(generics.CreateAPIView):
     queryset = models.Employee.objects.all()
     serializer_class = serializers.EmployeeCreateSerializer
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser, RestrictFields]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
@@ -70,7 +108,8 @@ class CreateEmployeeAPIView(generics.CreateAPIView):
             )
 
 
-class RetrieveEmployeeAPIView(generics.RetrieveAPIView):
+class RetrieveEmployeeAPIView(EmployeeResponseCacheMixin, generics.RetrieveAPIView):
+    cache_resource = "employee"
     queryset = models.Employee.objects.select_related(
         "gender",
         "region",
@@ -89,6 +128,35 @@ class RetrieveEmployeeAPIView(generics.RetrieveAPIView):
     throttle_classes = []
 
 
+class EmployeeProfileAPIView(APIView):
+    # The employee and their records in one document, in place of the
+    # ListEmployee* calls a profile page makes. ?include=children,courses
+    # limits it to some sections; the employee is always included.
+    http_method_names = ["get"]
+    permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
+    throttle_classes = []
+
+    def get(self, request, *args, **kwargs):
+        include = request.query_params.get("include")
+        sections = include.split(",") if include else list(PROFILE_SECTIONS)
+        unknown = [section for section in sections if section not in PROFILE_SECTIONS]
+
+        if unknown:
+            return Response(
+                {
+                    "include": [
+                        f"Unknown sections: {', '.join(unknown)}. Choose from "
+                        f"{', '.join(PROFILE_SECTIONS)}."
+                    ]
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        profile = get_employee_profile(self.kwargs.get("pk"), sections)
+
+        return Response(profile, status=status.HTTP_200_OK)
+
+
 class ListEmployeesAPIView(generics.ListAPIView):
     queryset = models.Employee.objects.select_related(
         "gender",
@@ -130,7 +198,7 @@ class EditEmployeeAPIView(generics.UpdateAPIView):
     lookup_field = "pk"
     serializer_class = serializers.EmployeeUpdateSerializer
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser, CanEditEmployee]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def update(self, request, *args, **kwargs):
         partial = kwargs.pop("partial", False)
@@ -170,7 +238,7 @@ class DeleteEmployeeAPIView(generics.DestroyAPIView):
     lookup_field = "pk"
     serializer_class = serializers.EmployeeReadSerializer
     permission_classes = [IsAuthenticated, IsAdminUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def perform_destroy(self, instance):
         with transaction.atomic():
@@ -209,7 +277,7 @@ class ForecastedRetireesAPIView(APIView):
 
 class SearchEmployeeAPIView(generics.ListAPIView):
     serializer_class = serializers.EmployeeReadSerializer
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [SearchThrottle]
     permission_classes = [IsAuthenticated]
     pagination_class = LargeResultsSetPagination
 
@@ -249,7 +317,7 @@ class CreateCategoryAPIView(generics.CreateAPIView):
     queryset = models.Category.objects.all()
     serializer_class = serializers.CategorySerializer
     permission_classes = [IsAuthenticated, IsAdminUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def perform_create(self, serializer):
         with transaction.atomic():
@@ -285,7 +353,7 @@ class EditCategoryAPIView(generics.UpdateAPIView):
     lookup_field = "pk"
     serializer_class = serializers.CategorySerializer
     permission_classes = [IsAuthenticated, IsAdminUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def perform_update(self, serializer):
         with transaction.atomic():
@@ -307,7 +375,7 @@ class DeleteCategoryAPIView(generics.DestroyAPIView):
     lookup_field = "pk"
     serializer_class = serializers.CategorySerializer
     permission_classes = [IsAuthenticated, IsAdminUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def perform_destroy(self, instance):
         with transaction.atomic():
@@ -329,7 +397,7 @@ class CreateGradeAPIView(generics.CreateAPIView):
     queryset = models.Grades.objects.all()
     serializer_class = serializers.GradeSerializer
     permission_classes = [IsAuthenticated, IsAdminUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
@@ -376,7 +444,7 @@ class EditGradeAPIView(generics.UpdateAPIView):
     lookup_field = "pk"
     serializer_class = serializers.GradeSerializer
     permission_classes = [IsAuthenticated, IsAdminUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def update(self, request, *args, **kwargs):
         partial = kwargs.pop("partial", False)
@@ -413,7 +481,7 @@ class DeleteGradeAPIView(generics.DestroyAPIView):
     lookup_field = "pk"
     serializer_class = serializers.GradeSerializer
     permission_classes = [IsAuthenticated, IsAdminUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def perform_destroy(self, instance):
         with transaction.atomic():
@@ -435,7 +503,7 @@ class CreateUnitAPIView(generics.CreateAPIView):
     queryset = models.Units.objects.all()
     serializer_class = serializers.UnitSerializer
     permission_classes = [IsAuthenticated, IsAdminUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def perform_create(self, serializer):
         with transaction.atomic():
@@ -503,7 +571,7 @@ class EditUnitAPIView(generics.UpdateAPIView):
     lookup_field = "pk"
     serializer_class = serializers.UnitSerializer
     permission_classes = [IsAuthenticated, IsAdminUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def perform_update(self, serializer):
         with transaction.atomic():
@@ -525,7 +593,7 @@ class DeleteUnitAPIView(generics.DestroyAPIView):
     lookup_field = "pk"
     serializer_class = serializers.UnitSerializer
     permission_classes = [IsAuthenticated, IsAdminUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def perform_destroy(self, instance):
         with transaction.atomic():
@@ -547,7 +615,7 @@ class CreateGenderAPIView(generics.CreateAPIView):
     queryset = models.Gender.objects.all()
     serializer_class = serializers.GenderSerializer
     permission_classes = [IsAuthenticated, IsAdminUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def perform_create(self, serializer):
         with transaction.atomic():
@@ -583,7 +651,7 @@ class EditGenderAPIView(generics.UpdateAPIView):
     lookup_field = "pk"
     serializer_class = serializers.GenderSerializer
     permission_classes = [IsAuthenticated, IsAdminUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def perform_update(self, serializer):
         with transaction.atomic():
@@ -605,7 +673,7 @@ class DeleteGenderAPIView(generics.DestroyAPIView):
     lookup_field = "pk"
     serializer_class = serializers.GenderSerializer
     permission_classes = [IsAuthenticated, IsAdminUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def perform_destroy(self, instance):
         with transaction.atomic():
@@ -641,7 +709,7 @@ class CreateMaritalStatusAPIView(generics.CreateAPIView):
     queryset = models.MaritalStatus.objects.all()
     serializer_class = serializers.MaritalStatusSerializer
     permission_classes = [IsAuthenticated, IsAdminUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def perform_create(self, serializer):
         with transaction.atomic():
@@ -677,7 +745,7 @@ class EditMaritalStatusAPIView(generics.UpdateAPIView):
     lookup_field = "pk"
     serializer_class = serializers.MaritalStatusSerializer
     permission_classes = [IsAuthenticated, IsAdminUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def perform_update(self, serializer):
         with transaction.atomic():
@@ -699,7 +767,7 @@ class DeleteMaritalStatusAPIView(generics.DestroyAPIView):
     lookup_field = "pk"
     serializer_class = serializers.MaritalStatusSerializer
     permission_classes = [IsAuthenticated, IsAdminUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def perform_destroy(self, instance):
         with transaction.atomic():
@@ -721,7 +789,7 @@ class CreateRegionAPIView(generics.CreateAPIView):
     queryset = models.Region.objects.all()
     serializer_class = serializers.RegionSerializer
     permission_classes = [IsAuthenticated, IsAdminUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def perform_create(self, serializer):
         with transaction.atomic():
@@ -757,7 +825,7 @@ class EditRegionAPIView(generics.UpdateAPIView):
     lookup_field = "pk"
     serializer_class = serializers.RegionSerializer
     permission_classes = [IsAuthenticated, IsAdminUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def perform_update(self, serializer):
         with transaction.atomic():
@@ -779,7 +847,7 @@ class DeleteRegionAPIView(generics.DestroyAPIView):
     lookup_field = "pk"
     serializer_class = serializers.RegionSerializer
     permission_classes = [IsAuthenticated, IsAdminUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def perform_destroy(self, instance):
         with transaction.atomic():
@@ -801,7 +869,7 @@ class CreateReligionAPIView(generics.CreateAPIView):
     queryset = models.Religion.objects.all()
     serializer_class = serializers.ReligionSerializer
     permission_classes = [IsAuthenticated, IsAdminUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def perform_create(self, serializer):
         with transaction.atomic():
@@ -837,7 +905,7 @@ class EditReligionAPIView(generics.UpdateAPIView):
     lookup_field = "pk"
     serializer_class = serializers.ReligionSerializer
     permission_classes = [IsAuthenticated, IsAdminUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def perform_update(self, serializer):
         with transaction.atomic():
@@ -859,7 +927,7 @@ class DeleteReligionAPIView(generics.DestroyAPIView):
     lookup_field = "pk"
     serializer_class = serializers.ReligionSerializer
     permission_classes = [IsAuthenticated, IsAdminUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def perform_destroy(self, instance):
         with transaction.atomic():
@@ -881,7 +949,7 @@ class CreateStructureAPIView(generics.CreateAPIView):
     queryset = models.Structure.objects.all()
     serializer_class = serializers.StructureSerializer
     permission_classes = [IsAuthenticated, IsAdminUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def perform_create(self, serializer):
         with transaction.atomic():
@@ -917,7 +985,7 @@ class EditStructureAPIView(generics.UpdateAPIView):
     lookup_field = "pk"
     serializer_class = serializers.StructureSerializer
     permission_classes = [IsAuthenticated, IsAdminUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def perform_update(self, serializer):
         with transaction.atomic():
@@ -939,7 +1007,7 @@ class DeleteStructureAPIView(generics.DestroyAPIView):
     lookup_field = "pk"
     serializer_class = serializers.StructureSerializer
     permission_classes = [IsAuthenticated, IsAdminUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def perform_destroy(self, instance):
         with transaction.atomic():
@@ -961,7 +1029,7 @@ class CreateBloodGroupAPIView(generics.CreateAPIView):
     queryset = models.BloodGroup.objects.all()
     serializer_class = serializers.BloodGroupSerializer
     permission_classes = [IsAuthenticated, IsAdminUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def perform_create(self, serializer):
         with transaction.atomic():
@@ -997,7 +1065,7 @@ class EditBloodGroupAPIView(generics.UpdateAPIView):
     lookup_field = "pk"
     serializer_class = serializers.BloodGroupSerializer
     permission_classes = [IsAuthenticated, IsAdminUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def perform_update(self, serializer):
         with transaction.atomic():
@@ -1019,7 +1087,7 @@ class DeleteBloodGroupAPIView(generics.DestroyAPIView):
     lookup_field = "pk"
     serializer_class = serializers.BloodGroupSerializer
     permission_classes = [IsAuthenticated, IsAdminUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def perform_destroy(self, instance):
         with transaction.atomic():
@@ -1041,7 +1109,7 @@ class CreateDocumentFileAPIView(generics.CreateAPIView):
     queryset = models.DocumentFile.objects.all()
     serializer_class = serializers.DocumentFileSerializer
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def perform_create(self, serializer):
         with transaction.atomic():
@@ -1077,7 +1145,7 @@ class EditDocumentFileAPIView(generics.UpdateAPIView):
     lookup_field = "pk"
     serializer_class = serializers.DocumentFileSerializer
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def perform_update(self, serializer):
         with transaction.atomic():
@@ -1099,7 +1167,7 @@ class DeleteDocumentFileAPIView(generics.DestroyAPIView):
     lookup_field = "pk"
     serializer_class = serializers.DocumentFileSerializer
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def perform_destroy(self, instance):
         with transaction.atomic():
@@ -1121,7 +1189,7 @@ class CreateUnregisteredEmployeeAPIView(generics.CreateAPIView):
     queryset = models.UnregisteredEmployees.objects.all()
     serializer_class = serializers.UnregisteredEmployeesWriteSerializer
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
@@ -1175,7 +1243,7 @@ class EditUnregisteredEmployeeAPIView(generics.UpdateAPIView):
     lookup_field = "pk"
     serializer_class = serializers.UnregisteredEmployeesWriteSerializer
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def update(self, request, *args, **kwargs):
         partial = kwargs.pop("partial", False)
@@ -1211,7 +1279,7 @@ class DeleteUnregisteredEmployeeAPIView(generics.DestroyAPIView):
     lookup_field = "pk"
     serializer_class = serializers.UnregisteredEmployeesWriteSerializer
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def perform_destroy(self, instance):
         with transaction.atomic():
@@ -1234,7 +1302,7 @@ class DeleteUnregisteredEmployeeAPIView(generics.DestroyAPIView):
 # * DASHBOARD
 class DashboardAPIView(APIView):
     http_method_names = ["get"]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [ReadThrottle]
     permission_classes = [IsAuthenticated]
 
     def get(self, request, *args, **kwargs):
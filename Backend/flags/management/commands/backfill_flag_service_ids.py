@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+from flags.services import backfill_flag_service_ids
+
+
+class Command(BaseCommand):
+    help = "Populate service_id on Flags created without one"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        updated = backfill_flag_service_ids(batch_size=options["batch_size"])
+
+        self.stdout.write(self.style.SUCCESS(f"Flags: {updated} back-filled"))
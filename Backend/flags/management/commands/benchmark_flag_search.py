@@ -0,0 +1,138 @@
+import time
+from datetime import timedelta
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+from api.models import CustomUser
+from employees.models import Employee
+from flags.models import FlagType
+from flags.services import search_flags
+
+
+FIELDS = ["All", "date of birth", "gender", "grade", "unit"]
+
+
+class Command(BaseCommand):
+    help = (
+        "Load synthetic flags and report the query plan and latency of flag search. "
+        "The data is rolled back unless --keep is passed."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=1_000_000)
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument("--explain", action="store_true")
+        parser.add_argument("--keep", action="store_true")
+
+    def handle(self, *args, **options):
+        users = list(CustomUser.objects.values_list("id", "username")[:2])
+
+        if not users:
+            raise CommandError("Create at least one user before running the benchmark.")
+
+        with transaction.atomic():
+            flag_types = [
+                FlagType.objects.get_or_create(flag_type=name)[0]
+                for name in ["Incomplete Record", "Invalid Data"]
+            ]
+
+            self.load_flags(options["rows"], flag_types, users)
+
+            today = timezone.localtime().replace(
+                hour=0, minute=0, second=0, microsecond=0
+            )
+            username = users[-1][1]
+
+            scenarios = {
+                "unfiltered": {},
+                "flag_type": {"flag_type": flag_types[1].flag_type},
+                "field": {"field": "DATE OF BIRTH"},
+                "created_by": {"created_by": username},
+                "created_at": {"created_at": today - timedelta(days=3)},
+                "combined": {
+                    "flag_type": flag_types[0].flag_type,
+                    "field": "gender",
+                    "created_by": username,
+                    "created_at": today - timedelta(days=3),
+                },
+                "reason": {"reason": "invalid"},
+            }
+
+            for name, params in scenarios.items():
+                self.run_scenario(name, params, options)
+
+            if not options["keep"]:
+                transaction.set_rollback(True)
+
+    def load_flags(self, rows, flag_types, users):
+        content_type = ContentType.objects.get_for_model(Employee)
+        started = time.perf_counter()
+
+        # Rows are generated server-side so loading a million flags stays cheap
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                INSERT INTO flags (
+                    content_type_id, object_id, flag_type_id, field, reason,
+                    service_id, created_by_id, updated_by_id, created_at,
+                    search_vector
+                )
+                SELECT
+                    %s,
+                    lpad(g::text, 7, '0'),
+                    (%s::int[])[1 + g %% array_length(%s::int[], 1)],
+                    (%s::text[])[1 + g %% array_length(%s::text[], 1)],
+                    reason,
+                    lpad((g %% 50000)::text, 6, '0'),
+                    (%s::int[])[1 + g %% array_length(%s::int[], 1)],
+                    (%s::int[])[1 + (g / 7) %% array_length(%s::int[], 1)],
+                    now() - (g || ' minutes')::interval,
+                    setweight(to_tsvector('english', reason), 'A')
+                FROM generate_series(1, %s) AS g,
+                LATERAL (
+                    SELECT CASE WHEN g %% 10 = 0
+                        THEN 'Invalid data entered'
+                        ELSE 'Incomplete Record' END AS reason
+                ) AS r
+                """,
+                [
+                    content_type.id,
+                    [flag_type.id for flag_type in flag_types],
+                    [flag_type.id for flag_type in flag_types],
+                    FIELDS,
+                    FIELDS,
+                    [user_id for user_id, _ in users],
+                    [user_id for user_id, _ in users],
+                    [user_id for user_id, _ in users],
+                    [user_id for user_id, _ in users],
+                    rows,
+                ],
+            )
+            cursor.execute("ANALYZE flags")
+
+        self.stdout.write(
+            f"Loaded {rows} flags in {time.perf_counter() - started:.1f}s\n"
+        )
+
+    def run_scenario(self, name, params, options):
+        qs = search_flags(**params)
+        timings = []
+
+        for _ in range(options["repeat"]):
+            started = time.perf_counter()
+            # One page and the paginator count, as served by SearchFlagsAPIView
+            list(qs[:100])
+            qs.count()
+            timings.append((time.perf_counter() - started) * 1000)
+
+        timings.sort()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{name}: median {timings[len(timings) // 2]:.1f}ms, "
+                f"best {timings[0]:.1f}ms"
+            )
+        )
+
+        if options["explain"]:
+            self.stdout.write(qs[:100].explain(analyze=True) + "\n")
@@ -3,8 +3,10 @@ from django.contrib.contenttypes.models import ContentType
 from django.contrib.contenttypes.fields import GenericForeignKey
 from api.models import CustomUser
 import logging
+from .resolvers import resolve_service_id
 from django.contrib.postgres.search import SearchVectorField
 from django.contrib.postgres.indexes import GinIndex
+from django.db.models.functions import Lower
 
 logger = logging.getLogger(__name__)
 
@@ -34,30 +36,24 @@ class Flags(models.Model):
         verbose_name = "flags"
         verbose_name_plural = "flags"
 
-        indexes = [GinIndex(fields=["search_vector"])]
+        indexes = [
+            GinIndex(fields=["search_vector"]),
+            models.Index(fields=["content_type", "object_id"]),
+            models.Index(fields=["service_id"]),
+            models.Index(fields=["created_at"]),
+            models.Index(fields=["flag_type", "created_at"]),
+            models.Index(Lower("field"), name="flags_field_lower_idx"),
+        ]
 
     # Override save method to populate service_id in objects where it is found
     def save(self, *args, **kwargs):
-        if not self.service_id and self.content_type and self.object_id:
-            model = self.content_type.model_class()
+        if not self.service_id and self.content_type_id and self.object_id:
+            content_type = ContentType.objects.get_for_id(self.content_type_id)
 
-            try:
-                obj = model.objects.get(pk=self.object_id)
-            except model.DoesNotExist:
-                obj = None
-
-            if obj:
-                if hasattr(obj, "service_id"):
-                    logger.debug(f"{obj} has a 'service_id' attribute")
-
-                    self.service_id = obj.service_id
-
-                elif hasattr(obj, "employee") and obj.employee:
-                    logger.debug(
-                        f"{obj} has an 'employee' attribute hence must have a 'service_id' attribute"
-                    )
-
-                    self.service_id = obj.employee.service_id
+            self.service_id = resolve_service_id(content_type, self.object_id)
+            logger.debug(
+                f"{content_type.model}({self.object_id}) resolved to service_id {self.service_id}."
+            )
 
         super().save(*args, **kwargs)
 
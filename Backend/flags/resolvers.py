@@ -0,0 +1,82 @@
+import logging
+from django.db.models import F
+from django.db.models.functions import Coalesce
+
+logger = logging.getLogger(__name__)
+
+
+# Fields holding the owning employee's service ID, checked in order. Models not
+# listed here fall back to their "employee" foreign key, then "service_id".
+SERVICE_ID_FIELDS = {
+    # service_id on these models is the military service number
+    "service_with_forces.servicewithforces": ["employee_id"],
+    "service_with_forces.incompleteservicewithforcesrecords": ["employee_id"],
+}
+
+_service_id_fields_cache = {}
+
+
+def register_service_id_fields(model, fields):
+    SERVICE_ID_FIELDS[model._meta.label_lower] = list(fields)
+    _service_id_fields_cache.pop(model, None)
+
+
+def get_service_id_fields(model):
+    if model in _service_id_fields_cache:
+        return _service_id_fields_cache[model]
+
+    fields = SERVICE_ID_FIELDS.get(model._meta.label_lower)
+
+    if fields is None:
+        field_names = {field.name for field in model._meta.concrete_fields}
+        fields = []
+
+        if "employee" in field_names:
+            fields.append("employee_id")
+        if "service_id" in field_names:
+            fields.append("service_id")
+
+    _service_id_fields_cache[model] = fields
+    return fields
+
+
+def get_service_id_expression(model):
+    fields = get_service_id_fields(model)
+
+    if not fields:
+        return None
+    if len(fields) == 1:
+        return F(fields[0])
+
+    return Coalesce(*fields)
+
+
+def get_service_id(instance):
+    for field in get_service_id_fields(type(instance)):
+        service_id = getattr(instance, field, None)
+
+        if service_id:
+            return service_id
+
+    return None
+
+
+def resolve_service_id(content_type, object_id):
+    return resolve_service_ids(content_type, [object_id]).get(str(object_id))
+
+
+def resolve_service_ids(content_type, object_ids):
+    model = content_type.model_class()
+    expression = get_service_id_expression(model) if model else None
+
+    if expression is None or not object_ids:
+        return {}
+
+    # Only the resolved column is selected, one query for the whole batch
+    rows = (
+        model.objects.filter(pk__in=object_ids)
+        .order_by()
+        .values_list("pk", expression)
+    )
+
+    return {str(pk): service_id for pk, service_id in rows if service_id}
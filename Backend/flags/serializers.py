@@ -1,9 +1,24 @@
 from rest_framework import serializers
 from .models import Flags, FlagType
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Q
+from employees.models import Employee, UnregisteredEmployees
+from employees.profile import PROFILE_MODELS
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Employee records. Users, sessions, tokens and lookup tables cannot be flagged.
+FLAGGABLE_MODELS = [Employee, UnregisteredEmployees, *PROFILE_MODELS]
+
+
+def get_flaggable_content_types():
+    query = Q()
+    for model in FLAGGABLE_MODELS:
+        query |= Q(app_label=model._meta.app_label, model=model._meta.model_name)
+
+    return ContentType.objects.filter(query)
+
 
 class FlagWriteSerializer(serializers.ModelSerializer):
 
@@ -103,3 +118,41 @@ class FlagTypeSerializer(serializers.ModelSerializer):
                 )
 
         return value
+
+
+class BulkFlagSerializer(serializers.Serializer):
+    content_type = serializers.PrimaryKeyRelatedField(
+        queryset=get_flaggable_content_types()
+    )
+    object_ids = serializers.ListField(
+        child=serializers.CharField(max_length=7), allow_empty=False, max_length=1000
+    )
+
+    def validate(self, attrs):
+        model = attrs["content_type"].model_class()
+
+        if model is None:
+            logger.debug("Content Type does not have a model.")
+
+            raise serializers.ValidationError(
+                {"content_type": "Content Type does not have a model."}
+            )
+
+        object_ids = set(attrs["object_ids"])
+
+        try:
+            instances = list(model.objects.filter(pk__in=object_ids))
+        except (ValueError, TypeError):
+            logger.debug("Object IDs are invalid.")
+
+            raise serializers.ValidationError({"object_ids": "Object IDs are invalid."})
+
+        if len(instances) != len(object_ids):
+            logger.debug("One or more records do not exist.")
+
+            raise serializers.ValidationError(
+                {"object_ids": "One or more records do not exist."}
+            )
+
+        attrs["instances"] = instances
+        return attrs
@@ -1,72 +1,307 @@
 import logging
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
 from .models import Flags, FlagType
-from activity_feeds.models import ActivityFeeds
+from .resolvers import get_service_id, resolve_service_ids
+from .utils import generate_flag_created_text, generate_flag_deleted_text
+from activity_feeds.services import create_activity_feeds
+from api.models import CustomUser
+from datetime import timedelta
 from django.contrib.contenttypes.models import ContentType
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.core.cache import cache
+from django.db.models import Count, F, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce, Lower
+from employees.models import Employee
+from employees.services import invalidate_employee_profiles
+from work_queue.services import defer_work_item_removal, sync_work_items
 
 logger = logging.getLogger(__name__)
 
+_deferred_flag_counts = threading.local()
+
+LOOKUP_CACHE_TIMEOUT = 60 * 10
+
 
 def create_flag(instance, user):
-    flag_type = FlagType.objects.get(flag_type="Incomplete Record")
+    return create_flags([instance], user)[0]
 
-    flag = Flags.objects.create(
-        content_object=instance,
-        flag_type=flag_type,
-        field="All",
-        reason="Incomplete Record",
-        service_id=instance.service_id,
-        created_by=user,
-        updated_by=user,
-    )
 
-    logger.debug(f"Flags({flag}) created.")
+def create_flags(instances, user):
+    if not instances:
+        return []
 
-    model_name = flag.content_type.name.capitalize()
+    flag_type = FlagType.objects.get(flag_type="Incomplete Record")
 
-    flagged_field_text = (
-        f" — Flagged Field: {flag.field.replace('_', ' ').capitalize()}"
-        if flag.field
-        else "N/A"
+    # service_id is set explicitly as bulk_create does not call Flags.save()
+    flags = Flags.objects.bulk_create(
+        [
+            Flags(
+                content_object=instance,
+                flag_type=flag_type,
+                field="All",
+                reason="Incomplete Record",
+                service_id=get_service_id(instance),
+                created_by=user,
+                updated_by=user,
+            )
+            for instance in instances
+        ]
     )
+    logger.debug(f"Flags({', '.join(str(flag) for flag in flags)}) created.")
 
-    ActivityFeeds.objects.create(
-        creator=user,
-        activity=(
-            f"{model_name.replace('_', ' ')} was flagged by {user}: "
-            f"Flag Type: {flag.flag_type or 'N/A'}"
-            f"{flagged_field_text}"
-            f" — Reason: {flag.reason}"
-        ),
-    )
-    logger.debug(
-        f"Activity feed({model_name.replace('_', ' ')} was flagged by {user}: "
-        f"Flag Type: {flag.flag_type or 'N/A'}"
-        f"{flagged_field_text}"
-        f" — Reason: {flag.reason}"
+    Flags.objects.filter(pk__in=[flag.pk for flag in flags]).update(
+        search_vector=SearchVector("reason", weight="A", config="english")
     )
 
-    return flag
+    refresh_flag_counts(flag.service_id for flag in flags)
+    sync_work_items(flags)
+
+    activities = [generate_flag_created_text(user, flag) for flag in flags]
+    create_activity_feeds(user, activities)
+    logger.debug(f"Activity feed({' | '.join(activities)}) created.")
+
+    return flags
 
 
 def delete_flag(instance, id, user):
     content_type = ContentType.objects.get_for_model(instance)
     flags = Flags.objects.filter(content_type=content_type, object_id=id)
 
-    model = instance.__class__.__name__.lower()
-    model_name = ContentType.objects.get(model=model).name.capitalize()
+    return _delete_flags(flags, user)
+
+
+def delete_flags(instances, user):
+    object_ids = defaultdict(list)
+
+    for instance in instances:
+        content_type = ContentType.objects.get_for_model(instance)
+        object_ids[content_type].append(str(instance.pk))
+
+    if not object_ids:
+        return []
+
+    query = Q()
+    for content_type, ids in object_ids.items():
+        query |= Q(content_type=content_type, object_id__in=ids)
+
+    return _delete_flags(Flags.objects.filter(query), user)
+
+
+def _delete_flags(flags, user):
+    flags = list(flags.select_related("content_type", "flag_type"))
+
+    activities = [generate_flag_deleted_text(user, flag) for flag in flags]
+    create_activity_feeds(user, activities)
+    logger.debug(f"Activity feed({' | '.join(activities)}) created.")
+
+    with defer_flag_counts(), defer_work_item_removal():
+        Flags.objects.filter(id__in=[flag.id for flag in flags]).delete()
+
+    logger.debug("Flags deletion successful.")
+
+    return flags
+
+
+def backfill_flag_service_ids(batch_size=1000):
+    content_type_ids = (
+        Flags.objects.filter(service_id__isnull=True)
+        .order_by()
+        .values_list("content_type", flat=True)
+        .distinct()
+    )
+    updated = 0
+
+    for content_type_id in list(content_type_ids):
+        content_type = ContentType.objects.get_for_id(content_type_id)
+        last_id = 0
+
+        while True:
+            flags = list(
+                Flags.objects.filter(
+                    content_type=content_type, service_id__isnull=True, id__gt=last_id
+                )
+                .order_by("id")[:batch_size]
+            )
+
+            if not flags:
+                break
+
+            last_id = flags[-1].id
+            service_ids = resolve_service_ids(
+                content_type, [flag.object_id for flag in flags]
+            )
+
+            resolved = []
+            for flag in flags:
+                flag.service_id = service_ids.get(flag.object_id)
+
+                if flag.service_id:
+                    resolved.append(flag)
+
+            Flags.objects.bulk_update(resolved, ["service_id"])
+            refresh_flag_counts(flag.service_id for flag in resolved)
+            sync_work_items(resolved)
+
+            updated += len(resolved)
+
+    logger.debug(f"service_id back-filled on {updated} Flags.")
+
+    return updated
+
+
+def get_user_ids_cache_key(username):
+    return f"flags:user_ids:{username.strip().lower()}"
+
+
+def get_flag_type_ids_cache_key(flag_type):
+    return f"flags:flag_type_ids:{flag_type.strip().lower()}"
 
-    for flag in flags:
-        logger.debug(f"Flags({flag}) deleted.")
 
-        ActivityFeeds.objects.create(
-            creator=user,
-            activity=f"{model_name.replace('_', ' ')} flag was deleted by {user}. Flag Type: {flag.flag_type.flag_type.replace('_', ' ').capitalize() or 'N/A'} — Field: {flag.field.replace('_', ' ').capitalize() or 'N/A'} — Reason: {flag.reason or 'N/A'}",
+def get_user_ids(username):
+    cache_key = get_user_ids_cache_key(username)
+    user_ids = cache.get(cache_key)
+
+    if user_ids is None:
+        user_ids = list(
+            CustomUser.objects.alias(username_lower=Lower("username"))
+            .filter(username_lower=username.strip().lower())
+            .values_list("id", flat=True)
         )
+        cache.set(cache_key, user_ids, timeout=LOOKUP_CACHE_TIMEOUT)
+        logger.debug(f"User IDs for '{username}' cached.")
+
+    return user_ids
+
 
-        logger.debug(
-            f"Activity feed({model_name.replace('_', ' ')} flag was deleted by {user}. Flag Type: {flag.flag_type.flag_type.replace('_', ' ').capitalize() or 'N/A'} — Field: {flag.field.replace('_', ' ').capitalize() or 'N/A'} — Reason: {flag.reason or 'N/A'}) created."
+def get_flag_type_ids(flag_type):
+    cache_key = get_flag_type_ids_cache_key(flag_type)
+    flag_type_ids = cache.get(cache_key)
+
+    if flag_type_ids is None:
+        flag_type_ids = list(
+            FlagType.objects.alias(flag_type_lower=Lower("flag_type"))
+            .filter(flag_type_lower=flag_type.strip().lower())
+            .values_list("id", flat=True)
         )
+        cache.set(cache_key, flag_type_ids, timeout=LOOKUP_CACHE_TIMEOUT)
+        logger.debug(f"Flag type IDs for '{flag_type}' cached.")
 
-    Flags.objects.filter(id__in=[flag.id for flag in flags]).delete()
+    return flag_type_ids
 
-    logger.debug("Flags deletion successful.")
+
+def search_flags(
+    reason=None,
+    flag_type=None,
+    field=None,
+    created_by=None,
+    updated_by=None,
+    created_at=None,
+):
+    # Names are resolved to IDs up front so every predicate is a plain column
+    # comparison served by an index on flags, without joining users or flag_type
+    qs = Flags.objects.all()
+
+    if reason:
+        search_query = SearchQuery(reason, config="english")
+
+        qs = (
+            qs.annotate(rank=SearchRank(F("search_vector"), search_query))
+            .filter(search_vector=search_query, rank__gte=0.1)
+            .order_by("-rank")
+        )
+
+    if flag_type:
+        qs = qs.filter(flag_type__in=get_flag_type_ids(flag_type))
+
+    if field:
+        qs = qs.alias(field_lower=Lower("field")).filter(
+            field_lower=field.strip().lower()
+        )
+
+    if created_by:
+        qs = qs.filter(created_by__in=get_user_ids(created_by))
+
+    if updated_by:
+        qs = qs.filter(updated_by__in=get_user_ids(updated_by))
+
+    if created_at:
+        qs = qs.filter(
+            created_at__gte=created_at, created_at__lt=created_at + timedelta(days=1)
+        )
+
+    return qs.order_by("-created_at")
+
+
+def get_flag_summary(service_id):
+    rows = (
+        Flags.objects.filter(service_id=service_id)
+        .order_by()
+        .values("content_type", "flag_type__flag_type")
+        .annotate(total=Count("id"))
+    )
+
+    by_flag_type = defaultdict(int)
+    by_model = defaultdict(int)
+
+    for row in rows:
+        flag_type = row["flag_type__flag_type"] or "N/A"
+        model_name = ContentType.objects.get_for_id(row["content_type"]).name
+
+        by_flag_type[flag_type] += row["total"]
+        by_model[model_name.replace("_", " ").capitalize()] += row["total"]
+
+    return {
+        "service_id": service_id,
+        "total": sum(by_flag_type.values()),
+        "by_flag_type": dict(by_flag_type),
+        "by_model": dict(by_model),
+    }
+
+
+def refresh_flag_counts(service_ids):
+    service_ids = {service_id for service_id in service_ids if service_id}
+
+    if not service_ids:
+        return
+
+    # Recount instead of incrementing so the denormalized value cannot drift
+    flag_count = (
+        Flags.objects.filter(service_id=OuterRef("pk"))
+        .order_by()
+        .values("service_id")
+        .annotate(total=Count("id"))
+        .values("total")
+    )
+
+    Employee.objects.filter(pk__in=service_ids).update(
+        flag_count=Coalesce(Subquery(flag_count), 0)
+    )
+    # update() sends no signals, and flag_count is part of the cached employee
+    invalidate_employee_profiles(service_ids)
+    logger.debug(f"Flag count refreshed for Employee({', '.join(service_ids)}).")
+
+
+def schedule_flag_count_refresh(*service_ids):
+    deferred = getattr(_deferred_flag_counts, "service_ids", None)
+
+    if deferred is None:
+        refresh_flag_counts(service_ids)
+    else:
+        deferred.update(service_ids)
+
+
+@contextmanager
+def defer_flag_counts():
+    # Collects the service IDs touched by Flags signals inside the block and
+    # refreshes them with one UPDATE when it exits
+    _deferred_flag_counts.service_ids = set()
+
+    try:
+        yield
+        service_ids = _deferred_flag_counts.service_ids
+    finally:
+        _deferred_flag_counts.service_ids = None
+
+    refresh_flag_counts(service_ids)
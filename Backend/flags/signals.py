@@ -1,7 +1,15 @@
-from django.db.models.signals import post_save
+from django.db.models.signals import post_save, pre_save, post_delete
 from django.dispatch import receiver
 from django.contrib.postgres.search import SearchVector
-from .models import Flags
+from django.core.cache import cache
+from .models import Flags, FlagType
+from .services import (
+    get_flag_type_ids_cache_key,
+    get_user_ids_cache_key,
+    schedule_flag_count_refresh,
+)
+from api.models import CustomUser
+from employees.models import Employee
 
 
 @receiver(post_save, sender=Flags)
@@ -9,3 +17,81 @@ def update_flags_search_vector(sender, instance, **kwargs):
     sender.objects.filter(pk=instance.pk).update(
         search_vector=SearchVector("reason", weight="A", config="english")
     )
+
+
+@receiver(pre_save, sender=Flags)
+def track_previous_flag_service_id(sender, instance, **kwargs):
+    if instance.pk:
+        instance._previous_service_id = (
+            sender.objects.filter(pk=instance.pk)
+            .values_list("service_id", flat=True)
+            .first()
+        )
+
+
+@receiver(post_save, sender=Flags)
+def handle_flag_save(sender, instance, created, **kwargs):
+    previous_service_id = getattr(instance, "_previous_service_id", None)
+
+    if created or previous_service_id != instance.service_id:
+        schedule_flag_count_refresh(instance.service_id, previous_service_id)
+
+
+@receiver(post_delete, sender=Flags)
+def handle_flag_delete(sender, instance, **kwargs):
+    schedule_flag_count_refresh(instance.service_id)
+
+
+@receiver(post_save, sender=Employee)
+def handle_flagged_employee_save(sender, instance, update_fields=None, **kwargs):
+    # Records can be flagged before the employee they belong to is registered,
+    # and a full save writes back the flag_count the instance was loaded with,
+    # e.g. by an edit running while flags change, so both are recounted
+    if update_fields is None or "flag_count" in update_fields:
+        schedule_flag_count_refresh(instance.service_id)
+
+
+@receiver(pre_save, sender=CustomUser)
+def track_previous_username(sender, instance, **kwargs):
+    if instance.pk:
+        instance._previous_username = (
+            sender.objects.filter(pk=instance.pk)
+            .values_list("username", flat=True)
+            .first()
+        )
+
+
+@receiver([post_save, post_delete], sender=CustomUser)
+def clear_cached_user_ids(sender, instance, **kwargs):
+    usernames = {instance.username}
+
+    # A rename leaves the old username resolving to this user otherwise
+    previous_username = getattr(instance, "_previous_username", None)
+    if previous_username:
+        usernames.add(previous_username)
+
+    cache.delete_many([get_user_ids_cache_key(username) for username in usernames])
+
+
+@receiver(pre_save, sender=FlagType)
+def track_previous_flag_type(sender, instance, **kwargs):
+    if instance.pk:
+        instance._previous_flag_type = (
+            sender.objects.filter(pk=instance.pk)
+            .values_list("flag_type", flat=True)
+            .first()
+        )
+
+
+@receiver([post_save, post_delete], sender=FlagType)
+def clear_cached_flag_type_ids(sender, instance, **kwargs):
+    flag_types = {instance.flag_type}
+
+    # A rename leaves the old name resolving to this flag type otherwise
+    previous_flag_type = getattr(instance, "_previous_flag_type", None)
+    if previous_flag_type:
+        flag_types.add(previous_flag_type)
+
+    cache.delete_many(
+        [get_flag_type_ids_cache_key(flag_type) for flag_type in flag_types]
+    )
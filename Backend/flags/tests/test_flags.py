@@ -1,9 +1,19 @@
+from datetime import timedelta
+from io import StringIO
+from django.core.cache import cache
+from django.core.management import call_command
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework import status
 from activity_feeds.models import ActivityFeeds
 from employees.tests.base import EmployeeBaseAPITestCase
 from django.contrib.contenttypes.models import ContentType
-from flags.models import FlagType
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from flags.models import FlagType, Flags
+from flags.services import get_flag_type_ids_cache_key, get_user_ids_cache_key
+from work_queue.models import WorkItem
+from employees.models import Employee, UnregisteredEmployees
 
 
 class CreateFlagsAPITest(EmployeeBaseAPITestCase):
@@ -401,3 +411,483 @@ class DeleteFlagAPITest(EmployeeBaseAPITestCase):
 
         # Assertions
         self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+
+class BulkCreateFlagsAPITest(EmployeeBaseAPITestCase):
+
+    def setUp(self):
+        self.bulk_create_flags_url = reverse("bulk-create-flags")
+
+        self.flag_type = FlagType.objects.create(flag_type="Incomplete Record")
+
+        self.records = [
+            UnregisteredEmployees.objects.create(service_id="00099" + str(number))
+            for number in range(3)
+        ]
+        self.content_type = ContentType.objects.get(model="unregisteredemployees").id
+
+        self.authenticate_admin()
+
+    def test_successful_bulk_flag_creation(self):
+        self.flag_data = {
+            "content_type": self.content_type,
+            "object_ids": [str(record.id) for record in self.records],
+        }
+
+        # Send bulk create flag request
+        response = self.client.post(
+            self.bulk_create_flags_url, self.flag_data, format="json"
+        )
+
+        # Get Activity feeds
+        activity_feeds = ActivityFeeds.objects.all()
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data), 3)
+        self.assertEqual(
+            sorted(flag["service_id"] for flag in response.data),
+            ["000990", "000991", "000992"],
+        )
+        self.assertEqual(activity_feeds.count(), 3)
+        self.assertIn("was flagged by", activity_feeds.last().activity)
+        self.assertFalse(Flags.objects.filter(search_vector__isnull=True).exists())
+        self.assertFalse(
+            ActivityFeeds.objects.filter(search_vector__isnull=True).exists()
+        )
+
+    def test_non_existing_records(self):
+        self.flag_data = {
+            "content_type": self.content_type,
+            "object_ids": [str(self.records[0].id), "0"],
+        }
+
+        # Send bulk create flag request
+        response = self.client.post(
+            self.bulk_create_flags_url, self.flag_data, format="json"
+        )
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Flags.objects.count(), 0)
+        self.assertEqual(ActivityFeeds.objects.count(), 0)
+
+    def test_content_type_not_flaggable(self):
+        self.flag_data = {
+            "content_type": ContentType.objects.get(model="customuser").id,
+            "object_ids": [str(self.admin.id)],
+        }
+
+        # Send bulk create flag request
+        response = self.client.post(
+            self.bulk_create_flags_url, self.flag_data, format="json"
+        )
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("content_type", response.data)
+        self.assertEqual(Flags.objects.count(), 0)
+
+    def test_empty_object_ids(self):
+        self.flag_data = {"content_type": self.content_type, "object_ids": []}
+
+        # Send bulk create flag request
+        response = self.client.post(
+            self.bulk_create_flags_url, self.flag_data, format="json"
+        )
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Flags.objects.count(), 0)
+
+
+class BulkDeleteFlagsAPITest(EmployeeBaseAPITestCase):
+
+    def setUp(self):
+        self.bulk_create_flags_url = reverse("bulk-create-flags")
+        self.bulk_delete_flags_url = reverse("bulk-delete-flags")
+
+        self.flag_type = FlagType.objects.create(flag_type="Incomplete Record")
+
+        self.records = [
+            UnregisteredEmployees.objects.create(service_id="00099" + str(number))
+            for number in range(3)
+        ]
+        self.content_type = ContentType.objects.get(model="unregisteredemployees").id
+
+        self.authenticate_admin()
+
+    def test_successful_bulk_flag_deletion(self):
+        self.client.post(
+            self.bulk_create_flags_url,
+            {
+                "content_type": self.content_type,
+                "object_ids": [str(record.id) for record in self.records],
+            },
+            format="json",
+        )
+
+        # Send bulk delete flag request
+        response = self.client.post(
+            self.bulk_delete_flags_url,
+            {
+                "content_type": self.content_type,
+                "object_ids": [str(record.id) for record in self.records[:2]],
+            },
+            format="json",
+        )
+
+        # Get delete activity feed
+        activity_feed = ActivityFeeds.objects.last().activity
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["deleted"], 2)
+        self.assertEqual(Flags.objects.count(), 1)
+        self.assertEqual(Flags.objects.get().object_id, str(self.records[2].id))
+        self.assertIn("flag was deleted by", activity_feed)
+        self.assertIn("Flag Type", activity_feed)
+        self.assertIn("Reason", activity_feed)
+
+    def test_bulk_deletion_removes_work_items_at_once(self):
+        # Flags on incomplete records share the record's work item, so flag
+        # registered employees instead
+        employees = [
+            Employee.objects.create(
+                service_id=record.service_id,
+                last_name="Kana",
+                other_names="Steve",
+                gender=self.gender,
+                unit=self.unit,
+                grade=self.grade,
+                station="Accra",
+                structure=self.structure,
+                social_security="C019000819236",
+                category="Junior",
+                appointment_date="2025-11-25",
+            )
+            for record in self.records
+        ]
+        content_type = ContentType.objects.get_for_model(Employee).id
+        flag_content_type = ContentType.objects.get_for_model(Flags)
+
+        self.client.post(
+            self.bulk_create_flags_url,
+            {
+                "content_type": content_type,
+                "object_ids": [employee.service_id for employee in employees],
+            },
+            format="json",
+        )
+
+        # Assertions
+        self.assertEqual(
+            WorkItem.objects.filter(content_type=flag_content_type).count(), 3
+        )
+
+        # Send bulk delete flag request
+        with CaptureQueriesContext(connection) as context:
+            self.client.post(
+                self.bulk_delete_flags_url,
+                {
+                    "content_type": content_type,
+                    "object_ids": [employee.service_id for employee in employees],
+                },
+                format="json",
+            )
+
+        # Assertions
+        self.assertEqual(
+            len(
+                [
+                    query
+                    for query in context.captured_queries
+                    if query["sql"].startswith('DELETE FROM "work_items"')
+                ]
+            ),
+            1,
+        )
+        self.assertFalse(
+            WorkItem.objects.filter(content_type=flag_content_type).exists()
+        )
+
+
+class SearchFlagsAPITest(EmployeeBaseAPITestCase):
+
+    def setUp(self):
+        self.bulk_create_flags_url = reverse("bulk-create-flags")
+        self.search_flags_url = reverse("search-flags")
+
+        # Renames are rolled back without signals, so start from an empty cache
+        cache.delete_many(
+            [
+                get_user_ids_cache_key(username)
+                for username in ["admin", "administrator"]
+            ]
+            + [
+                get_flag_type_ids_cache_key(flag_type)
+                for flag_type in ["incomplete record", "missing record"]
+            ]
+        )
+
+        self.flag_type = FlagType.objects.create(flag_type="Incomplete Record")
+
+        self.records = [
+            UnregisteredEmployees.objects.create(service_id="00099" + str(number))
+            for number in range(2)
+        ]
+
+        self.authenticate_admin()
+
+        self.client.post(
+            self.bulk_create_flags_url,
+            {
+                "content_type": ContentType.objects.get(
+                    model="unregisteredemployees"
+                ).id,
+                "object_ids": [str(record.id) for record in self.records],
+            },
+            format="json",
+        )
+
+    def test_search_flags_with_combined_filters(self):
+        # Send search flags request
+        response = self.client.get(
+            self.search_flags_url,
+            {
+                "flag_type": "incomplete record",
+                "field": "ALL",
+                "created_by": " admin ",
+                "updated_by": "ADMIN",
+                "created_at": timezone.localdate().isoformat(),
+            },
+        )
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 2)
+
+    def test_search_flags_with_unknown_user(self):
+        # Send search flags request
+        response = self.client.get(self.search_flags_url, {"created_by": "nobody"})
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 0)
+
+    def test_search_flags_after_user_renamed(self):
+        # Send search flags request
+        self.client.get(self.search_flags_url, {"created_by": "admin"})
+
+        self.admin.username = "Administrator"
+        self.admin.save()
+
+        # Send search flags requests
+        previous_response = self.client.get(
+            self.search_flags_url, {"created_by": "admin"}
+        )
+        response = self.client.get(
+            self.search_flags_url, {"created_by": "administrator"}
+        )
+
+        # Assertions
+        self.assertEqual(previous_response.data["count"], 0)
+        self.assertEqual(response.data["count"], 2)
+
+    def test_search_flags_after_flag_type_renamed(self):
+        # Send search flags request
+        self.client.get(self.search_flags_url, {"flag_type": "incomplete record"})
+
+        self.flag_type.flag_type = "Missing Record"
+        self.flag_type.save()
+
+        # Send search flags requests
+        previous_response = self.client.get(
+            self.search_flags_url, {"flag_type": "incomplete record"}
+        )
+        response = self.client.get(
+            self.search_flags_url, {"flag_type": "missing record"}
+        )
+
+        # Assertions
+        self.assertEqual(previous_response.data["count"], 0)
+        self.assertEqual(response.data["count"], 2)
+
+    def test_search_flags_on_another_day(self):
+        yesterday = timezone.localdate() - timedelta(days=1)
+
+        # Send search flags request
+        response = self.client.get(
+            self.search_flags_url, {"created_at": yesterday.isoformat()}
+        )
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 0)
+
+
+class EmployeeFlagSummaryAPITest(EmployeeBaseAPITestCase):
+
+    def setUp(self):
+        self.create_employee_url = reverse("create-employee")
+        self.create_flag_url = reverse("create-flag")
+        self.bulk_create_flags_url = reverse("bulk-create-flags")
+        self.bulk_delete_flags_url = reverse("bulk-delete-flags")
+        self.flag_summary_url = reverse("employee-flag-summary", kwargs={"pk": "000993"})
+
+        self.flag_type = FlagType.objects.create(flag_type="Incomplete Record")
+        self.unregistered_employee = UnregisteredEmployees.objects.create(
+            service_id="000993"
+        )
+
+        self.authenticate_admin()
+
+    def test_flag_summary_and_flag_count(self):
+        # Flag the incomplete record before the employee is registered
+        self.client.post(
+            self.bulk_create_flags_url,
+            {
+                "content_type": ContentType.objects.get(
+                    model="unregisteredemployees"
+                ).id,
+                "object_ids": [str(self.unregistered_employee.id)],
+            },
+            format="json",
+        )
+
+        # Send create employee request
+        self.client.post(self.create_employee_url, self.employee_data, format="json")
+
+        # Send create flag request
+        self.client.post(
+            self.create_flag_url,
+            {
+                "content_type": ContentType.objects.get(model="employee").id,
+                "object_id": "000993",
+                "flag_type": self.flag_type.id,
+                "field": "date of birth",
+                "reason": "Employee data is invalid",
+            },
+            format="json",
+        )
+
+        # Send flag summary request
+        response = self.client.get(self.flag_summary_url)
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["total"], 2)
+        self.assertEqual(response.data["by_flag_type"], {"Incomplete Record": 2})
+        self.assertEqual(
+            response.data["by_model"],
+            {"Employee": 1, "Unregistered employees": 1},
+        )
+        self.assertEqual(Employee.objects.get(pk="000993").flag_count, 2)
+
+        # Send bulk delete flag request
+        self.client.post(
+            self.bulk_delete_flags_url,
+            {
+                "content_type": ContentType.objects.get(
+                    model="unregisteredemployees"
+                ).id,
+                "object_ids": [str(self.unregistered_employee.id)],
+            },
+            format="json",
+        )
+
+        # Assertions
+        self.assertEqual(Employee.objects.get(pk="000993").flag_count, 1)
+
+    def test_stale_employee_save_keeps_flag_count(self):
+        # Send create employee request
+        self.client.post(self.create_employee_url, self.employee_data, format="json")
+        employee = Employee.objects.get(pk="000993")
+
+        # Send create flag request
+        self.client.post(
+            self.create_flag_url,
+            {
+                "content_type": ContentType.objects.get(model="employee").id,
+                "object_id": "000993",
+                "flag_type": self.flag_type.id,
+                "field": "date of birth",
+                "reason": "Employee data is invalid",
+            },
+            format="json",
+        )
+
+        employee.station = "Kumasi"
+        employee.save()
+
+        # Assertions
+        self.assertEqual(employee.flag_count, 0)
+        self.assertEqual(Employee.objects.get(pk="000993").flag_count, 1)
+
+    def test_flag_summary_without_flags(self):
+        # Send flag summary request
+        response = self.client.get(self.flag_summary_url)
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["total"], 0)
+        self.assertEqual(response.data["by_flag_type"], {})
+
+
+class BackfillFlagServiceIdTest(EmployeeBaseAPITestCase):
+
+    def setUp(self):
+        self.create_employee_url = reverse("create-employee")
+
+        self.flag_type = FlagType.objects.create(flag_type="Incomplete Record")
+        self.unregistered_employee = UnregisteredEmployees.objects.create(
+            service_id="000993"
+        )
+
+        self.authenticate_admin()
+
+    def test_flag_save_resolves_service_id(self):
+        # Send create employee request
+        self.client.post(self.create_employee_url, self.employee_data, format="json")
+
+        flag = Flags.objects.create(
+            content_type=ContentType.objects.get(model="unregisteredemployees"),
+            object_id=str(self.unregistered_employee.id),
+            flag_type=self.flag_type,
+            reason="Incomplete Record",
+        )
+
+        # Assertions
+        self.assertEqual(flag.service_id, "000993")
+        self.assertEqual(Employee.objects.get(pk="000993").flag_count, 1)
+
+    def test_backfill_flag_service_ids(self):
+        # Send create employee request
+        self.client.post(self.create_employee_url, self.employee_data, format="json")
+
+        # bulk_create skips Flags.save(), leaving service_id empty
+        Flags.objects.bulk_create(
+            [
+                Flags(
+                    content_type=ContentType.objects.get(model="employee"),
+                    object_id="000993",
+                    flag_type=self.flag_type,
+                    reason="Employee data is invalid",
+                ),
+                Flags(
+                    content_type=ContentType.objects.get(
+                        model="unregisteredemployees"
+                    ),
+                    object_id=str(self.unregistered_employee.id),
+                    flag_type=self.flag_type,
+                    reason="Incomplete Record",
+                ),
+            ]
+        )
+
+        call_command("backfill_flag_service_ids", stdout=StringIO())
+
+        # Assertions
+        self.assertFalse(Flags.objects.filter(service_id__isnull=True).exists())
+        self.assertEqual(Flags.objects.filter(service_id="000993").count(), 2)
+        self.assertEqual(Employee.objects.get(pk="000993").flag_count, 2)
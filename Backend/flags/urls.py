@@ -5,8 +5,19 @@ urlpatterns = [
     path("", views.ListFlagsAPIView.as_view(), name="list-flags"),
     path("search/", views.SearchFlagsAPIView.as_view(), name="search-flags"),
     path("create/", views.CreateFlagsAPIView.as_view(), name="create-flag"),
+    path(
+        "bulk/create/", views.BulkCreateFlagsAPIView.as_view(), name="bulk-create-flags"
+    ),
+    path(
+        "bulk/delete/", views.BulkDeleteFlagsAPIView.as_view(), name="bulk-delete-flags"
+    ),
     path("<str:pk>/detail/", views.RetrieveFlagAPIView.as_view(), name="retrieve-flag"),
     path("<str:pk>/edit/", views.EditFlagsAPIView.as_view(), name="edit-flag"),
+    path(
+        "<str:pk>/employee/summary/",
+        views.EmployeeFlagSummaryAPIView.as_view(),
+        name="employee-flag-summary",
+    ),
     path("<str:pk>/delete/", views.DeleteFlagsAPIView.as_view(), name="delete-flag"),
     # flag type
     path("type/", views.ListFlagTypeAPIView.as_view(), name="list-flag-type"),
@@ -47,3 +47,33 @@ def generate_changes_text(model_name, user, previous_flag, current_flag):
     )
 
     return changes_text
+
+
+def generate_flag_created_text(user, flag):
+    model_name = flag.content_type.name.capitalize()
+
+    flagged_field_text = (
+        f" — Flagged Field: {flag.field.replace('_', ' ').capitalize()}"
+        if flag.field
+        else "N/A"
+    )
+
+    return (
+        f"{model_name.replace('_', ' ')} was flagged by {user}: "
+        f"Flag Type: {flag.flag_type or 'N/A'}"
+        f"{flagged_field_text}"
+        f" — Reason: {flag.reason}"
+    )
+
+
+def generate_flag_deleted_text(user, flag):
+    model_name = flag.content_type.name.capitalize()
+    flag_type = flag.flag_type.flag_type if flag.flag_type else ""
+    field = flag.field or ""
+
+    return (
+        f"{model_name.replace('_', ' ')} flag was deleted by {user}. "
+        f"Flag Type: {flag_type.replace('_', ' ').capitalize() or 'N/A'}"
+        f" — Field: {field.replace('_', ' ').capitalize() or 'N/A'}"
+        f" — Reason: {flag.reason or 'N/A'}"
+    )
@@ -1,8 +1,13 @@
 from rest_framework import generics
-from .serializers import FlagReadSerializer, FlagWriteSerializer, FlagTypeSerializer
+from .serializers import (
+    FlagReadSerializer,
+    FlagWriteSerializer,
+    FlagTypeSerializer,
+    BulkFlagSerializer,
+)
 from .models import Flags, FlagType
 from rest_framework.permissions import IsAuthenticated, IsAdminUser
-from rest_framework.throttling import UserRateThrottle
+from api.throttles import BulkThrottle, SearchThrottle, WriteThrottle
 import logging
 from activity_feeds.models import ActivityFeeds
 from employees.permissions import IsAdminUserOrStandardUser
@@ -12,8 +17,10 @@ from django.db import transaction
 from datetime import datetime
 from django.utils import timezone
 from rest_framework.exceptions import ValidationError
-from django.contrib.postgres.search import SearchQuery, SearchRank
-from django.db.models import F
+from rest_framework.response import Response
+from rest_framework import status
+from rest_framework.views import APIView
+from .services import create_flags, delete_flags, get_flag_summary, search_flags
 
 logger = logging.getLogger(__name__)
 
@@ -22,7 +29,7 @@ class CreateFlagsAPIView(generics.CreateAPIView):
     queryset = Flags.objects.all()
     serializer_class = FlagWriteSerializer
     permission_classes = [IsAdminUserOrStandardUser, IsAuthenticated]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
@@ -92,7 +99,7 @@ class EditFlagsAPIView(generics.UpdateAPIView):
     lookup_field = "pk"
     serializer_class = FlagWriteSerializer
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def update(self, request, *args, **kwargs):
         partial = kwargs.pop("partial", False)
@@ -130,7 +137,7 @@ class DeleteFlagsAPIView(generics.DestroyAPIView):
     lookup_field = "pk"
     serializer_class = FlagWriteSerializer
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def perform_destroy(self, instance):
         with transaction.atomic():
@@ -149,7 +156,7 @@ class DeleteFlagsAPIView(generics.DestroyAPIView):
 
 class SearchFlagsAPIView(generics.ListAPIView):
     serializer_class = FlagReadSerializer
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [SearchThrottle]
     permission_classes = [IsAuthenticated]
     pagination_class = LargeResultsSetPagination
 
@@ -165,40 +172,64 @@ class SearchFlagsAPIView(generics.ListAPIView):
             raise ValidationError({"detail": f"Invalid date format: {date_str}"})
 
     def get_queryset(self):
-        reason = self.request.query_params.get("reason")
-        flag_type = self.request.query_params.get("flag_type")
-        field = self.request.query_params.get("field")
-        created_by = self.request.query_params.get("created_by")
-        updated_by = self.request.query_params.get("updated_by")
-        created_at = self.parse_date(self.request.query_params.get("created_at"))
-
-        qs = Flags.objects.all()
-
-        if reason:
-            search_query = SearchQuery(reason, config="english")
-
-            qs = (
-                qs.annotate(rank=SearchRank(F("search_vector"), search_query))
-                .filter(search_vector=search_query, rank__gte=0.1)
-                .order_by("-rank")
+        return search_flags(
+            reason=self.request.query_params.get("reason"),
+            flag_type=self.request.query_params.get("flag_type"),
+            field=self.request.query_params.get("field"),
+            created_by=self.request.query_params.get("created_by"),
+            updated_by=self.request.query_params.get("updated_by"),
+            created_at=self.parse_date(self.request.query_params.get("created_at")),
+        )
+
+
+class EmployeeFlagSummaryAPIView(APIView):
+    http_method_names = ["get"]
+    permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
+    throttle_classes = []
+
+    def get(self, request, *args, **kwargs):
+        service_id = self.kwargs.get("pk")
+        summary = get_flag_summary(service_id)
+
+        return Response(summary, status=status.HTTP_200_OK)
+
+
+class BulkCreateFlagsAPIView(generics.GenericAPIView):
+    serializer_class = BulkFlagSerializer
+    permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
+    throttle_classes = [BulkThrottle]
+
+    def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        with transaction.atomic():
+            flags = create_flags(
+                serializer.validated_data["instances"], self.request.user
             )
+            logger.debug(f"{len(flags)} Flags created.")
 
-        if flag_type:
-            qs = qs.filter(flag_type__flag_type__iexact=flag_type)
+        read_serializer = FlagReadSerializer(flags, many=True)
 
-        if field:
-            qs = qs.filter(field__iexact=field)
+        return Response(read_serializer.data, status=status.HTTP_201_CREATED)
 
-        if created_by:
-            qs = qs.filter(created_by__username__iexact=created_by.strip())
 
-        if updated_by:
-            qs = qs.filter(updated_by__username__iexact=updated_by.strip())
+class BulkDeleteFlagsAPIView(generics.GenericAPIView):
+    serializer_class = BulkFlagSerializer
+    permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
+    throttle_classes = [BulkThrottle]
 
-        if created_at:
-            qs = qs.filter(created_at__date=created_at.date())
+    def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        with transaction.atomic():
+            flags = delete_flags(
+                serializer.validated_data["instances"], self.request.user
+            )
+            logger.debug(f"{len(flags)} Flags deleted.")
 
-        return qs.order_by("-created_at")
+        return Response({"deleted": len(flags)}, status=status.HTTP_200_OK)
 
 
 # FLAG TYPE
@@ -206,7 +237,7 @@ class CreateFlagTypeAPIView(generics.CreateAPIView):
     queryset = FlagType.objects.all()
     serializer_class = FlagTypeSerializer
     permission_classes = [IsAuthenticated, IsAdminUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def perform_create(self, serializer):
         with transaction.atomic():
@@ -243,7 +274,7 @@ class EditFlagTypeAPIView(generics.UpdateAPIView):
     lookup_field = "pk"
     serializer_class = FlagTypeSerializer
     permission_classes = [IsAuthenticated, IsAdminUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def perform_update(self, serializer):
         with transaction.atomic():
@@ -268,7 +299,7 @@ class DeleteFlagTypeAPIView(generics.DestroyAPIView):
     lookup_field = "pk"
     serializer_class = FlagTypeSerializer
     permission_classes = [IsAuthenticated, IsAdminUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def perform_destroy(self, instance):
         with transaction.atomic():
@@ -2,7 +2,7 @@ from rest_framework import generics
 import logging
 from . import serializers
 from .models import Identity
-from rest_framework.throttling import UserRateThrottle
+from api.throttles import WriteThrottle
 from rest_framework.permissions import IsAuthenticated
 from employees.permissions import IsAdminUserOrStandardUser
 from activity_feeds.models import ActivityFeeds
@@ -11,6 +11,7 @@ from .utils import identity_record_changes
 from rest_framework.response import Response
 from rest_framework import status
 from django.db import transaction
+from employees.views import EmployeeResponseCacheMixin
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +19,7 @@ logger = logging.getLogger(__name__)
 class CreateIdentityAPIView(generics.CreateAPIView):
     serializer_class = serializers.IdentityWriteSerializer
     queryset = Identity.objects.all()
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
 
     def create(self, request, *args, **kwargs):
@@ -53,7 +54,7 @@ class EditIdentityAPIView(generics.UpdateAPIView):
     queryset = Identity.objects.all()
     serializer_class = serializers.IdentityWriteSerializer
     lookup_field = "pk"
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
 
     def update(self, request, *args, **kwargs):
@@ -88,7 +89,10 @@ class EditIdentityAPIView(generics.UpdateAPIView):
                 )
 
 
-class RetrieveEmployeeIdentityAPIView(generics.RetrieveAPIView):
+class RetrieveEmployeeIdentityAPIView(
+    EmployeeResponseCacheMixin, generics.RetrieveAPIView
+):
+    cache_resource = "identity"
     serializer_class = serializers.IdentityReadSerializer
     lookup_field = "pk"
     throttle_classes = []
@@ -106,7 +110,7 @@ class DeleteIdentityAPIView(generics.DestroyAPIView):
     queryset = Identity.objects.all()
     serializer_class = serializers.IdentityWriteSerializer
     lookup_field = "pk"
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
 
     def perform_destroy(self, instance):
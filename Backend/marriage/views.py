@@ -2,7 +2,7 @@ from rest_framework import generics
 import logging
 from . import serializers
 from .models import Spouse
-from rest_framework.throttling import UserRateThrottle
+from api.throttles import WriteThrottle
 from rest_framework.permissions import IsAuthenticated
 from employees.permissions import IsAdminUserOrStandardUser
 from activity_feeds.models import ActivityFeeds
@@ -12,6 +12,7 @@ from .utils import spouse_record_changes
 from django.db import transaction
 from rest_framework.response import Response
 from rest_framework import status
+from employees.views import EmployeeResponseCacheMixin
 
 logger = logging.getLogger(__name__)
 
@@ -19,7 +20,7 @@ logger = logging.getLogger(__name__)
 class CreateSpouseAPIView(generics.CreateAPIView):
     serializer_class = serializers.SpouseWriteSerializer
     queryset = Spouse.objects.all()
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
 
     def create(self, request, *args, **kwargs):
@@ -53,7 +54,7 @@ class EditSpouseAPIView(generics.UpdateAPIView):
     queryset = Spouse.objects.all()
     serializer_class = serializers.SpouseWriteSerializer
     lookup_field = "pk"
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
 
     def update(self, request, *args, **kwargs):
@@ -86,7 +87,8 @@ class EditSpouseAPIView(generics.UpdateAPIView):
                 )
 
 
-class ListEmployeeSpouseAPIView(generics.ListAPIView):
+class ListEmployeeSpouseAPIView(EmployeeResponseCacheMixin, generics.ListAPIView):
+    cache_resource = "spouse"
     serializer_class = serializers.SpouseReadSerializer
     throttle_classes = []
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
@@ -110,7 +112,7 @@ class DeleteSpouseAPIView(generics.DestroyAPIView):
     queryset = Spouse.objects.all()
     serializer_class = serializers.SpouseWriteSerializer
     lookup_field = "pk"
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
 
     def perform_destroy(self, instance):
@@ -2,7 +2,7 @@ from rest_framework import generics
 import logging
 from . import serializers
 from .models import EmergencyOrNextOfKin
-from rest_framework.throttling import UserRateThrottle
+from api.throttles import WriteThrottle
 from rest_framework.permissions import IsAuthenticated
 from employees.permissions import IsAdminUserOrStandardUser
 from activity_feeds.models import ActivityFeeds
@@ -12,6 +12,7 @@ from .utils import next_of_kin_record_changes
 from rest_framework.response import Response
 from rest_framework import status
 from django.db import transaction
+from employees.views import EmployeeResponseCacheMixin
 
 logger = logging.getLogger(__name__)
 
@@ -19,7 +20,7 @@ logger = logging.getLogger(__name__)
 class CreateNextOfKinAPIView(generics.CreateAPIView):
     serializer_class = serializers.EmergencyOrNextOfKinWriteSerializer
     queryset = EmergencyOrNextOfKin.objects.all()
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
 
     def create(self, request, *args, **kwargs):
@@ -54,7 +55,7 @@ class EditNextOfKinAPIView(generics.UpdateAPIView):
     queryset = EmergencyOrNextOfKin.objects.all()
     serializer_class = serializers.EmergencyOrNextOfKinWriteSerializer
     lookup_field = "pk"
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
 
     def update(self, request, *args, **kwargs):
@@ -92,7 +93,8 @@ class EditNextOfKinAPIView(generics.UpdateAPIView):
                 )
 
 
-class ListEmployeeNextOfKinAPIView(generics.ListAPIView):
+class ListEmployeeNextOfKinAPIView(EmployeeResponseCacheMixin, generics.ListAPIView):
+    cache_resource = "next_of_kin"
     serializer_class = serializers.EmergencyOrNextOfKinReadSerializer
     throttle_classes = []
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
@@ -116,7 +118,7 @@ class DeleteNextOfKinAPIView(generics.DestroyAPIView):
     queryset = EmergencyOrNextOfKin.objects.all()
     serializer_class = serializers.EmergencyOrNextOfKinWriteSerializer
     lookup_field = "pk"
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
 
     def perform_destroy(self, instance):
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class OccuranceConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "occurance"
+
+    def ready(self):
+        import occurance.signals
+        import occurance.reconciliation
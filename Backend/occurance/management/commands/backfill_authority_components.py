@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+from occurance.models import IncompleteOccurrence, Occurrence
+from occurance.services import backfill_authority_components
+
+
+class Command(BaseCommand):
+    help = "Parse the authority serial number and year of existing occurrences"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        for model in [Occurrence, IncompleteOccurrence]:
+            updated = backfill_authority_components(
+                model, batch_size=options["batch_size"]
+            )
+
+            self.stdout.write(
+                self.style.SUCCESS(f"{model._meta.verbose_name}: {updated} back-filled")
+            )
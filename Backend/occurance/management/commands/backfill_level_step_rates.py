@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from occurance.scales import backfill_level_step_rates
+
+
+class Command(BaseCommand):
+    help = "Record the current monthly salary of level steps without rates"
+
+    def handle(self, *args, **options):
+        created = backfill_level_step_rates()
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Level|Step rates: {created} back-filled")
+        )
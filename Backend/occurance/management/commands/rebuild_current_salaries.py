@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+from occurance.services import rebuild_current_salaries
+
+
+class Command(BaseCommand):
+    help = "Rebuild every employee's current salary from their occurrence history"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        refreshed = rebuild_current_salaries(batch_size=options["batch_size"])
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Current salaries: {refreshed} rebuilt")
+        )
@@ -1,6 +1,8 @@
 from django.db import models
+from django.db.models import F
 from employees.models import Employee, Grades
 from api.models import CustomUser
+from .utils import set_authority_components
 
 
 class Occurrence(models.Model):
@@ -9,6 +11,13 @@ class Occurrence(models.Model):
     )
     grade = models.ForeignKey(Grades, on_delete=models.PROTECT)
     authority = models.CharField(max_length=10)
+    # Parsed from authority on save, see utils.parse_authority
+    authority_serial_number = models.PositiveIntegerField(
+        null=True, blank=True, editable=False
+    )
+    authority_year = models.PositiveSmallIntegerField(
+        null=True, blank=True, editable=False
+    )
     level_step = models.ForeignKey("LevelStep", on_delete=models.PROTECT)
     monthly_salary = models.DecimalField(decimal_places=2, max_digits=15)
     annual_salary = models.DecimalField(decimal_places=2, max_digits=15)
@@ -37,10 +46,55 @@ class Occurrence(models.Model):
         verbose_name = "occurrence"
         verbose_name_plural = "occurrences"
 
+        indexes = [
+            models.Index(
+                F("employee"),
+                F("authority_serial_number").desc(nulls_last=True),
+                F("id").desc(),
+                name="occurrence_authority_idx",
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        set_authority_components(self)
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f"{self.employee} - {self.event}"
 
 
+class CurrentSalary(models.Model):
+    # Maintained by occurance.signals from the employee's latest Occurrence
+    employee = models.OneToOneField(
+        Employee,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="current_salary",
+    )
+    occurrence = models.ForeignKey(
+        Occurrence, on_delete=models.CASCADE, related_name="+"
+    )
+    grade = models.ForeignKey(Grades, on_delete=models.PROTECT)
+    level_step = models.ForeignKey("LevelStep", on_delete=models.PROTECT)
+    monthly_salary = models.DecimalField(decimal_places=2, max_digits=15)
+    annual_salary = models.DecimalField(decimal_places=2, max_digits=15)
+    wef_date = models.DateField()
+    date_modified = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "current_salary"
+        verbose_name = "current_salary"
+        verbose_name_plural = "current_salaries"
+
+        indexes = [
+            models.Index(fields=["wef_date"]),
+            models.Index(fields=["monthly_salary"]),
+        ]
+
+    def __str__(self):
+        return f"{self.employee_id} - {self.level_step}"
+
+
 class LevelStep(models.Model):
     level_step = models.CharField(max_length=5, unique=True)
     monthly_salary = models.DecimalField(decimal_places=2, max_digits=15)
@@ -54,6 +108,34 @@ class LevelStep(models.Model):
         return f"{self.level_step}"
 
 
+class LevelStepRate(models.Model):
+    # Monthly salary of a level|step from effective_from until the next rate;
+    # LevelStep.monthly_salary mirrors the rate in force today
+    level_step = models.ForeignKey(
+        LevelStep, on_delete=models.CASCADE, related_name="rates"
+    )
+    monthly_salary = models.DecimalField(decimal_places=2, max_digits=15)
+    effective_from = models.DateField()
+    date_added = models.DateTimeField(auto_now_add=True)
+    date_modified = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "level_step_rate"
+        verbose_name = "level_step_rate"
+        verbose_name_plural = "level_step_rates"
+
+        # Also serves the "rate as of a date" lookup
+        constraints = [
+            models.UniqueConstraint(
+                fields=["level_step", "effective_from"],
+                name="level_step_rate_effective_from_unique",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.level_step} - {self.effective_from}"
+
+
 class Event(models.Model):
     event_name = models.CharField(max_length=255)
 
@@ -89,6 +171,13 @@ class IncompleteOccurrence(models.Model):
     service_id = models.CharField(max_length=7, null=True, blank=True)
     grade = models.ForeignKey(Grades, on_delete=models.PROTECT)
     authority = models.CharField(max_length=10)
+    # Parsed from authority on save, see utils.parse_authority
+    authority_serial_number = models.PositiveIntegerField(
+        null=True, blank=True, editable=False
+    )
+    authority_year = models.PositiveSmallIntegerField(
+        null=True, blank=True, editable=False
+    )
     level_step = models.ForeignKey("LevelStep", on_delete=models.PROTECT)
     monthly_salary = models.DecimalField(decimal_places=4, max_digits=15)
     annual_salary = models.DecimalField(decimal_places=4, max_digits=15)
@@ -117,5 +206,18 @@ class IncompleteOccurrence(models.Model):
         verbose_name = "incomplete_occurrence"
         verbose_name_plural = "incomplete_occurrences"
 
+        indexes = [
+            models.Index(
+                F("employee"),
+                F("authority_serial_number").desc(nulls_last=True),
+                F("id").desc(),
+                name="incomplete_occ_authority_idx",
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        set_authority_components(self)
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f"{self.employee.service_id} - {self.event}"
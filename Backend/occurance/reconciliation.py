@@ -0,0 +1,64 @@
+from rest_framework import serializers as drf_serializers
+from work_queue.reconciliation import Reconciler, register_reconciler
+from .models import IncompleteOccurrence, Occurrence
+from .salary import calculate_salaries, from_cents, to_cents
+from .serializers import BaseOccurrenceSerializer
+from .services import refresh_current_salaries
+from .utils import set_authority_components
+
+
+@register_reconciler
+class OccurrenceReconciler(Reconciler):
+    incomplete_model = IncompleteOccurrence
+    model = Occurrence
+    fields = [
+        "grade_id",
+        "authority",
+        "level_step_id",
+        "event_id",
+        "wef_date",
+        "reason",
+        "created_by_id",
+        "updated_by_id",
+    ]
+    required_fields = ["authority", "wef_date", "reason"]
+
+    def validate(self, record):
+        errors = super().validate(record)
+        serializer = BaseOccurrenceSerializer()
+
+        for field in ["wef_date", "authority", "reason"]:
+            if field in errors:
+                continue
+
+            try:
+                getattr(serializer, f"validate_{field}")(getattr(record, field))
+            except drf_serializers.ValidationError as exc:
+                errors[field] = str(exc.detail[0])
+
+        try:
+            to_cents(record.monthly_salary)
+        except ValueError as exc:
+            errors["monthly_salary"] = str(exc)
+
+        return errors
+
+    def build_instances(self, records):
+        instances = super().build_instances(records)
+
+        # Incomplete salaries have four decimal places; they are recalculated
+        # for the whole batch the way the occurrence serializers do
+        monthly_cents, annual_cents = calculate_salaries(
+            [record.monthly_salary for record in records]
+        )
+
+        for instance, monthly, annual in zip(instances, monthly_cents, annual_cents):
+            instance.monthly_salary = from_cents(monthly)
+            instance.annual_salary = from_cents(annual)
+            set_authority_components(instance)
+
+        return instances
+
+    def after_reconcile(self, instances):
+        # bulk_create skips the post_save signal that keeps CurrentSalary fresh
+        refresh_current_salaries({instance.employee_id for instance in instances})
@@ -0,0 +1,64 @@
+import numpy as np
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+
+MONTHS_IN_YEAR = 12
+
+# Salary columns are DecimalField(max_digits=15, decimal_places=2)
+MAX_CENTS = 10**15 - 1
+
+
+def to_cents(value):
+    # Decimal is kept for the conversion so malformed input is rejected and
+    # halves round the same way two_dp() does
+    try:
+        value = value if isinstance(value, Decimal) else Decimal(str(value))
+        cents = int(value.scaleb(2).to_integral_value(rounding=ROUND_HALF_UP))
+    except (InvalidOperation, ValueError, TypeError):
+        raise ValueError(f"Invalid salary: {value}")
+
+    if abs(cents) > MAX_CENTS:
+        raise ValueError(f"Salary out of range: {value}")
+
+    return cents
+
+
+def from_cents(cents):
+    return Decimal(int(cents)).scaleb(-2)
+
+
+def adjust_cents(cents, percentage):
+    # salary + two_dp(salary * percentage / 100) on int64 cents, with halves
+    # rounding away from zero like ROUND_HALF_UP
+    cents = np.asarray(cents, dtype=np.int64)
+    scaled = cents * np.asarray(percentage, dtype=np.int64)
+    increase = np.sign(scaled) * ((np.abs(scaled) + 50) // 100)
+
+    return cents + increase
+
+
+def calculate_salaries(monthly_salaries, percentages=None):
+    # Monthly and annual salary in cents for many (monthly_salary, percentage)
+    # pairs. A percentage of None or 0 leaves the monthly salary unchanged.
+    monthly_cents = np.array(
+        [to_cents(salary) for salary in monthly_salaries], dtype=np.int64
+    )
+
+    if percentages is not None:
+        percentages = np.array(
+            [percentage or 0 for percentage in percentages], dtype=np.int64
+        )
+        monthly_cents = adjust_cents(monthly_cents, percentages)
+
+    return monthly_cents, monthly_cents * MONTHS_IN_YEAR
+
+
+def calculate_salary(monthly_salary, percentage=None):
+    monthly_cents, annual_cents = calculate_salaries(
+        [monthly_salary], None if percentage is None else [percentage]
+    )
+
+    return from_cents(monthly_cents[0]), from_cents(annual_cents[0])
+
+
+def round_salary(value):
+    return from_cents(to_cents(value))
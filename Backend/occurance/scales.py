@@ -0,0 +1,188 @@
+import bisect
+import logging
+import threading
+import time
+from datetime import date
+from django.core.cache import cache
+from django.db import transaction
+from .models import LevelStep, LevelStepRate
+
+logger = logging.getLogger(__name__)
+
+SALARY_SCALE_VERSION_KEY = "payroll:salary_scale_version"
+# Seconds a process trusts its loaded scale before checking the shared version
+SALARY_SCALE_CHECK_INTERVAL = 5
+# Effective date of the rate a level|step starts with
+SCALE_START_DATE = date.min
+
+_scale = {"version": None, "checked_at": 0.0, "rates": None}
+_scale_lock = threading.Lock()
+
+
+def get_salary_scale_version():
+    return cache.get_or_set(SALARY_SCALE_VERSION_KEY, 1, timeout=None)
+
+
+def bump_salary_scale_version():
+    try:
+        cache.incr(SALARY_SCALE_VERSION_KEY)
+    except ValueError:
+        cache.set(SALARY_SCALE_VERSION_KEY, 1, timeout=None)
+
+
+def reset_salary_scale():
+    with _scale_lock:
+        _scale["rates"] = None
+
+    # Other processes reload once they see the new version
+    bump_salary_scale_version()
+
+
+def invalidate_salary_scale():
+    # Only once the change is committed, so no process caches rates that may
+    # still be rolled back
+    transaction.on_commit(reset_salary_scale)
+
+
+def load_salary_scale():
+    # level_step_id -> (effective dates, monthly salaries), both ascending.
+    # Level steps without recorded rates keep their single monthly salary.
+    rates = {
+        level_step_id: ([SCALE_START_DATE], [monthly_salary])
+        for level_step_id, monthly_salary in LevelStep.objects.filter(
+            rates__isnull=True
+        ).values_list("id", "monthly_salary")
+    }
+
+    for level_step_id, effective_from, monthly_salary in (
+        LevelStepRate.objects.order_by("level_step_id", "effective_from")
+        .values_list("level_step_id", "effective_from", "monthly_salary")
+        .iterator()
+    ):
+        dates, salaries = rates.setdefault(level_step_id, ([], []))
+        dates.append(effective_from)
+        salaries.append(monthly_salary)
+
+    logger.debug(f"Salary scale({len(rates)} Level|Steps) loaded.")
+
+    return rates
+
+
+def get_salary_scale(reload=False):
+    now = time.monotonic()
+
+    with _scale_lock:
+        if (
+            reload
+            or _scale["rates"] is None
+            or now - _scale["checked_at"] > SALARY_SCALE_CHECK_INTERVAL
+        ):
+            version = get_salary_scale_version()
+
+            if reload or _scale["rates"] is None or version != _scale["version"]:
+                _scale["rates"] = load_salary_scale()
+                _scale["version"] = version
+
+            _scale["checked_at"] = now
+
+        return _scale["rates"]
+
+
+def get_monthly_rate(level_step_id, as_of=None):
+    as_of = as_of or date.today()
+    rates = get_salary_scale().get(level_step_id)
+
+    if rates is None:
+        # Added since the scale was loaded
+        rates = get_salary_scale(reload=True).get(level_step_id)
+
+    if rates is None:
+        raise LevelStep.DoesNotExist(f"Level|Step({level_step_id}) does not exist.")
+
+    dates, salaries = rates
+
+    # Dates before the first rate use the first rate
+    index = max(bisect.bisect_right(dates, as_of) - 1, 0)
+
+    return salaries[index]
+
+
+def get_rate_as_of(level_step, as_of):
+    # Database lookup served by the (level_step, effective_from) index
+    return (
+        LevelStepRate.objects.filter(level_step=level_step, effective_from__lte=as_of)
+        .order_by("-effective_from")
+        .first()
+    )
+
+
+def set_level_step_rate(level_step, monthly_salary, effective_from=None):
+    effective_from = effective_from or date.today()
+
+    # Level steps from before rates were recorded keep their salary as the
+    # starting rate
+    if not level_step.rates.exists():
+        LevelStepRate.objects.create(
+            level_step=level_step,
+            monthly_salary=level_step.monthly_salary,
+            effective_from=SCALE_START_DATE,
+        )
+
+    rate, _ = LevelStepRate.objects.update_or_create(
+        level_step=level_step,
+        effective_from=effective_from,
+        defaults={"monthly_salary": monthly_salary},
+    )
+    logger.debug(f"Level|Step Rate({rate}) saved.")
+
+    # A future dated rate leaves today's salary as it is
+    current = get_rate_as_of(level_step, date.today()) or rate
+    if level_step.monthly_salary != current.monthly_salary:
+        level_step.monthly_salary = current.monthly_salary
+        level_step.save(update_fields=["monthly_salary"])
+
+    return rate
+
+
+def sync_level_step_salaries(as_of=None):
+    # LevelStep.monthly_salary mirrors the rate in force on as_of. Run daily
+    # by sync_level_step_salaries_task, so future dated rates take over on
+    # their effective date.
+    as_of = as_of or date.today()
+    # Reloaded, a rate saved by another process may not be in this one's scale
+    get_salary_scale(reload=True)
+    level_steps = []
+
+    for level_step in LevelStep.objects.filter(rates__isnull=False).distinct():
+        monthly_salary = get_monthly_rate(level_step.id, as_of)
+
+        if level_step.monthly_salary != monthly_salary:
+            level_step.monthly_salary = monthly_salary
+            level_steps.append(level_step)
+
+    LevelStep.objects.bulk_update(level_steps, ["monthly_salary"])
+    logger.debug(f"{len(level_steps)} Level|Step salaries synced for {as_of}.")
+
+    return len(level_steps)
+
+
+def backfill_level_step_rates():
+    # Starting rates for level steps created before rates were recorded
+    rates = LevelStepRate.objects.bulk_create(
+        [
+            LevelStepRate(
+                level_step_id=level_step_id,
+                monthly_salary=monthly_salary,
+                effective_from=SCALE_START_DATE,
+            )
+            for level_step_id, monthly_salary in LevelStep.objects.filter(
+                rates__isnull=True
+            ).values_list("id", "monthly_salary")
+        ]
+    )
+    logger.debug(f"{len(rates)} Level|Step Rates backfilled.")
+
+    # bulk_create skips the signals that invalidate the scale
+    invalidate_salary_scale()
+
+    return len(rates)
@@ -5,9 +5,17 @@ from .models import (
     SalaryAdjustmentPercentage,
     Event,
     IncompleteOccurrence,
+    CurrentSalary,
 )
 import logging
-from .utils import two_dp
+from .salary import calculate_salary, round_salary
+from .scales import get_monthly_rate
+from .services import (
+    PROJECTION_GROUPS,
+    SALARY_ADJUSTMENT_SCOPES,
+    SALARY_HISTORY_INTERVALS,
+)
+from employees.models import Grades, Units
 
 logger = logging.getLogger(__name__)
 
@@ -94,31 +102,18 @@ class OccurrenceWriteSerializer(BaseOccurrenceSerializer):
         event = attrs.get("event", None)
         event = event.event_name
 
-        monthly_salary = two_dp(attrs.get("monthly_salary", None))
-        annual_salary = two_dp(attrs.get("annual_salary", None))
-
-        if event != "Salary Adjustment":
-            attrs["monthly_salary"] = str(monthly_salary)
-            attrs["annual_salary"] = str(annual_salary)
-            return attrs
-
-        else:
-            percentage = attrs.get("percentage_adjustment", None)
-
-            if not percentage:
-                attrs["monthly_salary"] = str(monthly_salary)
-                attrs["annual_salary"] = str(annual_salary)
-                return attrs
+        percentage = attrs.get("percentage_adjustment", None)
 
-            percentage_adjustment = two_dp(two_dp(percentage) / two_dp(100))
-
-            monthly_salary = two_dp(
-                (two_dp(monthly_salary * percentage_adjustment)) + monthly_salary
+        if event == "Salary Adjustment" and percentage:
+            monthly_salary, annual_salary = calculate_salary(
+                attrs.get("monthly_salary", None), percentage
             )
-            attrs["monthly_salary"] = str(monthly_salary)
+        else:
+            monthly_salary = round_salary(attrs.get("monthly_salary", None))
+            annual_salary = round_salary(attrs.get("annual_salary", None))
 
-            annual_salary = two_dp(two_dp(12) * monthly_salary)
-            attrs["annual_salary"] = str(annual_salary)
+        attrs["monthly_salary"] = str(monthly_salary)
+        attrs["annual_salary"] = str(annual_salary)
 
         return attrs
 
@@ -160,7 +155,24 @@ class OccurrenceReadSerializer(serializers.ModelSerializer):
         fields = "__all__"
 
 
+class CurrentSalaryReadSerializer(serializers.ModelSerializer):
+    service_id = serializers.CharField(source="employee_id", read_only=True)
+    grade_display = serializers.StringRelatedField(source="grade", read_only=True)
+    level_step_display = serializers.StringRelatedField(
+        source="level_step", read_only=True
+    )
+    date_modified = serializers.DateTimeField(
+        format="%Y-%m-%d %I:%M %p", read_only=True
+    )
+
+    class Meta:
+        model = CurrentSalary
+        exclude = ("employee",)
+
+
 class LevelStepSerializer(serializers.ModelSerializer):
+    # Date a new monthly salary applies from, see scales.set_level_step_rate
+    effective_from = serializers.DateField(write_only=True, required=False)
 
     class Meta:
         model = LevelStep
@@ -181,8 +193,8 @@ class LevelStepSerializer(serializers.ModelSerializer):
         return value
 
     def validate_monthly_salary(self, value):
-        minimum_salary = two_dp(1000)
-        salary_provided = two_dp(value)
+        minimum_salary = round_salary(1000)
+        salary_provided = round_salary(value)
 
         if salary_provided <= minimum_salary:
             logger.debug("Salary cannot be lesser than 1000.00")
@@ -226,6 +238,84 @@ class SalaryAdjustmentPercentageSerializer(serializers.ModelSerializer):
         fields = "__all__"
 
 
+class SalaryAdjustmentSerializer(serializers.Serializer):
+    percentage_adjustment = serializers.PrimaryKeyRelatedField(
+        queryset=SalaryAdjustmentPercentage.objects.all()
+    )
+    wef_date = serializers.DateField()
+    authority = serializers.CharField(max_length=10)
+    scope = serializers.ChoiceField(choices=SALARY_ADJUSTMENT_SCOPES, default="all")
+    unit = serializers.PrimaryKeyRelatedField(
+        queryset=Units.objects.all(), required=False, allow_null=True
+    )
+    grade = serializers.PrimaryKeyRelatedField(
+        queryset=Grades.objects.all(), required=False, allow_null=True
+    )
+
+    validate_wef_date = BaseOccurrenceSerializer.validate_wef_date
+    validate_authority = BaseOccurrenceSerializer.validate_authority
+
+    def validate(self, attrs):
+        scope = attrs.get("scope")
+
+        if scope in ("unit", "grade") and not attrs.get(scope):
+            logger.debug(f"A {scope} is required when the scope is '{scope}'.")
+
+            raise serializers.ValidationError(
+                {scope: f"A {scope} is required when the scope is '{scope}'."}
+            )
+
+        return attrs
+
+
+class PayrollProjectionSerializer(serializers.Serializer):
+    percentage_adjustment = serializers.PrimaryKeyRelatedField(
+        queryset=SalaryAdjustmentPercentage.objects.all(), required=False
+    )
+    percentage = serializers.IntegerField(
+        min_value=-100, max_value=100, required=False
+    )
+    years = serializers.IntegerField(min_value=1, max_value=10, default=3)
+    start_year = serializers.IntegerField(
+        min_value=1900, max_value=2200, required=False
+    )
+    group_by = serializers.ChoiceField(
+        choices=list(PROJECTION_GROUPS), default="unit_grade"
+    )
+
+    def validate(self, attrs):
+        percentage_adjustment = attrs.pop("percentage_adjustment", None)
+
+        if percentage_adjustment:
+            attrs["percentage"] = percentage_adjustment.percentage_adjustment
+
+        if attrs.get("percentage") is None:
+            logger.debug("A percentage or percentage adjustment is required.")
+
+            raise serializers.ValidationError(
+                {"percentage": "A percentage or percentage adjustment is required."}
+            )
+
+        return attrs
+
+
+class SalaryHistoryQuerySerializer(serializers.Serializer):
+    interval = serializers.ChoiceField(
+        choices=SALARY_HISTORY_INTERVALS, required=False, allow_blank=True
+    )
+
+
+class SalaryScaleQuerySerializer(serializers.Serializer):
+    wef_date = serializers.DateField(required=False)
+
+
+class SalaryStatisticsQuerySerializer(serializers.Serializer):
+    start_year = serializers.IntegerField(
+        min_value=1900, max_value=2200, required=False
+    )
+    end_year = serializers.IntegerField(min_value=1900, max_value=2200, required=False)
+
+
 class IncompleteOccurrenceWriteSerializer(BaseOccurrenceSerializer):
     percentage_adjustment = serializers.IntegerField(write_only=True, required=False)
 
@@ -238,29 +328,17 @@ class IncompleteOccurrenceWriteSerializer(BaseOccurrenceSerializer):
         event = event.event_name
 
         level_step = attrs.get("level_step", None)
-        monthly_salary = level_step.monthly_salary
-        monthly_salary = two_dp(monthly_salary)
+        percentage_adjustment = attrs.pop("percentage_adjustment", None)
 
         if event != "Salary Adjustment":
-            # Remove percentage_adjustment key
-            attrs.pop("percentage_adjustment")
+            percentage_adjustment = None
 
-            attrs["monthly_salary"] = str(monthly_salary)
-
-            annual_salary = two_dp(two_dp(12) * monthly_salary)
-            attrs["annual_salary"] = str(annual_salary)
-
-        else:
-            percentage_adjustment = attrs.pop("percentage_adjustment")
-            percentage_adjustment = two_dp(two_dp(percentage_adjustment) / two_dp(100))
-
-            monthly_salary = two_dp(
-                (two_dp(monthly_salary * percentage_adjustment)) + monthly_salary
-            )
-            attrs["monthly_salary"] = str(monthly_salary)
-
-            annual_salary = two_dp(two_dp(12) * monthly_salary)
-            attrs["annual_salary"] = str(annual_salary)
+        monthly_salary, annual_salary = calculate_salary(
+            get_monthly_rate(level_step.id, attrs.get("wef_date")),
+            percentage_adjustment,
+        )
+        attrs["monthly_salary"] = str(monthly_salary)
+        attrs["annual_salary"] = str(annual_salary)
 
         return attrs
 
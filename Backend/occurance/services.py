@@ -0,0 +1,502 @@
+import hashlib
+import json
+import logging
+import numpy as np
+import pandas as pd
+from celery import shared_task
+from datetime import date
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import (
+    Avg,
+    BigIntegerField,
+    CharField,
+    Count,
+    Exists,
+    F,
+    Max,
+    Min,
+    OuterRef,
+)
+from django.db.models.functions import Cast, ExtractYear, Round
+from activity_feeds.models import ActivityFeeds
+from api.models import CustomUser
+from api.task_registry import update_task
+from employees.models import Employee, Grades, Units
+from employees.services import RETIREMENT_AGE, invalidate_employee_profiles
+from .scales import sync_level_step_salaries
+from .salary import adjust_cents, calculate_salaries, from_cents, round_salary
+from .utils import parse_authority, set_authority_components
+from .models import CurrentSalary, Event, Occurrence, SalaryAdjustmentPercentage
+
+logger = logging.getLogger(__name__)
+
+SALARY_ADJUSTMENT_SCOPES = ("all", "unit", "grade")
+
+PROJECTION_GROUPS = {
+    "unit": ["unit"],
+    "grade": ["grade"],
+    "unit_grade": ["unit", "grade"],
+}
+PROJECTION_CACHE_TIMEOUT = 60 * 60
+SALARY_HISTORY_INTERVALS = ("month", "year")
+SALARY_HISTORY_COLUMNS = ["wef_date", "monthly_salary", "grade", "level_step"]
+PAYROLL_DATA_VERSION_KEY = "payroll:data_version"
+
+CURRENT_SALARY_FIELDS = [
+    "occurrence",
+    "grade",
+    "level_step",
+    "monthly_salary",
+    "annual_salary",
+    "wef_date",
+    "date_modified",
+]
+
+
+def get_latest_occurrences(service_ids=None):
+    occurrences = Occurrence.objects.order_by(
+        "employee_id", "-wef_date", "-id"
+    ).distinct("employee_id")
+
+    if service_ids is not None:
+        occurrences = occurrences.filter(employee__in=service_ids)
+
+    return occurrences
+
+
+def refresh_current_salaries(service_ids):
+    service_ids = {service_id for service_id in service_ids if service_id}
+
+    if not service_ids:
+        return []
+
+    snapshots = [
+        CurrentSalary(
+            employee_id=row["employee_id"],
+            occurrence_id=row["id"],
+            grade_id=row["grade_id"],
+            level_step_id=row["level_step_id"],
+            monthly_salary=row["monthly_salary"],
+            annual_salary=row["annual_salary"],
+            wef_date=row["wef_date"],
+        )
+        for row in get_latest_occurrences(service_ids).values(
+            "id",
+            "employee_id",
+            "grade_id",
+            "level_step_id",
+            "monthly_salary",
+            "annual_salary",
+            "wef_date",
+        )
+    ]
+
+    # Employees left without any occurrence no longer have a current salary
+    CurrentSalary.objects.filter(employee__in=service_ids).exclude(
+        employee__in=[snapshot.employee_id for snapshot in snapshots]
+    ).delete()
+
+    snapshots = CurrentSalary.objects.bulk_create(
+        snapshots,
+        update_conflicts=True,
+        unique_fields=["employee"],
+        update_fields=CURRENT_SALARY_FIELDS,
+    )
+    logger.debug(f"Current salary refreshed for Employee({', '.join(service_ids)}).")
+
+    bump_payroll_data_version()
+
+    return snapshots
+
+
+def backfill_authority_components(model, batch_size=1000):
+    updated = 0
+    last_id = 0
+
+    while True:
+        instances = list(
+            model.objects.filter(id__gt=last_id)
+            .order_by("id")
+            .only("id", "authority")[:batch_size]
+        )
+
+        if not instances:
+            break
+
+        last_id = instances[-1].id
+
+        for instance in instances:
+            set_authority_components(instance)
+
+        updated += model.objects.bulk_update(
+            instances, ["authority_serial_number", "authority_year"]
+        )
+
+    logger.debug(f"Authority components back-filled on {updated} {model.__name__}.")
+
+    return updated
+
+
+def rebuild_current_salaries(batch_size=1000):
+    refreshed = 0
+    last_service_id = ""
+
+    while True:
+        service_ids = list(
+            Employee.objects.filter(service_id__gt=last_service_id)
+            .order_by("service_id")
+            .values_list("service_id", flat=True)[:batch_size]
+        )
+
+        if not service_ids:
+            break
+
+        last_service_id = service_ids[-1]
+        refreshed += len(refresh_current_salaries(service_ids))
+
+    return refreshed
+
+
+@shared_task
+def sync_level_step_salaries_task():
+    synced = sync_level_step_salaries()
+    logger.info(f"{synced} Level|Step salaries synced.")
+
+    return synced
+
+
+def get_salary_adjustment_employees(event, wef_date, authority, scope, scope_id=None):
+    employees = Employee.objects.filter(termination_of_appointment__isnull=True)
+
+    if scope == "unit":
+        employees = employees.filter(unit=scope_id)
+    elif scope == "grade":
+        employees = employees.filter(grade=scope_id)
+
+    # Employees already given this adjustment are skipped, which is what lets
+    # an interrupted run be started again safely. The authority tells it apart
+    # from another adjustment with the same WEF date.
+    adjusted = Occurrence.objects.filter(
+        employee=OuterRef("pk"), event=event, wef_date=wef_date, authority=authority
+    )
+
+    return employees.exclude(Exists(adjusted)).order_by("service_id")
+
+
+def build_salary_adjustments(service_ids, percentage, event, wef_date, values):
+    # Latest occurrence on or before the WEF date per employee, adjusted for
+    # the whole batch at once
+    current = list(
+        Occurrence.objects.filter(employee__in=service_ids, wef_date__lte=wef_date)
+        .order_by("employee_id", "-wef_date", "-id")
+        .distinct("employee_id")
+        .values("employee_id", "grade_id", "level_step_id", "monthly_salary")
+    )
+
+    monthly_cents, annual_cents = calculate_salaries(
+        [row["monthly_salary"] for row in current], [percentage] * len(current)
+    )
+
+    return [
+        Occurrence(
+            employee_id=row["employee_id"],
+            grade_id=row["grade_id"],
+            level_step_id=row["level_step_id"],
+            monthly_salary=from_cents(monthly),
+            annual_salary=from_cents(annual),
+            event=event,
+            **values,
+        )
+        for row, monthly, annual in zip(current, monthly_cents, annual_cents)
+    ]
+
+
+@shared_task(bind=True, acks_late=True, max_retries=3, default_retry_delay=5)
+def apply_salary_adjustment(
+    self,
+    percentage_id,
+    wef_date,
+    authority,
+    user_id,
+    scope="all",
+    scope_id=None,
+    batch_size=1000,
+):
+    percentage = SalaryAdjustmentPercentage.objects.get(id=percentage_id)
+    event = Event.objects.get(event_name="Salary Adjustment")
+    user = CustomUser.objects.get(id=user_id)
+
+    components = parse_authority(authority)
+
+    values = {
+        "authority": authority,
+        "authority_serial_number": components.serial_number,
+        "authority_year": components.year,
+        "wef_date": wef_date,
+        "reason": f"{percentage.percentage_adjustment}% Salary Adjustment",
+        "created_by": user,
+        "updated_by": user,
+    }
+
+    employees = get_salary_adjustment_employees(
+        event, wef_date, authority, scope, scope_id
+    )
+    total = employees.count()
+    created = 0
+    last_service_id = ""
+
+    try:
+        while True:
+            service_ids = list(
+                employees.filter(service_id__gt=last_service_id).values_list(
+                    "service_id", flat=True
+                )[:batch_size]
+            )
+
+            if not service_ids:
+                break
+
+            last_service_id = service_ids[-1]
+
+            # Each batch commits on its own so a retry only redoes unfinished work
+            with transaction.atomic():
+                occurrences = Occurrence.objects.bulk_create(
+                    build_salary_adjustments(
+                        service_ids,
+                        percentage.percentage_adjustment,
+                        event,
+                        wef_date,
+                        values,
+                    )
+                )
+
+                # bulk_create skips the signals that keep CurrentSalary and
+                # cached profiles in sync
+                refresh_current_salaries(service_ids)
+                invalidate_employee_profiles(service_ids)
+
+            created += len(occurrences)
+            logger.debug(f"{len(occurrences)} Salary Adjustment Occurrences created.")
+
+            # Employees added since the count can take it past the total
+            update_task(
+                self.request.id, progress=created * 100 // max(total, created, 1)
+            )
+
+    except Exception as e:
+        logger.error(f"Salary adjustment stopped after {created} Occurrences: {e}")
+        raise self.retry(exc=e)
+
+    activity = (
+        f"{user} applied a {percentage.percentage_adjustment}% Salary Adjustment"
+        f"(WEF Date: {wef_date} — Scope: {scope}) to {created} employees"
+    )
+    ActivityFeeds.objects.create(creator=user, activity=activity)
+    logger.debug(f"Activity Feed({activity}) created.")
+
+    return {"created": created, "skipped": total - created}
+
+
+def get_payroll_data_version():
+    return cache.get_or_set(PAYROLL_DATA_VERSION_KEY, 1, timeout=None)
+
+
+def bump_payroll_data_version():
+    # Cached payroll results are keyed by this version, so bumping it retires
+    # them all without having to know their keys
+    try:
+        cache.incr(PAYROLL_DATA_VERSION_KEY)
+    except ValueError:
+        cache.set(PAYROLL_DATA_VERSION_KEY, 1, timeout=None)
+
+
+def get_establishment_frame():
+    rows = (
+        CurrentSalary.objects.filter(employee__termination_of_appointment__isnull=True)
+        .annotate(monthly_cents=Cast(F("monthly_salary") * 100, BigIntegerField()))
+        .values_list("employee__unit", "grade", "monthly_cents", "employee__dob")
+    )
+
+    df = pd.DataFrame.from_records(
+        list(rows), columns=["unit", "grade", "monthly_cents", "dob"]
+    )
+    dob = pd.to_datetime(df["dob"])
+
+    df["retirement_year"] = dob.dt.year + RETIREMENT_AGE
+    df["birth_month"] = dob.dt.month
+
+    return df.drop(columns="dob")
+
+
+def project_payroll_cost(percentage, years=3, start_year=None, group_by="unit_grade"):
+    start_year = start_year or date.today().year
+    scenario = {
+        "percentage": percentage,
+        "years": years,
+        "start_year": start_year,
+        "group_by": group_by,
+    }
+
+    scenario_hash = hashlib.sha256(
+        json.dumps(scenario, sort_keys=True).encode()
+    ).hexdigest()
+    cache_key = f"payroll:projection:{get_payroll_data_version()}:{scenario_hash}"
+
+    projection = cache.get(cache_key)
+
+    if projection is None:
+        projection = {
+            "scenario": scenario,
+            "years": build_payroll_projection(
+                get_establishment_frame(), percentage, years, start_year, group_by
+            ),
+        }
+        cache.set(cache_key, projection, timeout=PROJECTION_CACHE_TIMEOUT)
+        logger.debug(f"Payroll projection({scenario}) cached.")
+
+    return projection
+
+
+def build_payroll_projection(df, percentage, years, start_year, group_by):
+    keys = PROJECTION_GROUPS[group_by]
+    year_range = np.arange(start_year, start_year + years)
+
+    # Months paid per employee per year: all twelve until the retirement year,
+    # up to the birth month in it, none after. Unknown dates of birth never retire.
+    retirement_year = df["retirement_year"].to_numpy(dtype=float)[:, None]
+    birth_month = df["birth_month"].fillna(12).to_numpy(dtype=np.int64)[:, None]
+
+    months = np.where(
+        np.isnan(retirement_year) | (retirement_year > year_range),
+        12,
+        np.where(retirement_year == year_range, birth_month, 0),
+    )
+
+    monthly_cents = df["monthly_cents"].to_numpy(dtype=np.int64)[:, None]
+    adjusted_cents = adjust_cents(monthly_cents, percentage)
+
+    columns = {}
+    for index, year in enumerate(year_range):
+        columns[("headcount", year)] = months[:, index] > 0
+        columns[("baseline", year)] = monthly_cents[:, 0] * months[:, index]
+        columns[("projected", year)] = adjusted_cents[:, 0] * months[:, index]
+
+    totals = pd.DataFrame(columns, index=df.index)
+    grouped = totals.groupby([df[key] for key in keys]).sum().reset_index()
+
+    names = {
+        "unit": dict(Units.objects.values_list("id", "unit_name")),
+        "grade": dict(Grades.objects.values_list("id", "grade_name")),
+    }
+    group_names = [
+        [names[key].get(value) for value in grouped[key].tolist()] for key in keys
+    ]
+
+    results = []
+    for year in year_range:
+        groups = [
+            {
+                **dict(zip(keys, group)),
+                **format_projection_costs(headcount, baseline, projected),
+            }
+            for *group, headcount, baseline, projected in zip(
+                *group_names,
+                grouped[("headcount", year)].tolist(),
+                grouped[("baseline", year)].tolist(),
+                grouped[("projected", year)].tolist(),
+            )
+        ]
+
+        results.append(
+            {
+                "year": int(year),
+                **format_projection_costs(
+                    totals[("headcount", year)].sum(),
+                    totals[("baseline", year)].sum(),
+                    totals[("projected", year)].sum(),
+                ),
+                "groups": groups,
+            }
+        )
+
+    return results
+
+
+def format_projection_costs(headcount, baseline_cents, projected_cents):
+    return {
+        "headcount": int(headcount),
+        "baseline_cost": str(from_cents(baseline_cents)),
+        "projected_cost": str(from_cents(projected_cents)),
+        "increase": str(from_cents(projected_cents - baseline_cents)),
+    }
+
+
+def get_salary_history(service_id, interval=None):
+    # Salaries are cast to text so they serialize like the DecimalFields do
+    history = (
+        Occurrence.objects.filter(employee=service_id)
+        .annotate(salary=Cast("monthly_salary", CharField()))
+        .order_by("wef_date", "id")
+        .values_list(
+            "wef_date", "salary", "grade__grade_name", "level_step__level_step"
+        )
+    )
+
+    if not interval:
+        return list(history)
+
+    # Downsample to the last occurrence of each month or year
+    latest = {}
+    for row in history:
+        wef_date = row[0]
+        period = (
+            wef_date.year if interval == "year" else (wef_date.year, wef_date.month)
+        )
+        latest[period] = row
+
+    return list(latest.values())
+
+
+def get_salary_statistics(start_year=None, end_year=None):
+    filters = {}
+    if start_year:
+        filters["year__gte"] = start_year
+    if end_year:
+        filters["year__lte"] = end_year
+
+    scenario = json.dumps(filters, sort_keys=True)
+    cache_key = f"payroll:salary_statistics:{get_payroll_data_version()}:{scenario}"
+
+    statistics = cache.get(cache_key)
+
+    if statistics is None:
+        # Salaries of the occurrences taking effect each year, grouped by grade
+        rows = (
+            Occurrence.objects.annotate(year=ExtractYear("wef_date"))
+            .filter(**filters)
+            .values("year", "grade__grade_name")
+            .annotate(
+                employees=Count("employee", distinct=True),
+                average_salary=Round(Avg("monthly_salary"), precision=2),
+                minimum_salary=Min("monthly_salary"),
+                maximum_salary=Max("monthly_salary"),
+            )
+            .order_by("year", "grade__grade_name")
+        )
+
+        statistics = [
+            {
+                "year": row["year"],
+                "grade": row["grade__grade_name"],
+                "employees": row["employees"],
+                "average_salary": str(round_salary(row["average_salary"])),
+                "minimum_salary": str(row["minimum_salary"]),
+                "maximum_salary": str(row["maximum_salary"]),
+            }
+            for row in rows
+        ]
+        cache.set(cache_key, statistics, timeout=PROJECTION_CACHE_TIMEOUT)
+        logger.debug(f"Salary statistics({scenario}) cached.")
+
+    return statistics
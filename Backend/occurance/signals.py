@@ -0,0 +1,42 @@
+from django.db.models.signals import post_save, pre_save, post_delete
+from django.dispatch import receiver
+from .models import LevelStep, LevelStepRate, Occurrence
+from .scales import invalidate_salary_scale
+from .services import bump_payroll_data_version, refresh_current_salaries
+from employees.models import Employee
+from termination_of_appointment.models import TerminationOfAppointment
+
+
+@receiver(pre_save, sender=Occurrence)
+def track_previous_occurrence_employee(sender, instance, **kwargs):
+    if instance.pk:
+        instance._previous_employee_id = (
+            sender.objects.filter(pk=instance.pk)
+            .values_list("employee_id", flat=True)
+            .first()
+        )
+
+
+@receiver(post_save, sender=Occurrence)
+def handle_occurrence_save(sender, instance, **kwargs):
+    previous_employee_id = getattr(instance, "_previous_employee_id", None)
+
+    refresh_current_salaries([instance.employee_id, previous_employee_id])
+
+
+@receiver(post_delete, sender=Occurrence)
+def handle_occurrence_delete(sender, instance, **kwargs):
+    refresh_current_salaries([instance.employee_id])
+
+
+@receiver([post_save, post_delete], sender=Employee)
+@receiver([post_save, post_delete], sender=TerminationOfAppointment)
+def handle_payroll_establishment_change(sender, instance, **kwargs):
+    # Unit, date of birth and terminations all feed the payroll projections
+    bump_payroll_data_version()
+
+
+@receiver([post_save, post_delete], sender=LevelStep)
+@receiver([post_save, post_delete], sender=LevelStepRate)
+def handle_salary_scale_change(sender, instance, **kwargs):
+    invalidate_salary_scale()
@@ -0,0 +1,88 @@
+from io import StringIO
+from .base import EmployeeBaseAPITestCase
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+from employees.models import Employee
+from occurance.models import Occurrence
+from occurance.utils import parse_authority
+
+
+class AuthorityComponentsTest(EmployeeBaseAPITestCase):
+
+    def setUp(self):
+        self.employee = Employee.objects.create(
+            service_id="000993",
+            last_name="Kana",
+            other_names="Steve",
+            gender=self.gender,
+            unit=self.unit,
+            grade=self.grade,
+            station="Accra",
+            structure=self.structure,
+            social_security="C019000819236",
+            category="Junior",
+            appointment_date="2025-11-25",
+        )
+
+        self.authenticate_standard_user()
+
+    def create_occurrence(self, authority):
+        return Occurrence.objects.create(
+            employee=self.employee,
+            grade=self.grade,
+            authority=authority,
+            level_step=self.level_step,
+            monthly_salary="12971.84",
+            annual_salary="155662.08",
+            event=self.event,
+            wef_date="2024-09-23",
+            reason="Newly Employed",
+        )
+
+    def test_parse_authority(self):
+        # Assertions
+        self.assertEqual(parse_authority("CEM 20/24"), ("CEM", 20, 24))
+        self.assertEqual(parse_authority("cem 3 / 25"), ("CEM", 3, 25))
+        self.assertEqual(parse_authority("CEM 20"), (None, None, None))
+        self.assertEqual(parse_authority(None), (None, None, None))
+        self.assertEqual(parse_authority("C 1/999999"), (None, None, None))
+
+    def test_oversized_year_left_unparsed(self):
+        occurrence = self.create_occurrence("C 1/999999")
+
+        # Assertions
+        self.assertIsNone(occurrence.authority_serial_number)
+        self.assertIsNone(occurrence.authority_year)
+
+    def test_occurrences_ordered_by_authority_serial_number(self):
+        second = self.create_occurrence("CEM 9/24")
+        first = self.create_occurrence("CEM 120/24")
+        unparsed = self.create_occurrence("CEM 2024")
+
+        # Send list request
+        response = self.client.get(
+            reverse("list-employee-occurrence", kwargs={"pk": "000993"})
+        )
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(first.authority_serial_number, 120)
+        self.assertEqual(first.authority_year, 24)
+        self.assertEqual(
+            [occurrence["id"] for occurrence in response.data],
+            [first.id, second.id, unparsed.id],
+        )
+
+    def test_backfill_authority_components(self):
+        occurrence = self.create_occurrence("CEM 20/24")
+        Occurrence.objects.filter(id=occurrence.id).update(
+            authority_serial_number=None, authority_year=None
+        )
+
+        call_command("backfill_authority_components", stdout=StringIO())
+        occurrence.refresh_from_db()
+
+        # Assertions
+        self.assertEqual(occurrence.authority_serial_number, 20)
+        self.assertEqual(occurrence.authority_year, 24)
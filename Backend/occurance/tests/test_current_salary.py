@@ -0,0 +1,98 @@
+from .base import EmployeeBaseAPITestCase
+from django.urls import reverse
+from rest_framework import status
+from employees.models import Employee
+from occurance.models import CurrentSalary, LevelStep, Occurrence
+
+
+class CurrentSalaryTest(EmployeeBaseAPITestCase):
+
+    def setUp(self):
+        self.employee = Employee.objects.create(
+            service_id="000993",
+            last_name="Kana",
+            other_names="Steve",
+            gender=self.gender,
+            unit=self.unit,
+            grade=self.grade,
+            station="Accra",
+            structure=self.structure,
+            social_security="C019000819236",
+            category="Junior",
+            appointment_date="2025-11-25",
+        )
+        self.other_level_step = LevelStep.objects.create(
+            level_step="25H02", monthly_salary="14000.00"
+        )
+
+        self.first = self.create_occurrence(self.level_step, "12971.84", "2024-01-01")
+        self.second = self.create_occurrence(
+            self.other_level_step, "14000.00", "2024-09-23"
+        )
+
+        self.authenticate_standard_user()
+
+    def create_occurrence(self, level_step, monthly_salary, wef_date):
+        return Occurrence.objects.create(
+            employee=self.employee,
+            grade=self.grade,
+            authority="CEM 20/24",
+            level_step=level_step,
+            monthly_salary=monthly_salary,
+            annual_salary="0.00",
+            event=self.event,
+            wef_date=wef_date,
+            reason="Newly Employed",
+        )
+
+    def test_current_salary_follows_latest_occurrence(self):
+        current_salary = CurrentSalary.objects.get(employee=self.employee)
+
+        # Assertions
+        self.assertEqual(current_salary.occurrence, self.second)
+        self.assertEqual(current_salary.level_step, self.other_level_step)
+        self.assertEqual(str(current_salary.monthly_salary), "14000.00")
+
+        self.second.delete()
+        current_salary = CurrentSalary.objects.get(employee=self.employee)
+
+        # Assertions
+        self.assertEqual(current_salary.occurrence, self.first)
+        self.assertEqual(str(current_salary.monthly_salary), "12971.84")
+
+        self.first.delete()
+
+        # Assertions
+        self.assertFalse(CurrentSalary.objects.filter(employee=self.employee).exists())
+
+    def test_current_salary_after_occurrence_edit(self):
+        self.first.wef_date = "2025-01-01"
+        self.first.save()
+
+        current_salary = CurrentSalary.objects.get(employee=self.employee)
+
+        # Assertions
+        self.assertEqual(current_salary.occurrence, self.first)
+        self.assertEqual(str(current_salary.wef_date), "2025-01-01")
+
+    def test_retrieve_and_list_current_salary(self):
+        # Send retrieve request
+        response = self.client.get(
+            reverse("retrieve-employee-current-salary", kwargs={"pk": "000993"})
+        )
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["service_id"], "000993")
+        self.assertEqual(response.data["level_step_display"], "25H02")
+        self.assertEqual(response.data["monthly_salary"], "14000.00")
+
+        # Send list request
+        response = self.client.get(
+            reverse("list-current-salary"), {"grade": self.grade.id}
+        )
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 1)
+        self.assertEqual(response.data["results"][0]["occurrence"], self.second.id)
@@ -0,0 +1,156 @@
+from datetime import date, timedelta
+from decimal import Decimal
+from django.db import transaction
+from django.urls import reverse
+from rest_framework import status
+from occurance.models import LevelStep, LevelStepRate
+from occurance.scales import (
+    backfill_level_step_rates,
+    get_monthly_rate,
+    set_level_step_rate,
+    sync_level_step_salaries,
+)
+from .base import BaseAPITestCase
+
+
+class LevelStepRateAPITest(BaseAPITestCase):
+
+    def setUp(self):
+        self.create_level_step_url = reverse("create-level-step")
+
+        self.authenticate_admin()
+
+        # Send create level|step request
+        response = self.client.post(
+            self.create_level_step_url,
+            {"level_step": "18H01", "monthly_salary": 6000},
+            format="json",
+        )
+        self.level_step_id = response.data["id"]
+
+        self.edit_level_step_url = reverse(
+            "edit-level-step", kwargs={"pk": self.level_step_id}
+        )
+        self.calculate_annual_salary_url = reverse(
+            "calculate-annual-salary", kwargs={"pk": self.level_step_id}
+        )
+
+    def calculate(self, wef_date):
+        return self.client.get(
+            self.calculate_annual_salary_url, {"wef_date": wef_date}
+        ).data
+
+    def test_edit_keeps_earlier_rates(self):
+        # Send edit level|step request
+        response = self.client.patch(
+            self.edit_level_step_url,
+            {"monthly_salary": "6500.00", "effective_from": "2025-01-01"},
+            format="json",
+        )
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["monthly_salary"], "6500.00")
+        self.assertEqual(LevelStepRate.objects.count(), 2)
+        self.assertEqual(self.calculate("2024-12-31")["annual_salary"], "72000.00")
+        self.assertEqual(self.calculate("2025-01-01")["annual_salary"], "78000.00")
+
+    def test_future_rate_leaves_current_salary(self):
+        effective_from = date.today() + timedelta(days=30)
+
+        # Send edit level|step request
+        response = self.client.patch(
+            self.edit_level_step_url,
+            {"monthly_salary": "7000.00", "effective_from": effective_from},
+            format="json",
+        )
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["monthly_salary"], "6000.00")
+        self.assertEqual(
+            self.calculate(effective_from)["monthly_salary"], "7000.00"
+        )
+        self.assertEqual(self.calculate(date.today())["monthly_salary"], "6000.00")
+
+    def test_future_rate_synced_on_effective_date(self):
+        effective_from = date.today() + timedelta(days=30)
+
+        # Send edit level|step request
+        self.client.patch(
+            self.edit_level_step_url,
+            {"monthly_salary": "7000.00", "effective_from": effective_from},
+            format="json",
+        )
+
+        # Assertions
+        self.assertEqual(sync_level_step_salaries(), 0)
+        self.assertEqual(sync_level_step_salaries(effective_from), 1)
+        self.assertEqual(
+            LevelStep.objects.get(id=self.level_step_id).monthly_salary,
+            Decimal("7000.00"),
+        )
+
+    def test_invalid_wef_date(self):
+        # Send calculate annual salary request
+        response = self.client.get(
+            self.calculate_annual_salary_url, {"wef_date": "yesterday"}
+        )
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class SalaryScaleCacheTest(BaseAPITestCase):
+
+    def setUp(self):
+        self.level_step = LevelStep.objects.create(
+            level_step="25H01", monthly_salary="12971.84"
+        )
+
+    def test_rate_lookup_is_cached(self):
+        get_monthly_rate(self.level_step.id)
+
+        # Assertions
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                get_monthly_rate(self.level_step.id), Decimal("12971.84")
+            )
+
+    def test_rate_change_invalidates_cache(self):
+        get_monthly_rate(self.level_step.id)
+
+        # The scale is invalidated once the change commits
+        with self.captureOnCommitCallbacks(execute=True):
+            backfill_level_step_rates()
+            LevelStepRate.objects.create(
+                level_step=self.level_step,
+                monthly_salary="13500.00",
+                effective_from="2025-01-01",
+            )
+
+        # Assertions
+        self.assertEqual(
+            get_monthly_rate(self.level_step.id, date(2024, 6, 1)),
+            Decimal("12971.84"),
+        )
+        self.assertEqual(
+            get_monthly_rate(self.level_step.id, date(2025, 6, 1)),
+            Decimal("13500.00"),
+        )
+
+    def test_uncommitted_rate_not_cached(self):
+        get_monthly_rate(self.level_step.id)
+
+        with transaction.atomic():
+            set_level_step_rate(self.level_step, "13500.00")
+            get_monthly_rate(self.level_step.id)
+            transaction.set_rollback(True)
+
+        # Assertions
+        self.assertEqual(get_monthly_rate(self.level_step.id), Decimal("12971.84"))
+
+    def test_unknown_level_step(self):
+        # Assertions
+        with self.assertRaises(LevelStep.DoesNotExist):
+            get_monthly_rate(0)
@@ -0,0 +1,107 @@
+from datetime import date
+from .base import EmployeeBaseAPITestCase
+from django.urls import reverse
+from rest_framework import status
+from employees.models import Employee
+from occurance.models import Occurrence
+
+
+class PayrollProjectionAPITest(EmployeeBaseAPITestCase):
+
+    def setUp(self):
+        self.payroll_projection_url = reverse("payroll-projection")
+        self.start_year = date.today().year
+
+        retiring = self.create_employee("000993", f"{self.start_year - 59}-06-15")
+        staying = self.create_employee("020124", "1990-01-01")
+
+        self.create_occurrence(retiring, "1000.05")
+        self.create_occurrence(staying, "2000.00")
+
+        self.authenticate_standard_user()
+
+    def create_employee(self, service_id, dob):
+        return Employee.objects.create(
+            service_id=service_id,
+            last_name="Kana",
+            other_names="Steve",
+            gender=self.gender,
+            dob=dob,
+            unit=self.unit,
+            grade=self.grade,
+            station="Accra",
+            structure=self.structure,
+            social_security="C019000819236",
+            category="Junior",
+            appointment_date="2025-11-25",
+        )
+
+    def create_occurrence(self, employee, monthly_salary):
+        return Occurrence.objects.create(
+            employee=employee,
+            grade=self.grade,
+            authority="CEM 20/24",
+            level_step=self.level_step,
+            monthly_salary=monthly_salary,
+            annual_salary="0.00",
+            event=self.event,
+            wef_date="2024-09-23",
+            reason="Newly Employed",
+        )
+
+    def test_payroll_projection_with_retirements(self):
+        # Send projection request
+        response = self.client.get(
+            self.payroll_projection_url,
+            {"percentage": 10, "years": 3, "group_by": "unit"},
+        )
+
+        first, second, third = response.data["years"]
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(first["year"], self.start_year)
+        self.assertEqual(first["headcount"], 2)
+        self.assertEqual(first["baseline_cost"], "36000.60")
+        self.assertEqual(first["projected_cost"], "39600.72")
+        self.assertEqual(second["headcount"], 2)
+        self.assertEqual(second["baseline_cost"], "30000.30")
+        self.assertEqual(second["projected_cost"], "33000.36")
+        self.assertEqual(third["headcount"], 1)
+        self.assertEqual(third["increase"], "2400.00")
+        self.assertEqual(
+            third["groups"],
+            [
+                {
+                    "unit": "4 Bn",
+                    "headcount": 1,
+                    "baseline_cost": "24000.00",
+                    "projected_cost": "26400.00",
+                    "increase": "2400.00",
+                }
+            ],
+        )
+
+    def test_payroll_projection_refreshes_after_occurrence(self):
+        params = {"percentage": 10, "years": 1, "group_by": "grade"}
+
+        # Send projection request
+        response = self.client.get(self.payroll_projection_url, params)
+
+        # Assertions
+        self.assertEqual(response.data["years"][0]["baseline_cost"], "36000.60")
+
+        self.create_occurrence(Employee.objects.get(pk="020124"), "3000.00")
+
+        # Send projection request
+        response = self.client.get(self.payroll_projection_url, params)
+
+        # Assertions
+        self.assertEqual(response.data["years"][0]["baseline_cost"], "48000.60")
+
+    def test_payroll_projection_without_percentage(self):
+        # Send projection request
+        response = self.client.get(self.payroll_projection_url, {"years": 3})
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
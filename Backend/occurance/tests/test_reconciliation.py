@@ -0,0 +1,168 @@
+from decimal import Decimal
+from .base import EmployeeBaseAPITestCase
+from django.contrib.contenttypes.models import ContentType
+from django.urls import reverse
+from rest_framework import status
+from activity_feeds.models import ActivityFeeds
+from employees.models import Employee
+from flags.models import FlagType, Flags
+from flags.services import create_flags
+from occurance.models import CurrentSalary, IncompleteOccurrence, Occurrence
+from work_queue.reconciliation import get_reconciler
+
+
+class ReconcileIncompleteOccurrenceTest(EmployeeBaseAPITestCase):
+
+    def setUp(self):
+        self.reconcile_url = reverse("reconcile-incomplete-records")
+
+        FlagType.objects.create(flag_type="Incomplete Record")
+
+        self.employee = Employee.objects.create(
+            service_id="000993",
+            last_name="Kana",
+            other_names="Steve",
+            gender=self.gender,
+            unit=self.unit,
+            grade=self.grade,
+            station="Accra",
+            structure=self.structure,
+            social_security="C019000819236",
+            category="Junior",
+            appointment_date="2025-11-25",
+        )
+
+        self.by_service_id = self.create_incomplete_occurrence(service_id="000993")
+        self.by_employee = self.create_incomplete_occurrence(
+            employee=self.employee, wef_date="2024-10-01"
+        )
+        self.unregistered = self.create_incomplete_occurrence(service_id="020124")
+        self.without_wef_date = self.create_incomplete_occurrence(
+            service_id="000993", wef_date=None
+        )
+
+        create_flags([self.by_service_id, self.unregistered], self.standard_user)
+
+        self.authenticate_standard_user()
+
+    def create_incomplete_occurrence(self, wef_date="2024-09-23", **kwargs):
+        return IncompleteOccurrence.objects.create(
+            grade=self.grade,
+            authority="CEM 20/24",
+            level_step=self.level_step,
+            monthly_salary="12971.8450",
+            annual_salary="155662.1400",
+            event=self.event,
+            wef_date=wef_date,
+            reason="Newly Employed",
+            created_by=self.standard_user,
+            **kwargs,
+        )
+
+    def get_flag_object_ids(self):
+        content_type = ContentType.objects.get_for_model(IncompleteOccurrence)
+
+        return set(
+            Flags.objects.filter(content_type=content_type).values_list(
+                "object_id", flat=True
+            )
+        )
+
+    def test_dry_run(self):
+        report = get_reconciler("IncompleteOccurrence").reconcile(
+            self.standard_user, dry_run=True
+        )
+
+        # Assertions
+        self.assertEqual(report["matched"], 2)
+        self.assertEqual(report["reconciled"], 0)
+        self.assertEqual(
+            {skipped["id"]: skipped["errors"] for skipped in report["skipped"]},
+            {
+                self.unregistered.id: {
+                    "employee": "No employee matches this service ID."
+                },
+                self.without_wef_date.id: {"wef_date": "This field is required."},
+            },
+        )
+        self.assertEqual(Occurrence.objects.count(), 0)
+        self.assertEqual(IncompleteOccurrence.objects.count(), 4)
+        self.assertEqual(len(self.get_flag_object_ids()), 2)
+
+    def test_reconcile(self):
+        report = get_reconciler("incompleteoccurrence").reconcile(self.standard_user)
+
+        occurrences = Occurrence.objects.order_by("wef_date")
+
+        # Assertions
+        self.assertEqual(report["reconciled"], 2)
+        self.assertEqual(len(report["skipped"]), 2)
+        self.assertEqual(occurrences.count(), 2)
+        self.assertEqual(occurrences[0].employee, self.employee)
+        self.assertEqual(occurrences[0].created_by, self.standard_user)
+        self.assertEqual(occurrences[0].monthly_salary, Decimal("12971.85"))
+        self.assertEqual(occurrences[0].annual_salary, Decimal("155662.20"))
+        self.assertEqual(occurrences[0].authority_serial_number, 20)
+        self.assertEqual(
+            set(IncompleteOccurrence.objects.values_list("id", flat=True)),
+            {self.unregistered.id, self.without_wef_date.id},
+        )
+        self.assertEqual(self.get_flag_object_ids(), {str(self.unregistered.id)})
+        self.assertEqual(
+            CurrentSalary.objects.get(employee=self.employee).occurrence,
+            occurrences[1],
+        )
+        self.assertTrue(
+            ActivityFeeds.objects.filter(
+                activity__contains="reconciled 2 incomplete_occurrence record(s)"
+            ).exists()
+        )
+
+    def test_promoted_records_are_not_promoted_again(self):
+        reconciler = get_reconciler("incompleteoccurrence")
+        # Validated by a run that another run overtakes
+        records = [self.by_service_id, self.by_employee]
+
+        reconciler.reconcile(self.standard_user)
+
+        # Assertions
+        self.assertEqual(reconciler.promote(records, self.standard_user), [])
+        self.assertEqual(Occurrence.objects.count(), 2)
+
+    def test_reconcile_as_standard_user(self):
+        # Send reconcile request
+        response = self.client.post(
+            self.reconcile_url, {"model": "incompleteoccurrence"}, format="json"
+        )
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_reconcile_as_admin(self):
+        self.standard_user.is_staff = True
+        self.standard_user.save()
+
+        # Send reconcile request
+        response = self.client.post(
+            self.reconcile_url,
+            {"model": "incompleteoccurrence", "dry_run": True},
+            format="json",
+        )
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["matched"], 2)
+        self.assertTrue(response.data["dry_run"])
+        self.assertEqual(IncompleteOccurrence.objects.count(), 4)
+
+    def test_reconcile_unknown_model(self):
+        self.standard_user.is_staff = True
+        self.standard_user.save()
+
+        # Send reconcile request
+        response = self.client.post(
+            self.reconcile_url, {"model": "employee"}, format="json"
+        )
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
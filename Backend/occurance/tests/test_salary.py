@@ -0,0 +1,76 @@
+import random
+from decimal import Decimal
+from django.test import SimpleTestCase
+from occurance.salary import calculate_salaries, calculate_salary, from_cents, to_cents
+from occurance.utils import two_dp
+
+
+def two_dp_salary(monthly_salary, percentage=None):
+    # The per-row calculation the serializers used before occurance.salary
+    monthly_salary = two_dp(monthly_salary)
+
+    if percentage:
+        percentage_adjustment = two_dp(two_dp(percentage) / two_dp(100))
+        monthly_salary = two_dp(
+            (two_dp(monthly_salary * percentage_adjustment)) + monthly_salary
+        )
+
+    annual_salary = two_dp(two_dp(12) * monthly_salary)
+
+    return monthly_salary, annual_salary
+
+
+class SalaryCalculatorParityTest(SimpleTestCase):
+
+    def generate_cases(self, count):
+        generator = random.Random(2024)
+        cases = []
+
+        for _ in range(count):
+            places = generator.randint(0, 4)
+            monthly_salary = Decimal(generator.randint(0, 10**10)).scaleb(-places)
+            percentage = generator.choice([None, 0, generator.randint(-100, 100)])
+
+            cases.append((monthly_salary, percentage))
+
+        # Increases landing exactly on half a cent
+        cases += [
+            (Decimal("1000.05"), 10),
+            (Decimal("1000.05"), -10),
+            (Decimal("0.05"), 10),
+            (Decimal("12971.8450"), 1),
+            (Decimal("99999999.99"), 50),
+        ]
+
+        return cases
+
+    def test_batch_matches_two_dp(self):
+        cases = self.generate_cases(5000)
+
+        monthly_cents, annual_cents = calculate_salaries(
+            [monthly_salary for monthly_salary, _ in cases],
+            [percentage for _, percentage in cases],
+        )
+
+        for (monthly_salary, percentage), monthly, annual in zip(
+            cases, monthly_cents, annual_cents
+        ):
+            with self.subTest(monthly_salary=monthly_salary, percentage=percentage):
+                self.assertEqual(
+                    (from_cents(monthly), from_cents(annual)),
+                    two_dp_salary(monthly_salary, percentage),
+                )
+
+    def test_single_salary_matches_two_dp(self):
+        for monthly_salary, percentage in self.generate_cases(500):
+            with self.subTest(monthly_salary=monthly_salary, percentage=percentage):
+                self.assertEqual(
+                    calculate_salary(monthly_salary, percentage),
+                    two_dp_salary(monthly_salary, percentage),
+                )
+
+    def test_invalid_salary(self):
+        for value in [None, "", "abc", "NaN", Decimal("1e20")]:
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    to_cents(value)
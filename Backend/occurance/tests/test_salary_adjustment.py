@@ -0,0 +1,208 @@
+from decimal import Decimal
+from .base import EmployeeBaseAPITestCase
+from django.urls import reverse
+from rest_framework import status
+from activity_feeds.models import ActivityFeeds
+from employees.models import Employee, Units
+from occurance.models import (
+    CurrentSalary,
+    LevelStep,
+    Occurrence,
+    SalaryAdjustmentPercentage,
+)
+from occurance.services import apply_salary_adjustment
+from api.models import CustomUser
+from api.task_registry import dispatch_task, get_task
+
+
+class ApplySalaryAdjustmentTest(EmployeeBaseAPITestCase):
+
+    def setUp(self):
+        self.apply_salary_adjustment_url = reverse("apply-salary-adjustment")
+
+        self.authenticate_standard_user()
+
+        for service_id in ["000993", "020124"]:
+            Employee.objects.create(
+                service_id=service_id,
+                last_name="Kana",
+                other_names="Steve",
+                gender=self.gender,
+                unit=self.unit,
+                grade=self.grade,
+                station="Accra",
+                structure=self.structure,
+                social_security="C019000819236",
+                category="Junior",
+                appointment_date="2025-11-25",
+            )
+
+        self.percentage = SalaryAdjustmentPercentage.objects.create(
+            percentage_adjustment=10
+        )
+        other_level_step = LevelStep.objects.create(
+            level_step="25H02", monthly_salary="1000.05"
+        )
+
+        for service_id, level_step in [
+            ("000993", self.level_step),
+            ("020124", other_level_step),
+        ]:
+            Occurrence.objects.create(
+                employee_id=service_id,
+                grade=self.grade,
+                authority="CEM 20/24",
+                level_step=level_step,
+                monthly_salary=level_step.monthly_salary,
+                annual_salary=12 * Decimal(level_step.monthly_salary),
+                event=self.event,
+                wef_date="2024-09-23",
+                reason="Newly Employed",
+            )
+
+    def apply(self, authority="CEM 1/25", **kwargs):
+        return apply_salary_adjustment.apply(
+            args=(self.percentage.id, "2025-01-01", authority, self.standard_user.id),
+            kwargs=kwargs,
+        ).get()
+
+    def test_salary_adjustment_for_all_employees(self):
+        result = self.apply()
+
+        adjustments = Occurrence.objects.filter(wef_date="2025-01-01")
+        first, second = adjustments.order_by("employee_id")
+
+        # Assertions
+        self.assertEqual(result, {"created": 2, "skipped": 0})
+        self.assertEqual(str(first.monthly_salary), "14269.02")
+        self.assertEqual(str(first.annual_salary), "171228.24")
+        self.assertEqual(str(second.monthly_salary), "1100.06")
+        self.assertEqual(str(second.annual_salary), "13200.72")
+        self.assertEqual(first.reason, "10% Salary Adjustment")
+        self.assertEqual(first.created_by, self.standard_user)
+        self.assertEqual(CurrentSalary.objects.get(employee="000993").occurrence, first)
+        self.assertEqual(
+            ActivityFeeds.objects.filter(activity__contains="applied a 10%").count(),
+            1,
+        )
+
+    def test_salary_adjustment_is_not_applied_twice(self):
+        self.apply()
+        result = self.apply()
+
+        # Assertions
+        self.assertEqual(result, {"created": 0, "skipped": 0})
+        self.assertEqual(Occurrence.objects.filter(wef_date="2025-01-01").count(), 2)
+
+    def test_another_salary_adjustment_on_same_date(self):
+        self.apply()
+        result = self.apply(authority="CEM 2/25")
+
+        # Assertions
+        self.assertEqual(result, {"created": 2, "skipped": 0})
+        self.assertEqual(
+            str(
+                Occurrence.objects.filter(employee="020124", authority="CEM 2/25")
+                .get()
+                .monthly_salary
+            ),
+            "1210.07",
+        )
+
+    def test_salary_adjustment_for_unit(self):
+        other_unit = Units.objects.create(unit_name="5 Bn")
+
+        result = self.apply(scope="unit", scope_id=other_unit.id)
+
+        # Assertions
+        self.assertEqual(result, {"created": 0, "skipped": 0})
+        self.assertFalse(Occurrence.objects.filter(wef_date="2025-01-01").exists())
+
+    def test_apply_salary_adjustment_as_standard_user(self):
+        # Send apply salary adjustment request
+        response = self.client.post(
+            self.apply_salary_adjustment_url,
+            {
+                "percentage_adjustment": self.percentage.id,
+                "wef_date": "2025-01-01",
+                "authority": "CEM 1/25",
+            },
+            format="json",
+        )
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def create_admin(self, username):
+        admin = CustomUser.objects.create_user(
+            fullname="Administrator",
+            username=username,
+            password="lovesogreat",
+            email=f"{username}@email.com",
+            role="ADMINISTRATOR",
+            grade=self.grade,
+            division=self.division,
+        )
+        admin.is_staff = True
+        admin.save()
+
+        return admin
+
+    def test_apply_salary_adjustment_as_admin(self):
+        admin = self.create_admin("admin")
+        self.client.force_authenticate(user=admin)
+
+        # Send apply salary adjustment request
+        response = self.client.post(
+            self.apply_salary_adjustment_url,
+            {
+                "percentage_adjustment": self.percentage.id,
+                "wef_date": "2025-01-01",
+                "authority": "CEM 1/25",
+            },
+            format="json",
+        )
+        salary_adjustment_status_url = reverse(
+            "salary-adjustment-status", kwargs={"task_id": response.data["task_id"]}
+        )
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            get_task(response.data["task_id"], admin.id)["type"], "salary_adjustment"
+        )
+
+        # Send status request
+        response = self.client.get(salary_adjustment_status_url)
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {"status": "PENDING", "progress": 0})
+
+        self.client.force_authenticate(user=self.create_admin("other_admin"))
+
+        # Send status request
+        response = self.client.get(salary_adjustment_status_url)
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_salary_adjustment_progress(self):
+        args = [self.percentage.id, "2025-01-01", "CEM 1/25", self.standard_user.id]
+        task = dispatch_task(
+            apply_salary_adjustment,
+            args,
+            task_type="salary_adjustment",
+            owner_id=self.standard_user.id,
+        )
+
+        # Runs the task as a worker would pick it up
+        apply_salary_adjustment.apply(
+            args=args, kwargs={"batch_size": 1}, task_id=task.id
+        )
+
+        # Assertions
+        self.assertEqual(
+            get_task(task.id, self.standard_user.id)["status"], "SUCCESS"
+        )
+        self.assertEqual(get_task(task.id, self.standard_user.id)["progress"], 100)
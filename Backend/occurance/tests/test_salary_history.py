@@ -0,0 +1,119 @@
+from .base import EmployeeBaseAPITestCase
+from django.urls import reverse
+from rest_framework import status
+from employees.models import Employee
+from occurance.models import Occurrence
+
+
+class SalaryHistoryAPITest(EmployeeBaseAPITestCase):
+
+    def setUp(self):
+        self.salary_history_url = reverse(
+            "employee-salary-history", kwargs={"pk": "000993"}
+        )
+        self.salary_statistics_url = reverse("salary-statistics")
+
+        self.employee = self.create_employee("000993")
+        self.other_employee = self.create_employee("020124")
+
+        self.create_occurrence(self.employee, "1000.00", "2024-01-01")
+        self.create_occurrence(self.employee, "1100.00", "2024-06-01")
+        self.create_occurrence(self.employee, "1200.00", "2025-03-01")
+        self.create_occurrence(self.other_employee, "2000.00", "2024-02-01")
+
+        self.authenticate_standard_user()
+
+    def create_employee(self, service_id):
+        return Employee.objects.create(
+            service_id=service_id,
+            last_name="Kana",
+            other_names="Steve",
+            gender=self.gender,
+            unit=self.unit,
+            grade=self.grade,
+            station="Accra",
+            structure=self.structure,
+            social_security="C019000819236",
+            category="Junior",
+            appointment_date="2025-11-25",
+        )
+
+    def create_occurrence(self, employee, monthly_salary, wef_date):
+        return Occurrence.objects.create(
+            employee=employee,
+            grade=self.grade,
+            authority="CEM 20/24",
+            level_step=self.level_step,
+            monthly_salary=monthly_salary,
+            annual_salary="0.00",
+            event=self.event,
+            wef_date=wef_date,
+            reason="Newly Employed",
+        )
+
+    def test_salary_history(self):
+        # Send salary history request
+        response = self.client.get(self.salary_history_url)
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.json()["columns"],
+            ["wef_date", "monthly_salary", "grade", "level_step"],
+        )
+        self.assertEqual(
+            response.json()["results"],
+            [
+                ["2024-01-01", "1000.00", "Programmer", "25H01"],
+                ["2024-06-01", "1100.00", "Programmer", "25H01"],
+                ["2025-03-01", "1200.00", "Programmer", "25H01"],
+            ],
+        )
+
+    def test_salary_history_by_year(self):
+        # Send salary history request
+        response = self.client.get(self.salary_history_url, {"interval": "year"})
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [row[0] for row in response.json()["results"]],
+            ["2024-06-01", "2025-03-01"],
+        )
+
+    def test_salary_statistics(self):
+        # Send salary statistics request
+        response = self.client.get(self.salary_statistics_url)
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data["results"],
+            [
+                {
+                    "year": 2024,
+                    "grade": "Programmer",
+                    "employees": 2,
+                    "average_salary": "1366.67",
+                    "minimum_salary": "1000.00",
+                    "maximum_salary": "2000.00",
+                },
+                {
+                    "year": 2025,
+                    "grade": "Programmer",
+                    "employees": 1,
+                    "average_salary": "1200.00",
+                    "minimum_salary": "1200.00",
+                    "maximum_salary": "1200.00",
+                },
+            ],
+        )
+
+        self.create_occurrence(self.other_employee, "3000.00", "2025-04-01")
+
+        # Send salary statistics request
+        response = self.client.get(self.salary_statistics_url, {"start_year": 2025})
+
+        # Assertions
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertEqual(response.data["results"][0]["average_salary"], "2100.00")
@@ -4,6 +4,16 @@ from . import views
 urlpatterns = [
     # Occurrence
     path("create/", views.CreateOccurrenceAPIView.as_view(), name="create-occurrence"),
+    path(
+        "current-salary/",
+        views.ListCurrentSalaryAPIView.as_view(),
+        name="list-current-salary",
+    ),
+    path(
+        "salary-statistics/",
+        views.SalaryStatisticsAPIView.as_view(),
+        name="salary-statistics",
+    ),
     path(
         "<str:pk>/",
         views.RetrieveOccurrenceAPIView.as_view(),
@@ -17,6 +27,16 @@ urlpatterns = [
         views.ListEmployeeOccurrenceAPIView.as_view(),
         name="list-employee-occurrence",
     ),
+    path(
+        "<str:pk>/employee/salary-history/",
+        views.EmployeeSalaryHistoryAPIView.as_view(),
+        name="employee-salary-history",
+    ),
+    path(
+        "<str:pk>/employee/current-salary/",
+        views.RetrieveEmployeeCurrentSalaryAPIView.as_view(),
+        name="retrieve-employee-current-salary",
+    ),
     path(
         "<str:pk>/delete/",
         views.DeleteOccurrenceAPIView.as_view(),
@@ -102,6 +122,22 @@ urlpatterns = [
         views.DeleteSalaryAdjustmentPercentageAPIView.as_view(),
         name="delete-percentage-adjustment",
     ),
+    # Salary Adjustment
+    path(
+        "salary-adjustment/apply/",
+        views.ApplySalaryAdjustmentAPIView.as_view(),
+        name="apply-salary-adjustment",
+    ),
+    path(
+        "salary-adjustment/<str:task_id>/status/",
+        views.SalaryAdjustmentStatusAPIView.as_view(),
+        name="salary-adjustment-status",
+    ),
+    path(
+        "salary-adjustment/projection/",
+        views.PayrollProjectionAPIView.as_view(),
+        name="payroll-projection",
+    ),
     # Incomplete Occurrence
     path(
         "incomplete-occurrence/create/",
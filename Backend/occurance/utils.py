@@ -1,5 +1,17 @@
+import re
+from collections import namedtuple
 from decimal import Decimal, ROUND_HALF_UP
 
+# Authorities are written as "<prefix> <serial number>/<year>", e.g. "CEM 20/24".
+# Longer numbers are left unparsed, they would not fit the integer columns.
+AUTHORITY_PATTERN = re.compile(
+    r"^\s*([A-Za-z]*)\s*(\d{1,9})\s*/\s*(\d{1,4})\s*$"
+)
+
+AuthorityComponents = namedtuple(
+    "AuthorityComponents", ["prefix", "serial_number", "year"]
+)
+
 
 def generate_text(fields):
     changes = [
@@ -48,3 +60,23 @@ def incomplete_occurrence_changes(previous, current):
     fields.append(("Service ID", previous.service_id, current.service_id))
     changes = generate_text(fields)
     return changes
+
+
+def parse_authority(authority):
+    match = AUTHORITY_PATTERN.match(authority or "")
+
+    if not match:
+        return AuthorityComponents(None, None, None)
+
+    prefix, serial_number, year = match.groups()
+
+    return AuthorityComponents(prefix.upper() or None, int(serial_number), int(year))
+
+
+def set_authority_components(instance):
+    components = parse_authority(instance.authority)
+
+    instance.authority_serial_number = components.serial_number
+    instance.authority_year = components.year
+
+    return instance
@@ -5,11 +5,12 @@ from .models import (
     SalaryAdjustmentPercentage,
     Event,
     IncompleteOccurrence,
+    CurrentSalary,
 )
 from . import serializers
 from rest_framework.permissions import IsAuthenticated, IsAdminUser
 from employees.permissions import IsAdminUserOrStandardUser
-from rest_framework.throttling import UserRateThrottle
+from api.throttles import BulkThrottle, ReadThrottle, WriteThrottle
 from rest_framework.response import Response
 from rest_framework import status
 from activity_feeds.models import ActivityFeeds
@@ -17,17 +18,25 @@ import logging
 from .utils import occurrence_changes, level_step_changes, incomplete_occurrence_changes
 from employees.models import Employee
 from django.shortcuts import get_object_or_404
-from .utils import two_dp
-from django.db.models import IntegerField, Value
-from django.db.models.functions import Cast, Substr, StrIndex
+from .salary import calculate_salary
+from .scales import SCALE_START_DATE, get_monthly_rate, set_level_step_rate
+from django.db.models import F
 from flags.services import create_flag, delete_flag
-from employees.views import LargeResultsSetPagination
+from employees.views import EmployeeResponseCacheMixin, LargeResultsSetPagination
 from rest_framework.response import Response
 from rest_framework import status
 from django.db import transaction
 from rest_framework.views import APIView
 from employees.services import get_grades
 from employees.serializers import ListGradesSerializer
+from .services import (
+    SALARY_HISTORY_COLUMNS,
+    apply_salary_adjustment,
+    get_salary_history,
+    get_salary_statistics,
+    project_payroll_cost,
+)
+from api.task_registry import dispatch_task, get_task
 
 logger = logging.getLogger(__name__)
 
@@ -37,7 +46,7 @@ class CreateOccurrenceAPIView(generics.CreateAPIView):
     queryset = Occurrence.objects.all()
     serializer_class = serializers.OccurrenceUpdateSerializer
     permission_classes = [IsAdminUserOrStandardUser, IsAuthenticated]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def create(self, request, *args, **kwargs):
         occurrence_data = request.data
@@ -93,7 +102,7 @@ class EditOccurrenceAPIView(generics.UpdateAPIView):
     queryset = Occurrence.objects.all()
     serializer_class = serializers.OccurrenceUpdateSerializer
     permission_classes = [IsAdminUserOrStandardUser, IsAuthenticated]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def update(self, request, *args, **kwargs):
         partial = kwargs.pop("partial", False)
@@ -133,7 +142,8 @@ class RetrieveOccurrenceAPIView(generics.RetrieveAPIView):
     throttle_classes = []
 
 
-class ListEmployeeOccurrenceAPIView(generics.ListAPIView):
+class ListEmployeeOccurrenceAPIView(EmployeeResponseCacheMixin, generics.ListAPIView):
+    cache_resource = "occurrences"
     serializer_class = serializers.OccurrenceReadSerializer
     permission_classes = [IsAdminUserOrStandardUser, IsAuthenticated]
     throttle_classes = []
@@ -145,24 +155,90 @@ class ListEmployeeOccurrenceAPIView(generics.ListAPIView):
             employee.occurrences.select_related(
                 "employee", "created_by", "updated_by", "grade", "level_step", "event"
             )
-            .annotate(
-                serial_number=Cast(
-                    Substr("authority", 5, StrIndex("authority", Value("/")) - 5),
-                    IntegerField(),
-                )
-            )
-            .order_by("-serial_number")
+            .order_by(F("authority_serial_number").desc(nulls_last=True), "-id")
         )
 
         return occurrences
 
 
+class EmployeeSalaryHistoryAPIView(APIView):
+    http_method_names = ["get"]
+    permission_classes = [IsAdminUserOrStandardUser, IsAuthenticated]
+    throttle_classes = []
+
+    def get(self, request, *args, **kwargs):
+        employee = get_object_or_404(Employee, pk=self.kwargs.get("pk"))
+
+        serializer = serializers.SalaryHistoryQuerySerializer(
+            data=request.query_params
+        )
+        serializer.is_valid(raise_exception=True)
+
+        results = get_salary_history(
+            employee.service_id, serializer.validated_data.get("interval")
+        )
+
+        return Response(
+            {
+                "service_id": employee.service_id,
+                "columns": SALARY_HISTORY_COLUMNS,
+                "results": results,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
+class SalaryStatisticsAPIView(APIView):
+    http_method_names = ["get"]
+    permission_classes = [IsAdminUserOrStandardUser, IsAuthenticated]
+    throttle_classes = []
+
+    def get(self, request, *args, **kwargs):
+        serializer = serializers.SalaryStatisticsQuerySerializer(
+            data=request.query_params
+        )
+        serializer.is_valid(raise_exception=True)
+
+        results = get_salary_statistics(**serializer.validated_data)
+
+        return Response({"results": results}, status=status.HTTP_200_OK)
+
+
+class RetrieveEmployeeCurrentSalaryAPIView(generics.RetrieveAPIView):
+    queryset = CurrentSalary.objects.select_related("grade", "level_step")
+    lookup_field = "pk"
+    serializer_class = serializers.CurrentSalaryReadSerializer
+    permission_classes = [IsAdminUserOrStandardUser, IsAuthenticated]
+    throttle_classes = []
+
+
+class ListCurrentSalaryAPIView(generics.ListAPIView):
+    serializer_class = serializers.CurrentSalaryReadSerializer
+    permission_classes = [IsAdminUserOrStandardUser, IsAuthenticated]
+    throttle_classes = []
+    pagination_class = LargeResultsSetPagination
+
+    def get_queryset(self):
+        unit = self.request.query_params.get("unit")
+        grade = self.request.query_params.get("grade")
+
+        qs = CurrentSalary.objects.select_related("grade", "level_step")
+
+        if unit:
+            qs = qs.filter(employee__unit=unit)
+
+        if grade:
+            qs = qs.filter(grade=grade)
+
+        return qs.order_by("employee_id")
+
+
 class DeleteOccurrenceAPIView(generics.DestroyAPIView):
     queryset = Occurrence.objects.all()
     lookup_field = "pk"
     serializer_class = serializers.OccurrenceWriteSerializer
     permission_classes = [IsAdminUserOrStandardUser, IsAuthenticated]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def perform_destroy(self, instance):
         with transaction.atomic():
@@ -183,13 +259,20 @@ class CreateLevelStepAPIView(generics.CreateAPIView):
     queryset = LevelStep.objects.all()
     serializer_class = serializers.LevelStepSerializer
     permission_classes = [IsAdminUser, IsAuthenticated]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def perform_create(self, serializer):
         with transaction.atomic():
+            effective_from = serializer.validated_data.pop("effective_from", None)
             level_step = serializer.save()
             logger.debug(f"Level|Step({level_step}) created.")
 
+            set_level_step_rate(
+                level_step,
+                level_step.monthly_salary,
+                effective_from or SCALE_START_DATE,
+            )
+
             ActivityFeeds.objects.create(
                 creator=self.request.user,
                 activity=(
@@ -206,16 +289,41 @@ class EditLevelStepAPIView(generics.UpdateAPIView):
     serializer_class = serializers.LevelStepSerializer
     lookup_field = "pk"
     permission_classes = [IsAdminUser, IsAuthenticated]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def perform_update(self, serializer):
         with transaction.atomic():
             previous_level_step = self.get_object()
+
+            # A new monthly salary is recorded as a rate so calculations for
+            # earlier WEF dates keep the salary that applied then
+            effective_from = serializer.validated_data.pop("effective_from", None)
+            monthly_salary = serializer.validated_data.pop(
+                "monthly_salary", previous_level_step.monthly_salary
+            )
             level_step_update = serializer.save()
+
+            rate = None
+            if effective_from or monthly_salary != previous_level_step.monthly_salary:
+                rate = set_level_step_rate(
+                    level_step_update, monthly_salary, effective_from
+                )
+
             logger.debug(f"Level|Step({previous_level_step}) updated.")
 
             changes = level_step_changes(previous_level_step, level_step_update)
 
+            if rate and rate.monthly_salary != level_step_update.monthly_salary:
+                changes = " — ".join(
+                    filter(
+                        None,
+                        [
+                            changes,
+                            f"Monthly Salary from {rate.effective_from}: {rate.monthly_salary}",
+                        ],
+                    )
+                )
+
             if changes:
                 ActivityFeeds.objects.create(
                     creator=self.request.user,
@@ -246,7 +354,7 @@ class DeleteLevelStepAPIView(generics.DestroyAPIView):
     serializer_class = serializers.LevelStepSerializer
     lookup_field = "pk"
     permission_classes = [IsAdminUser, IsAuthenticated]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def perform_destroy(self, instance):
         with transaction.atomic():
@@ -271,10 +379,21 @@ class CalculateAnnualSalary(generics.RetrieveAPIView):
 
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()
+
+        query_serializer = serializers.SalaryScaleQuerySerializer(
+            data=request.query_params
+        )
+        query_serializer.is_valid(raise_exception=True)
+
         serializer = self.get_serializer(instance)
         data = serializer.data
-        annual_salary = two_dp(two_dp(data["monthly_salary"]) * two_dp(12))
-        data.update(annual_salary=str(annual_salary))
+        wef_date = query_serializer.validated_data.get("wef_date")
+        monthly_salary, annual_salary = calculate_salary(
+            get_monthly_rate(instance.id, wef_date)
+        )
+        data.update(
+            monthly_salary=str(monthly_salary), annual_salary=str(annual_salary)
+        )
         return Response(data)
 
 
@@ -283,7 +402,7 @@ class CreateEventAPIView(generics.CreateAPIView):
     queryset = Event.objects.all()
     serializer_class = serializers.EventSerializer
     permission_classes = [IsAdminUser, IsAuthenticated]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def perform_create(self, serializer):
         with transaction.atomic():
@@ -304,7 +423,7 @@ class EditEventAPIView(generics.UpdateAPIView):
     serializer_class = serializers.EventSerializer
     lookup_field = "pk"
     permission_classes = [IsAdminUser, IsAuthenticated]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def perform_update(self, serializer):
         with transaction.atomic():
@@ -343,7 +462,7 @@ class DeleteEventAPIView(generics.DestroyAPIView):
     serializer_class = serializers.EventSerializer
     lookup_field = "pk"
     permission_classes = [IsAdminUser, IsAuthenticated]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def perform_destroy(self, instance):
         with transaction.atomic():
@@ -364,7 +483,7 @@ class CreateSalaryAdjustmentPercentageAPIView(generics.CreateAPIView):
     queryset = SalaryAdjustmentPercentage.objects.all()
     serializer_class = serializers.SalaryAdjustmentPercentageSerializer
     permission_classes = [IsAdminUser, IsAuthenticated]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def perform_create(self, serializer):
         with transaction.atomic():
@@ -389,7 +508,7 @@ class EditSalaryAdjustmentPercentageAPIView(generics.UpdateAPIView):
     serializer_class = serializers.SalaryAdjustmentPercentageSerializer
     lookup_field = "pk"
     permission_classes = [IsAdminUser, IsAuthenticated]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def perform_update(self, serializer):
         with transaction.atomic():
@@ -433,7 +552,7 @@ class DeleteSalaryAdjustmentPercentageAPIView(generics.DestroyAPIView):
     serializer_class = serializers.SalaryAdjustmentPercentageSerializer
     lookup_field = "pk"
     permission_classes = [IsAdminUser, IsAuthenticated]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def perform_destroy(self, instance):
         with transaction.atomic():
@@ -449,12 +568,75 @@ class DeleteSalaryAdjustmentPercentageAPIView(generics.DestroyAPIView):
             )
 
 
+class ApplySalaryAdjustmentAPIView(generics.GenericAPIView):
+    serializer_class = serializers.SalaryAdjustmentSerializer
+    permission_classes = [IsAdminUser, IsAuthenticated]
+    throttle_classes = [BulkThrottle]
+
+    def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        data = serializer.validated_data
+        scope = data["scope"]
+        scope_object = data.get(scope)
+
+        task = dispatch_task(
+            apply_salary_adjustment,
+            [
+                data["percentage_adjustment"].id,
+                data["wef_date"].isoformat(),
+                data["authority"],
+                request.user.id,
+                scope,
+                scope_object.id if scope_object else None,
+            ],
+            task_type="salary_adjustment",
+            owner_id=request.user.id,
+        )
+        logger.debug(f"Salary adjustment task({task.id}) started.")
+
+        return Response(
+            {"message": "Salary adjustment started successfully", "task_id": task.id}
+        )
+
+
+class SalaryAdjustmentStatusAPIView(APIView):
+    permission_classes = [IsAdminUser, IsAuthenticated]
+    throttle_classes = [ReadThrottle]
+
+    def get(self, request, task_id):
+        task = get_task(task_id, request.user.id)
+
+        if task is None:
+            return Response(
+                {"detail": "Salary adjustment not found"},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        return Response({"status": task["status"], "progress": task["progress"]})
+
+
+class PayrollProjectionAPIView(generics.GenericAPIView):
+    serializer_class = serializers.PayrollProjectionSerializer
+    permission_classes = [IsAdminUserOrStandardUser, IsAuthenticated]
+    throttle_classes = []
+
+    def get(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        projection = project_payroll_cost(**serializer.validated_data)
+
+        return Response(projection, status=status.HTTP_200_OK)
+
+
 # *INCOMPLETE OCCURRENCE
 class CreateIncompleteOccurrenceAPIView(generics.CreateAPIView):
     queryset = IncompleteOccurrence.objects.all()
     serializer_class = serializers.IncompleteOccurrenceWriteSerializer
     permission_classes = [IsAdminUserOrStandardUser, IsAuthenticated]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
@@ -495,7 +677,7 @@ class EditIncompleteOccurrenceAPIView(generics.UpdateAPIView):
     queryset = IncompleteOccurrence.objects.all()
     serializer_class = serializers.IncompleteOccurrenceUpdateSerializer
     permission_classes = [IsAdminUserOrStandardUser, IsAuthenticated]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def update(self, request, *args, **kwargs):
         partial = kwargs.pop("partial", False)
@@ -546,7 +728,10 @@ class RetrieveIncompleteOccurrenceAPIView(generics.RetrieveAPIView):
     throttle_classes = []
 
 
-class ListEmployeeIncompleteOccurrenceAPIView(generics.ListAPIView):
+class ListEmployeeIncompleteOccurrenceAPIView(
+    EmployeeResponseCacheMixin, generics.ListAPIView
+):
+    cache_resource = "incomplete_occurrences"
     serializer_class = serializers.IncompleteOccurrenceReadSerializer
     permission_classes = [IsAdminUserOrStandardUser, IsAuthenticated]
     throttle_classes = []
@@ -556,7 +741,7 @@ class ListEmployeeIncompleteOccurrenceAPIView(generics.ListAPIView):
         employee = get_object_or_404(Employee, pk=service_id)
         incomplete_occurrence = employee.incomplete_occurrence.select_related(
             "created_by", "updated_by", "grade", "level_step", "event"
-        )
+        ).order_by(F("authority_serial_number").desc(nulls_last=True), "-id")
         return incomplete_occurrence
 
 
@@ -575,7 +760,7 @@ class DeleteIncompleteOccurrenceAPIView(generics.DestroyAPIView):
     lookup_field = "pk"
     serializer_class = serializers.IncompleteOccurrenceWriteSerializer
     permission_classes = [IsAdminUserOrStandardUser, IsAuthenticated]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def perform_destroy(self, instance):
         with transaction.atomic():
@@ -5,7 +5,7 @@ from .models import (
     PreviousGovernmentService,
     IncompletePreviousGovernmentServiceRecords,
 )
-from rest_framework.throttling import UserRateThrottle
+from api.throttles import WriteThrottle
 from rest_framework.permissions import IsAuthenticated
 from employees.permissions import IsAdminUserOrStandardUser
 from activity_feeds.models import ActivityFeeds
@@ -16,7 +16,7 @@ from .utils import (
     incomplete_previous_government_service_changes,
 )
 from flags.services import create_flag, delete_flag
-from employees.views import LargeResultsSetPagination
+from employees.views import EmployeeResponseCacheMixin, LargeResultsSetPagination
 from rest_framework.response import Response
 from rest_framework import status
 from django.db import transaction
@@ -27,7 +27,7 @@ logger = logging.getLogger(__name__)
 class CreatePreviousGovernmentServiceAPIView(generics.CreateAPIView):
     serializer_class = serializers.PreviousGovernmentServiceWriteSerializer
     queryset = PreviousGovernmentService.objects.all()
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
 
     def create(self, request, *args, **kwargs):
@@ -64,7 +64,7 @@ class EditPreviousGovernmentServiceAPIView(generics.UpdateAPIView):
     queryset = PreviousGovernmentService.objects.all()
     serializer_class = serializers.PreviousGovernmentServiceWriteSerializer
     lookup_field = "pk"
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
 
     def update(self, request, *args, **kwargs):
@@ -105,7 +105,10 @@ class EditPreviousGovernmentServiceAPIView(generics.UpdateAPIView):
                 )
 
 
-class ListEmployeePreviousGovernmentServiceAPIView(generics.ListAPIView):
+class ListEmployeePreviousGovernmentServiceAPIView(
+    EmployeeResponseCacheMixin, generics.ListAPIView
+):
+    cache_resource = "previous_government_service"
     serializer_class = serializers.PreviousGovernmentServiceReadSerializer
     throttle_classes = []
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
@@ -133,7 +136,7 @@ class DeletePreviousGovernmentServiceAPIView(generics.DestroyAPIView):
     queryset = PreviousGovernmentService.objects.all()
     serializer_class = serializers.PreviousGovernmentServiceWriteSerializer
     lookup_field = "pk"
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
 
     def perform_destroy(self, instance):
@@ -155,7 +158,7 @@ class CreateIncompletePreviousGovernmentServiceRecordsAPIView(generics.CreateAPI
     queryset = IncompletePreviousGovernmentServiceRecords.objects.all()
     serializer_class = serializers.IncompletePreviousGovernmentServiceWriteSerializer
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
@@ -211,8 +214,9 @@ class ListIncompletePreviousGovernmentServiceRecordsAPIView(generics.ListAPIView
 
 
 class ListEmployeeIncompletePreviousGovernmentServiceRecordsAPIView(
-    generics.ListAPIView
+    EmployeeResponseCacheMixin, generics.ListAPIView
 ):
+    cache_resource = "incomplete_previous_government_service"
     serializer_class = serializers.IncompletePreviousGovernmentServiceReadSerializer
     throttle_classes = []
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
@@ -233,7 +237,7 @@ class EditIncompletePreviousGovernmentServiceRecordsAPIView(generics.UpdateAPIVi
     lookup_field = "pk"
     serializer_class = serializers.IncompletePreviousGovernmentServiceWriteSerializer
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def update(self, request, *args, **kwargs):
         partial = kwargs.pop("partial", False)
@@ -273,7 +277,7 @@ class DeleteIncompletePreviousGovernmentServiceRecordsAPIView(generics.DestroyAP
     lookup_field = "pk"
     serializer_class = serializers.IncompletePreviousGovernmentServiceWriteSerializer
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def perform_destroy(self, instance):
         with transaction.atomic():
@@ -0,0 +1,87 @@
+import json
+import logging
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.core.cache import cache
+from django_redis import get_redis_connection
+from redis.exceptions import WatchError
+from .deltas import diff
+
+logger = logging.getLogger(__name__)
+
+# Clients that fall behind resync from the latest snapshot; once it expires
+# the next broadcast is a full snapshot again
+SNAPSHOT_TIMEOUT = 60 * 60 * 24
+
+
+def get_snapshot_key(topic):
+    return cache.make_key(f"realtime:snapshot:{topic}")
+
+
+def serialize(message):
+    return json.dumps(message, separators=(",", ":"))
+
+
+def get_snapshot(topic):
+    # The serialized snapshot message, sent as is on subscribe and resync
+    snapshot = get_redis_connection("default").get(get_snapshot_key(topic))
+
+    return snapshot.decode() if snapshot else None
+
+
+def save_snapshot(topic, event_type, data):
+    # Stores the next version of the topic's payload and returns the message
+    # to broadcast: the changes since the previous version, or the snapshot
+    # itself when there is no previous version or it is shorter
+    key = get_snapshot_key(topic)
+
+    with get_redis_connection("default").pipeline() as pipeline:
+        while True:
+            try:
+                # Retried if another process saves a version meanwhile, so
+                # every version is the one before it plus its ops
+                pipeline.watch(key)
+                previous = pipeline.get(key)
+                previous = json.loads(previous) if previous else None
+                version = previous["version"] + 1 if previous else 1
+
+                snapshot = serialize(
+                    {"type": event_type, "version": version, "data": data}
+                )
+                message = snapshot
+
+                if previous is not None:
+                    ops = diff(previous["data"], data)
+
+                    if not ops:
+                        pipeline.unwatch()
+                        return None
+
+                    delta = serialize(
+                        {"type": event_type, "version": version, "ops": ops}
+                    )
+
+                    if len(delta) < len(snapshot):
+                        message = delta
+
+                pipeline.multi()
+                pipeline.set(key, snapshot, ex=SNAPSHOT_TIMEOUT)
+                pipeline.execute()
+
+                return message
+
+            except WatchError:
+                continue
+
+
+def publish(topic, event_type, data):
+    message = save_snapshot(topic, event_type, data)
+
+    if message is None:
+        logger.debug(f"No {topic} changes to broadcast.")
+        return
+
+    # Serialized once here; consumers send the text as is
+    async_to_sync(get_channel_layer().group_send)(
+        topic, {"type": "send_dashboard_stats", "text": message}
+    )
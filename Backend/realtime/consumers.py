@@ -1,20 +1,103 @@
 import json
+from asgiref.sync import sync_to_async
 from channels.generic.websocket import AsyncWebsocketConsumer
+from api.task_registry import get_task, get_task_group
+from .broadcast import get_snapshot
+from .groups import TOPICS, get_user_group
+from .middleware import TOKEN_SUBPROTOCOL
 
 
 class DashboardConsumer(AsyncWebsocketConsumer):
     async def connect(self):
-        await self.channel_layer.group_add("users", self.channel_name)
-        await self.channel_layer.group_add("employees", self.channel_name)
-        await self.channel_layer.group_add("feeds", self.channel_name)
-        await self.accept()
+        self.user = self.scope.get("user")
+        self.subscriptions = set()
+
+        if self.user is None or not self.user.is_authenticated:
+            await self.close(code=4401)
+            return
+
+        # Joined for the life of the socket; topics are opted into with
+        # subscribe messages, so sockets only get the broadcasts they show
+        await self.join(get_user_group(self.user.id))
+
+        # Clients that sent the token as a subprotocol expect it echoed back
+        if TOKEN_SUBPROTOCOL in self.scope.get("subprotocols", []):
+            await self.accept(subprotocol=TOKEN_SUBPROTOCOL)
+        else:
+            await self.accept()
 
     async def disconnect(self, code):
-        await self.channel_layer.group_discard("users", self.channel_name)
-        await self.channel_layer.group_discard("employees", self.channel_name)
-        await self.channel_layer.group_discard("feeds", self.channel_name)
+        for group in self.subscriptions:
+            await self.channel_layer.group_discard(group, self.channel_name)
+
+    async def join(self, group):
+        self.subscriptions.add(group)
+        await self.channel_layer.group_add(group, self.channel_name)
+
+    async def leave(self, group):
+        self.subscriptions.discard(group)
+        await self.channel_layer.group_discard(group, self.channel_name)
+
+    async def receive(self, text_data=None, bytes_data=None):
+        # {"action": "subscribe" | "unsubscribe" | "resync", "topic": "employees"}
+        # {"action": "subscribe_task" | "unsubscribe_task", "task_id": ...}
+        try:
+            message = json.loads(text_data or "")
+            action = message["action"]
+
+            if action in ["subscribe", "unsubscribe", "resync"]:
+                group = str(message["topic"])
+            else:
+                task_id = str(message["task_id"])
+                group = get_task_group(task_id)
+        except (ValueError, TypeError, KeyError):
+            return
+
+        if action in ["subscribe", "unsubscribe", "resync"] and group not in TOPICS:
+            await self.send_json({"type": "error", "detail": "Unknown topic."})
+            return
+
+        if action in ["subscribe", "resync"] and self.user.role not in TOPICS[group]:
+            await self.send_json({"type": "error", "detail": "Topic not allowed."})
+            return
+
+        # Only the task's owner can follow it
+        if action == "subscribe_task" and not await sync_to_async(get_task)(
+            task_id, self.user.id
+        ):
+            await self.send_json({"type": "error", "detail": "Task not found."})
+            return
+
+        # Acknowledged once the group is joined or left, so clients know
+        # from when updates arrive
+        if action in ["subscribe", "subscribe_task"]:
+            await self.join(group)
+            await self.send_json({"type": "subscribed", "topic": group})
+
+        elif action in ["unsubscribe", "unsubscribe_task"]:
+            await self.leave(group)
+            await self.send_json({"type": "unsubscribed", "topic": group})
+
+        # Topics are followed from their latest snapshot, so clients have a
+        # version to apply the following deltas to
+        if action in ["subscribe", "resync"]:
+            await self.send_snapshot(group)
+
+    async def send_snapshot(self, topic):
+        snapshot = await sync_to_async(get_snapshot)(topic)
+
+        # Without one the next broadcast is a full snapshot anyway
+        if snapshot is not None:
+            await self.send(text_data=snapshot)
+
+    async def send_json(self, data):
+        await self.send(text_data=json.dumps(data))
 
     async def send_dashboard_stats(self, event):
+        # Serialized once by realtime.broadcast for every subscriber
+        await self.send(text_data=event["text"])
+
+    async def task_status(self, event):
         await self.send(
-            text_data=json.dumps({"type": event["event_type"], "data": event["data"]})
+            text_data=json.dumps({"type": "task_status", "data": event["data"]})
         )
@@ -0,0 +1,66 @@
+# Changes between two dashboard payloads, as ops clients apply in order.
+# Paths are lists of keys and list indexes.
+#   ["set", path, value]      replaces the value at path
+#   ["unset", path]           removes a key
+#   ["add", path, values]     appends values to the list at path
+#   ["remove", path, values]  removes values from the list at path
+
+
+def is_scalar_list(values):
+    return all(not isinstance(value, (dict, list)) for value in values)
+
+
+def diff_scalar_lists(old, new, path):
+    # Lists such as a year's retiree service IDs, where an employee joining or
+    # leaving would otherwise resend the whole list
+    old_values, new_values = set(old), set(new)
+    removed = [value for value in old if value not in new_values]
+    added = [value for value in new if value not in old_values]
+
+    # Only when applying them rebuilds the list exactly, order included
+    if [value for value in old if value in new_values] + added != new:
+        return [["set", path, new]]
+
+    ops = []
+
+    if removed:
+        ops.append(["remove", path, removed])
+
+    if added:
+        ops.append(["add", path, added])
+
+    return ops
+
+
+def diff(old, new, path=None):
+    path = path or []
+
+    if type(old) is not type(new):
+        return [["set", path, new]]
+
+    if isinstance(new, dict):
+        ops = [["unset", [*path, key]] for key in old if key not in new]
+
+        for key, value in new.items():
+            if key in old:
+                ops.extend(diff(old[key], value, [*path, key]))
+            else:
+                ops.append(["set", [*path, key], value])
+
+        return ops
+
+    if isinstance(new, list):
+        if is_scalar_list(old) and is_scalar_list(new):
+            return diff_scalar_lists(old, new, path)
+
+        if len(old) != len(new):
+            return [["set", path, new]]
+
+        ops = []
+
+        for index, (old_value, new_value) in enumerate(zip(old, new)):
+            ops.extend(diff(old_value, new_value, [*path, index]))
+
+        return ops
+
+    return [] if old == new else [["set", path, new]]
@@ -0,0 +1,12 @@
+# Channel group names shared by the consumers and the code that sends to them
+
+# Dashboard topics clients can subscribe to, and the roles allowed to
+TOPICS = {
+    "users": ["ADMINISTRATOR"],
+    "employees": ["ADMINISTRATOR", "STANDARD USER"],
+    "feeds": ["ADMINISTRATOR", "STANDARD USER", "VIEWER"],
+}
+
+
+def get_user_group(user_id):
+    return f"user_{user_id}"
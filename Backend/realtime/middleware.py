@@ -0,0 +1,50 @@
+import logging
+from urllib.parse import parse_qs
+from channels.db import database_sync_to_async
+from channels.middleware import BaseMiddleware
+from django.contrib.auth.models import AnonymousUser
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from api.authentication import CachedJWTAuthentication
+
+logger = logging.getLogger(__name__)
+
+# Browsers cannot set headers on a WebSocket, so the access token comes either
+# as ?token=... or as the subprotocol after this one:
+# new WebSocket(url, ["access_token", token])
+TOKEN_SUBPROTOCOL = "access_token"
+
+
+def get_token(scope):
+    subprotocols = scope.get("subprotocols", [])
+
+    if TOKEN_SUBPROTOCOL in subprotocols:
+        index = subprotocols.index(TOKEN_SUBPROTOCOL)
+
+        if index + 1 < len(subprotocols):
+            return subprotocols[index + 1]
+
+    query = parse_qs(scope.get("query_string", b"").decode())
+
+    return query.get("token", [None])[0]
+
+
+@database_sync_to_async
+def get_user(raw_token):
+    authentication = CachedJWTAuthentication()
+
+    try:
+        return authentication.get_user(authentication.get_validated_token(raw_token))
+    except AuthenticationFailed as e:
+        logger.debug(f"WebSocket authentication failed. Exception({e})")
+        return AnonymousUser()
+
+
+class JWTAuthMiddleware(BaseMiddleware):
+    # Sets scope["user"] from the connection's access token, resolved through
+    # the same cache as the REST API
+
+    async def __call__(self, scope, receive, send):
+        token = get_token(scope)
+        scope["user"] = await get_user(token) if token else AnonymousUser()
+
+        return await super().__call__(scope, receive, send)
@@ -1,3 +1,244 @@
-from django.test import TestCase
+from asgiref.sync import sync_to_async
+from channels.testing import WebsocketCommunicator
+from django.test import SimpleTestCase, override_settings
+from api.models import CustomUser
+from api.services import send_otp_email_task
+from api.task_registry import dispatch_task, update_task
+from django_redis import get_redis_connection
+from .broadcast import get_snapshot_key, publish, save_snapshot
+from .consumers import DashboardConsumer
+from .deltas import diff
+from .groups import TOPICS
+from .middleware import JWTAuthMiddleware, get_token
 
-# Create your tests here.
+
+# Channels closes database connections around each message, which would end
+# a TestCase transaction, so these tests stay off the database and connect
+# with unsaved users. The Redis layer keeps state bound to the event loop each
+# test runs in, so they use the in-memory one.
+@override_settings(
+    CHANNEL_LAYERS={"default": {"BACKEND": "channels.layers.InMemoryChannelLayer"}}
+)
+class DashboardConsumerTest(SimpleTestCase):
+
+    def setUp(self):
+        # Snapshots from earlier runs would be sent on subscribe
+        get_redis_connection("default").delete(
+            *[get_snapshot_key(topic) for topic in TOPICS]
+        )
+
+    def get_communicator(self, user_id=1, role="STANDARD USER"):
+        communicator = WebsocketCommunicator(
+            DashboardConsumer.as_asgi(), "/ws/dashboard/"
+        )
+        communicator.scope["user"] = CustomUser(id=user_id, role=role)
+
+        return communicator
+
+    def test_get_token(self):
+        # Assertions
+        self.assertEqual(
+            get_token({"subprotocols": ["access_token", "abc"], "query_string": b""}),
+            "abc",
+        )
+        self.assertEqual(get_token({"query_string": b"token=abc"}), "abc")
+        self.assertIsNone(get_token({"query_string": b""}))
+
+    async def test_rejects_invalid_token(self):
+        communicator = WebsocketCommunicator(
+            JWTAuthMiddleware(DashboardConsumer.as_asgi()),
+            "/ws/dashboard/?token=invalid",
+        )
+        connected, code = await communicator.connect()
+
+        # Assertions
+        self.assertFalse(connected)
+        self.assertEqual(code, 4401)
+
+    async def test_receives_subscribed_topics_only(self):
+        communicator = self.get_communicator()
+        await communicator.connect()
+        await communicator.send_json_to({"action": "subscribe", "topic": "employees"})
+        subscribed = await communicator.receive_json_from()
+
+        for topic in ["feeds", "employees"]:
+            await sync_to_async(publish)(topic, f"{topic}_update", {})
+        message = await communicator.receive_json_from()
+
+        # Assertions
+        self.assertEqual(subscribed, {"type": "subscribed", "topic": "employees"})
+        self.assertEqual(message["type"], "employees_update")
+        self.assertTrue(await communicator.receive_nothing())
+
+        await communicator.disconnect()
+
+    async def test_topics_restricted_by_role(self):
+        communicator = self.get_communicator(role="VIEWER")
+        await communicator.connect()
+
+        for topic in ["users", "employees", "feeds"]:
+            await communicator.send_json_to({"action": "subscribe", "topic": topic})
+        responses = [await communicator.receive_json_from() for _ in range(3)]
+
+        # Assertions
+        self.assertEqual(
+            responses,
+            [
+                {"type": "error", "detail": "Topic not allowed."},
+                {"type": "error", "detail": "Topic not allowed."},
+                {"type": "subscribed", "topic": "feeds"},
+            ],
+        )
+
+        await communicator.disconnect()
+
+    def get_retirees(self, count):
+        return {"2031": [f"0123{index:02}" for index in range(count)]}
+
+    async def test_subscribe_sends_snapshot(self):
+        await sync_to_async(publish)(
+            "employees", "employee_update", self.get_retirees(10)
+        )
+
+        communicator = self.get_communicator()
+        await communicator.connect()
+        await communicator.send_json_to({"action": "subscribe", "topic": "employees"})
+        await communicator.receive_json_from()
+        snapshot = await communicator.receive_json_from()
+
+        await sync_to_async(publish)(
+            "employees", "employee_update", self.get_retirees(11)
+        )
+        delta = await communicator.receive_json_from()
+
+        await communicator.send_json_to({"action": "resync", "topic": "employees"})
+        resync = await communicator.receive_json_from()
+
+        # Assertions
+        self.assertEqual(snapshot["version"], 1)
+        self.assertEqual(snapshot["data"], self.get_retirees(10))
+        self.assertEqual(
+            delta,
+            {
+                "type": "employee_update",
+                "version": 2,
+                "ops": [["add", ["2031"], ["012310"]]],
+            },
+        )
+        self.assertEqual(resync["version"], 2)
+        self.assertEqual(resync["data"], self.get_retirees(11))
+
+        await communicator.disconnect()
+
+    async def test_subscribers_receive_task_updates(self):
+        task = dispatch_task(send_otp_email_task, [0], task_type="otp_email")
+
+        communicator = self.get_communicator()
+        await communicator.connect()
+        await communicator.send_json_to(
+            {"action": "subscribe_task", "task_id": task.id}
+        )
+        await communicator.receive_json_from()
+
+        await sync_to_async(update_task)(task.id, progress=50)
+        message = await communicator.receive_json_from()
+
+        # Assertions
+        self.assertEqual(message["type"], "task_status")
+        self.assertEqual(message["data"]["id"], task.id)
+        self.assertEqual(message["data"]["progress"], 50)
+
+        await communicator.disconnect()
+
+    async def test_owner_receives_task_updates(self):
+        task = dispatch_task(
+            send_otp_email_task, [0], task_type="otp_email", owner_id=1
+        )
+
+        owner = self.get_communicator(user_id=1)
+        other = self.get_communicator(user_id=2)
+        await owner.connect()
+        await other.connect()
+        await other.send_json_to({"action": "subscribe_task", "task_id": task.id})
+        refused = await other.receive_json_from()
+
+        await sync_to_async(update_task)(task.id, progress=50)
+        message = await owner.receive_json_from()
+
+        # Assertions
+        self.assertEqual(refused["type"], "error")
+        self.assertEqual(message["data"]["id"], task.id)
+        self.assertTrue(await other.receive_nothing())
+
+        await owner.disconnect()
+        await other.disconnect()
+
+
+class BroadcastTest(SimpleTestCase):
+
+    def setUp(self):
+        get_redis_connection("default").delete(get_snapshot_key("employees"))
+
+    def get_data(self, employees):
+        return {
+            "related_data": {"total_number_of_employees": len(employees)},
+            "forecasted_retirees": [
+                {"year": 2030, "count": 0, "employees": []},
+                {"year": 2031, "count": len(employees), "employees": employees},
+            ],
+        }
+
+    def test_first_broadcast_is_snapshot(self):
+        message = save_snapshot("employees", "employee_update", self.get_data([]))
+
+        # Assertions
+        self.assertIn('"version":1', message)
+        self.assertIn('"data":', message)
+
+    def test_changes_are_sent_as_delta(self):
+        save_snapshot("employees", "employee_update", self.get_data(["012344"]))
+        message = save_snapshot(
+            "employees", "employee_update", self.get_data(["012344", "012345"])
+        )
+
+        # Assertions
+        self.assertEqual(
+            message,
+            '{"type":"employee_update","version":2,"ops":['
+            '["set",["related_data","total_number_of_employees"],2],'
+            '["set",["forecasted_retirees",1,"count"],2],'
+            '["add",["forecasted_retirees",1,"employees"],["012345"]]]}',
+        )
+
+    def test_unchanged_payload_is_not_sent(self):
+        save_snapshot("employees", "employee_update", self.get_data(["012344"]))
+
+        # Assertions
+        self.assertIsNone(
+            save_snapshot("employees", "employee_update", self.get_data(["012344"]))
+        )
+
+
+class DiffTest(SimpleTestCase):
+
+    def test_removed_keys(self):
+        # Assertions
+        self.assertEqual(diff({"BN": 1, "IT": 2}, {"IT": 2}), [["unset", ["BN"]]])
+
+    def test_removed_values(self):
+        # Assertions
+        self.assertEqual(
+            diff({"ids": ["a", "b", "c"]}, {"ids": ["a", "c", "d"]}),
+            [["remove", ["ids"], ["b"]], ["add", ["ids"], ["d"]]],
+        )
+
+    def test_reordered_values(self):
+        # Assertions
+        self.assertEqual(diff(["a", "b"], ["b", "a"]), [["set", [], ["b", "a"]]])
+
+    def test_resized_lists(self):
+        # Assertions
+        self.assertEqual(
+            diff([{"BN": 1}], [{"BN": 1}, {"IT": 1}]),
+            [["set", [], [{"BN": 1}, {"IT": 1}]]],
+        )
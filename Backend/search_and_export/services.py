@@ -6,12 +6,13 @@ from employees.models import Employee
 from .query_builder import build_queryset
 import logging
 from uuid import uuid4
+from api.task_registry import update_task
 
 logger = logging.getLogger(__name__)
 
 
-@shared_task
-def generate_employee_excel_report(filters):
+@shared_task(bind=True)
+def generate_employee_excel_report(self, filters):
 
     qs = build_queryset(Employee, filters)
 
@@ -28,9 +29,13 @@ def generate_employee_excel_report(filters):
         "social_security",
         "category",
         "appointment_date",
+        "current_salary__level_step__level_step",
+        "current_salary__monthly_salary",
+        "current_salary__annual_salary",
     )
 
     df = pd.DataFrame(list(data))
+    update_task(self.request.id, progress=50)
 
     df.rename(
         columns={
@@ -46,6 +51,9 @@ def generate_employee_excel_report(filters):
             "social_security": "Social Security",
             "category": "Category",
             "appointment_date": "Appointment Date",
+            "current_salary__level_step__level_step": "Level|Step",
+            "current_salary__monthly_salary": "Monthly Salary",
+            "current_salary__annual_salary": "Annual Salary",
         },
         inplace=True,
     )
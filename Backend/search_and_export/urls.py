@@ -13,7 +13,7 @@ urlpatterns = [
         name="export-employee-search-results",
     ),
     path(
-        "employee/export/status",
+        "employee/export/status/<str:task_id>/",
         views.ExportStatusAPIView.as_view(),
         name="export-status",
     ),
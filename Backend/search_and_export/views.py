@@ -2,11 +2,11 @@ import logging
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.views import APIView
 from .services import generate_employee_excel_report
-from celery.result import AsyncResult
+from api.task_registry import dispatch_task, get_task
 from rest_framework import generics
 from employees.views import LargeResultsSetPagination
 from employees.serializers import EmployeeReadSerializer
-from rest_framework.throttling import UserRateThrottle
+from api.throttles import ExportThrottle, ReadThrottle
 from .query_builder import build_queryset
 from rest_framework.response import Response
 from rest_framework import status
@@ -33,22 +33,34 @@ class ListEmployeeRecordsAPIView(generics.GenericAPIView):
 
 class EmployeeExportAPIView(APIView):
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
+    throttle_classes = [ExportThrottle]
 
     def post(self, request):
         filters = request.data.get("filters", [])
 
-        task = generate_employee_excel_report.delay(filters)
+        task = dispatch_task(
+            generate_employee_excel_report,
+            [filters],
+            task_type="employee_export",
+            owner_id=request.user.id,
+        )
 
         return Response({"message": "Export started successfully", "task_id": task.id})
 
 
 class ExportStatusAPIView(APIView):
     permission_classes = [IsAuthenticated]
+    throttle_classes = [ReadThrottle]
 
     def get(self, request, task_id):
-        result = AsyncResult(task_id)
+        task = get_task(task_id, request.user.id)
 
-        if result.status == "SUCCESS":
-            return Response({"status": result.status, "file_url": result.result})
+        if task is None:
+            return Response(
+                {"detail": "Export not found"}, status=status.HTTP_404_NOT_FOUND
+            )
 
-        return Response({"status": result.status})
+        if task["status"] == "SUCCESS":
+            return Response({"status": task["status"], "file_url": task["result_url"]})
+
+        return Response({"status": task["status"], "progress": task["progress"]})
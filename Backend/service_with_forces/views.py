@@ -2,7 +2,7 @@ from rest_framework import generics
 import logging
 from . import serializers
 from .models import ServiceWithForces, MilitaryRanks, IncompleteServiceWithForcesRecords
-from rest_framework.throttling import UserRateThrottle
+from api.throttles import ReadThrottle, WriteThrottle
 from rest_framework.permissions import IsAuthenticated, IsAdminUser
 from employees.permissions import IsAdminUserOrStandardUser
 from activity_feeds.models import ActivityFeeds
@@ -14,7 +14,7 @@ from .utils import (
     incomplete_service_with_forces_changes,
 )
 from flags.services import create_flag, delete_flag
-from employees.views import LargeResultsSetPagination
+from employees.views import EmployeeResponseCacheMixin, LargeResultsSetPagination
 from rest_framework.response import Response
 from rest_framework import status
 from django.db import transaction
@@ -29,7 +29,7 @@ logger = logging.getLogger(__name__)
 class CreateServiceWithForcesAPIView(generics.CreateAPIView):
     serializer_class = serializers.ServiceWithForcesWriteSerializer
     queryset = ServiceWithForces.objects.all()
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
 
     def create(self, request, *args, **kwargs):
@@ -64,7 +64,7 @@ class EditServiceWithForcesAPIView(generics.UpdateAPIView):
     queryset = ServiceWithForces.objects.all()
     serializer_class = serializers.ServiceWithForcesWriteSerializer
     lookup_field = "pk"
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
 
     def update(self, request, *args, **kwargs):
@@ -105,7 +105,10 @@ class EditServiceWithForcesAPIView(generics.UpdateAPIView):
                 )
 
 
-class ListEmployeeServiceWithForcesAPIView(generics.ListAPIView):
+class ListEmployeeServiceWithForcesAPIView(
+    EmployeeResponseCacheMixin, generics.ListAPIView
+):
+    cache_resource = "service_with_forces"
     serializer_class = serializers.ServiceWithForcesReadSerializer
     throttle_classes = []
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
@@ -133,7 +136,7 @@ class DeleteServiceWithForcesAPIView(generics.DestroyAPIView):
     queryset = ServiceWithForces.objects.all()
     serializer_class = serializers.ServiceWithForcesWriteSerializer
     lookup_field = "pk"
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
 
     def perform_destroy(self, instance):
@@ -154,7 +157,7 @@ class DeleteServiceWithForcesAPIView(generics.DestroyAPIView):
 class CreateMilitaryRanksAPIView(generics.CreateAPIView):
     serializer_class = serializers.MilitaryRanksSerializer
     queryset = MilitaryRanks.objects.all()
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
     permission_classes = [IsAuthenticated, IsAdminUser]
 
     def perform_create(self, serializer):
@@ -175,7 +178,7 @@ class EditMilitaryRanksAPIView(generics.UpdateAPIView):
     queryset = MilitaryRanks.objects.all()
     serializer_class = serializers.MilitaryRanksSerializer
     lookup_field = "pk"
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
     permission_classes = [IsAuthenticated, IsAdminUser]
 
     def perform_update(self, serializer):
@@ -217,7 +220,7 @@ class DeleteMilitaryRanksAPIView(generics.DestroyAPIView):
     queryset = MilitaryRanks.objects.all()
     serializer_class = serializers.MilitaryRanksSerializer
     lookup_field = "pk"
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
     permission_classes = [IsAuthenticated, IsAdminUser]
 
     def perform_destroy(self, instance):
@@ -237,6 +240,7 @@ class DeleteMilitaryRanksAPIView(generics.DestroyAPIView):
 # LIST UNITS AND MILITARY RANKS
 class ListMilitaryRanksAndUnits(APIView):
     http_method_names = ["get"]
+    throttle_classes = [ReadThrottle]
 
     def get(self, request, *args, **kwargs):
         units = Units.objects.all()
@@ -257,7 +261,7 @@ class CreateIncompleteServiceWithForcesRecordsAPIView(generics.CreateAPIView):
     queryset = IncompleteServiceWithForcesRecords.objects.all()
     serializer_class = serializers.IncompleteServiceWithForcesRecordsWriteSerializer
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
@@ -310,7 +314,10 @@ class ListIncompleteServiceWithForcesRecordsAPIView(generics.ListAPIView):
     pagination_class = LargeResultsSetPagination
 
 
-class ListEmployeeIncompleteServiceWithForcesRecordsAPIView(generics.ListAPIView):
+class ListEmployeeIncompleteServiceWithForcesRecordsAPIView(
+    EmployeeResponseCacheMixin, generics.ListAPIView
+):
+    cache_resource = "incomplete_service_with_forces"
     serializer_class = serializers.IncompleteServiceWithForcesReadSerializer
     throttle_classes = []
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
@@ -331,7 +338,7 @@ class EditIncompleteServiceWithForcesRecordsAPIView(generics.UpdateAPIView):
     lookup_field = "pk"
     serializer_class = serializers.IncompleteServiceWithForcesRecordsWriteSerializer
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def update(self, request, *args, **kwargs):
         partial = kwargs.pop("partial", False)
@@ -372,7 +379,7 @@ class DeleteIncompleteServiceWithForcesRecordsAPIView(generics.DestroyAPIView):
     lookup_field = "pk"
     serializer_class = serializers.IncompleteServiceWithForcesRecordsWriteSerializer
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def perform_destroy(self, instance):
         with transaction.atomic():
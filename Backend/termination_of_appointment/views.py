@@ -2,7 +2,7 @@ from rest_framework import generics
 import logging
 from . import serializers
 from . import models
-from rest_framework.throttling import UserRateThrottle
+from api.throttles import ReadThrottle, WriteThrottle
 from rest_framework.permissions import IsAuthenticated, IsAdminUser
 from employees.permissions import IsAdminUserOrStandardUser
 from activity_feeds.models import ActivityFeeds
@@ -10,7 +10,7 @@ from django.shortcuts import get_object_or_404
 from employees.models import Employee
 from . import utils
 from flags.services import create_flag, delete_flag
-from employees.views import LargeResultsSetPagination
+from employees.views import EmployeeResponseCacheMixin, LargeResultsSetPagination
 from rest_framework.response import Response
 from rest_framework import status
 from django.db import transaction
@@ -23,7 +23,7 @@ logger = logging.getLogger(__name__)
 class CreateTerminationOfAppointmentAPIView(generics.CreateAPIView):
     serializer_class = serializers.TerminationOfAppointmentWriteSerializer
     queryset = models.TerminationOfAppointment.objects.all()
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
 
     def create(self, request, *args, **kwargs):
@@ -60,7 +60,7 @@ class EditTerminationOfAppointmentAPIView(generics.UpdateAPIView):
     queryset = models.TerminationOfAppointment.objects.all()
     serializer_class = serializers.TerminationOfAppointmentWriteSerializer
     lookup_field = "pk"
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
 
     def update(self, request, *args, **kwargs):
@@ -102,7 +102,10 @@ class EditTerminationOfAppointmentAPIView(generics.UpdateAPIView):
                 )
 
 
-class RetrieveEmployeeTerminationOfAppointmentAPIView(generics.RetrieveAPIView):
+class RetrieveEmployeeTerminationOfAppointmentAPIView(
+    EmployeeResponseCacheMixin, generics.RetrieveAPIView
+):
+    cache_resource = "termination"
     serializer_class = serializers.TerminationOfAppointmentReadSerializer
     throttle_classes = []
     lookup_field = "employee__pk"
@@ -129,7 +132,7 @@ class DeleteTerminationOfAppointmentAPIView(generics.DestroyAPIView):
     queryset = models.TerminationOfAppointment.objects.all()
     serializer_class = serializers.TerminationOfAppointmentWriteSerializer
     lookup_field = "pk"
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
 
     def perform_destroy(self, instance):
@@ -150,7 +153,7 @@ class DeleteTerminationOfAppointmentAPIView(generics.DestroyAPIView):
 class CreateCausesOfTerminationAPIView(generics.CreateAPIView):
     serializer_class = serializers.CausesOfTerminationSerializer
     queryset = models.CausesOfTermination.objects.all()
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
     permission_classes = [IsAuthenticated, IsAdminUser]
 
     def perform_create(self, serializer):
@@ -171,7 +174,7 @@ class EditCausesOfTerminationAPIView(generics.UpdateAPIView):
     queryset = models.CausesOfTermination.objects.all()
     serializer_class = serializers.CausesOfTerminationSerializer
     lookup_field = "pk"
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
     permission_classes = [IsAuthenticated, IsAdminUser]
 
     def perform_update(self, serializer):
@@ -215,7 +218,7 @@ class DeleteCausesOfTerminationAPIView(generics.DestroyAPIView):
     queryset = models.CausesOfTermination.objects.all()
     serializer_class = serializers.CausesOfTerminationSerializer
     lookup_field = "pk"
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
     permission_classes = [IsAuthenticated, IsAdminUser]
 
     def perform_destroy(self, instance):
@@ -236,7 +239,7 @@ class DeleteCausesOfTerminationAPIView(generics.DestroyAPIView):
 class CreateTerminationStatusAPIView(generics.CreateAPIView):
     serializer_class = serializers.TerminationStatusSerializer
     queryset = models.TerminationStatus.objects.all()
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
     permission_classes = [IsAuthenticated, IsAdminUser]
 
     def perform_create(self, serializer):
@@ -257,7 +260,7 @@ class EditTerminationStatusAPIView(generics.UpdateAPIView):
     queryset = models.TerminationStatus.objects.all()
     serializer_class = serializers.TerminationStatusSerializer
     lookup_field = "pk"
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
     permission_classes = [IsAuthenticated, IsAdminUser]
 
     def perform_update(self, serializer):
@@ -299,7 +302,7 @@ class DeleteTerminationStatusAPIView(generics.DestroyAPIView):
     queryset = models.TerminationStatus.objects.all()
     serializer_class = serializers.TerminationStatusSerializer
     lookup_field = "pk"
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
     permission_classes = [IsAuthenticated, IsAdminUser]
 
     def perform_destroy(self, instance):
@@ -319,6 +322,7 @@ class DeleteTerminationStatusAPIView(generics.DestroyAPIView):
 # LIST CAUSES AND STATUS
 class ListCauseAndStatusAPIView(APIView):
     http_method_names = ["get"]
+    throttle_classes = [ReadThrottle]
 
     def get(self, request, *args, **kwargs):
         causes = models.CausesOfTermination.objects.all()
@@ -341,7 +345,7 @@ class CreateIncompleteTerminationOfAppointmentRecordsAPIView(generics.CreateAPIV
     queryset = models.IncompleteTerminationOfAppointmentRecords.objects.all()
     serializer_class = serializers.IncompleteTerminationOfAppointmentWriteSerializer
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
@@ -419,7 +423,7 @@ class EditIncompleteTerminationOfAppointmentRecordsAPIView(generics.UpdateAPIVie
     lookup_field = "pk"
     serializer_class = serializers.IncompleteTerminationOfAppointmentWriteSerializer
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def update(self, request, *args, **kwargs):
         partial = kwargs.pop("partial", False)
@@ -460,7 +464,7 @@ class DeleteIncompleteTerminationOfAppointmentRecordsAPIView(generics.DestroyAPI
     lookup_field = "pk"
     serializer_class = serializers.IncompleteTerminationOfAppointmentWriteSerializer
     permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [WriteThrottle]
 
     def perform_destroy(self, instance):
         with transaction.atomic():
@@ -0,0 +1,9 @@
+from django.apps import AppConfig
+
+
+class WorkQueueConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "work_queue"
+
+    def ready(self):
+        import work_queue.signals
@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand, CommandError
+from api.models import CustomUser
+from work_queue.reconciliation import RECONCILERS, get_reconciler
+
+
+class Command(BaseCommand):
+    help = "Move complete incomplete records into their target models"
+
+    def add_arguments(self, parser):
+        parser.add_argument("username")
+        parser.add_argument(
+            "--model",
+            action="append",
+            help="Incomplete model name, e.g. incompleteoccurrence. Defaults to all.",
+        )
+        parser.add_argument("--dry-run", action="store_true")
+
+    def handle(self, *args, **options):
+        try:
+            user = CustomUser.objects.get(username=options["username"])
+        except CustomUser.DoesNotExist:
+            raise CommandError(f"User {options['username']} does not exist.")
+
+        for model_name in options["model"] or list(RECONCILERS):
+            try:
+                reconciler = get_reconciler(model_name)
+            except ValueError as exc:
+                raise CommandError(exc)
+
+            report = reconciler.reconcile(user, dry_run=options["dry_run"])
+
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"{report['model']}: {report['matched']} matched, "
+                    f"{report['reconciled']} reconciled, "
+                    f"{len(report['skipped'])} skipped"
+                    f"{' (dry run)' if report['dry_run'] else ''}"
+                )
+            )
+
+            for skipped in report["skipped"]:
+                self.stdout.write(
+                    f"  {skipped['id']} ({skipped['service_id']}): {skipped['errors']}"
+                )
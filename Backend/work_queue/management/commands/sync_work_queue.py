@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand
+from work_queue.services import (
+    INCOMPLETE_RECORD_MODELS,
+    delete_duplicate_work_items,
+    sync_work_items,
+)
+
+
+class Command(BaseCommand):
+    help = "Add existing incomplete records to the work queue"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+
+        for model in INCOMPLETE_RECORD_MODELS:
+            total = 0
+            batch = []
+
+            for instance in model.objects.iterator(chunk_size=batch_size):
+                batch.append(instance)
+
+                if len(batch) == batch_size:
+                    total += len(sync_work_items(batch))
+                    batch = []
+
+            total += len(sync_work_items(batch))
+
+            self.stdout.write(
+                self.style.SUCCESS(f"{model._meta.verbose_name}: {total} synced")
+            )
+
+        deleted = delete_duplicate_work_items()
+        self.stdout.write(self.style.SUCCESS(f"Duplicates: {deleted} removed"))
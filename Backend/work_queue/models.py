@@ -0,0 +1,44 @@
+from django.db import models
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.contenttypes.fields import GenericForeignKey
+from django.utils import timezone
+from api.models import CustomUser
+from employees.models import Units
+
+
+class WorkItem(models.Model):
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_id = models.CharField(max_length=20)
+    content_object = GenericForeignKey()
+    service_id = models.CharField(max_length=7, null=True, blank=True)
+    unit = models.ForeignKey(Units, on_delete=models.SET_NULL, null=True, blank=True)
+    # Starts with the record's creator, as work_queue.services syncs it, and
+    # records without one are left unassigned
+    assigned_to = models.ForeignKey(
+        CustomUser,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="assigned_work_items",
+    )
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        db_table = "work_items"
+        verbose_name = "work_item"
+        verbose_name_plural = "work_items"
+
+        constraints = [
+            models.UniqueConstraint(
+                fields=["content_type", "object_id"], name="unique_work_item"
+            )
+        ]
+        indexes = [
+            models.Index(fields=["created_at", "id"]),
+            models.Index(fields=["unit", "created_at", "id"]),
+            models.Index(fields=["assigned_to", "created_at", "id"]),
+            models.Index(fields=["service_id"]),
+        ]
+
+    def __str__(self):
+        return f"{self.content_type} - {self.object_id}"
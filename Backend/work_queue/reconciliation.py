@@ -0,0 +1,153 @@
+import logging
+from django.db import transaction
+from django.db.models import OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from activity_feeds.models import ActivityFeeds
+from employees.models import Employee
+from employees.services import invalidate_employee_profiles
+from flags.services import delete_flags
+
+logger = logging.getLogger(__name__)
+
+
+# Incomplete model name (as in WorkItem.content_type.model) -> Reconciler
+RECONCILERS = {}
+
+
+def register_reconciler(reconciler):
+    RECONCILERS[reconciler.incomplete_model._meta.model_name] = reconciler
+    return reconciler
+
+
+def get_reconciler(model_name):
+    try:
+        return RECONCILERS[model_name.lower()]()
+    except KeyError:
+        raise ValueError(f"No reconciler is registered for {model_name}.")
+
+
+class Reconciler:
+    # Promotes Incomplete* records into `model` once their employee can be
+    # resolved and the required fields are filled. Subclasses set the models
+    # and fields and may override validate(), build_instances() and
+    # after_reconcile().
+    incomplete_model = None
+    model = None
+    fields = []
+    required_fields = []
+
+    def get_queryset(self):
+        # Records without an employee are matched on service_id in the same
+        # query
+        return self.incomplete_model.objects.annotate(
+            matched_employee_id=Coalesce(
+                "employee_id",
+                Subquery(
+                    Employee.objects.filter(pk=OuterRef("service_id")).values("pk")
+                ),
+            )
+        ).order_by("id")
+
+    def validate(self, record):
+        errors = {}
+
+        if record.matched_employee_id is None:
+            errors["employee"] = "No employee matches this service ID."
+
+        for field in self.required_fields:
+            if getattr(record, field) in (None, ""):
+                errors[field] = "This field is required."
+
+        return errors
+
+    def build_instances(self, records):
+        return [
+            self.model(
+                employee_id=record.matched_employee_id,
+                **{field: getattr(record, field) for field in self.fields},
+            )
+            for record in records
+        ]
+
+    def after_reconcile(self, instances):
+        pass
+
+    def reconcile(self, user, dry_run=False):
+        label = self.incomplete_model._meta.verbose_name
+        records = []
+        skipped = []
+
+        for record in self.get_queryset():
+            errors = self.validate(record)
+
+            if errors:
+                skipped.append(
+                    {
+                        "id": record.id,
+                        "service_id": record.matched_employee_id or record.service_id,
+                        "errors": errors,
+                    }
+                )
+            else:
+                records.append(record)
+
+        report = {
+            "model": label,
+            "dry_run": dry_run,
+            "matched": len(records),
+            "reconciled": 0,
+            "skipped": skipped,
+        }
+
+        if dry_run or not records:
+            return report
+
+        instances = self.promote(records, user, skipped=len(skipped))
+        report["reconciled"] = len(instances)
+
+        return report
+
+    def promote(self, records, user, skipped=0):
+        label = self.incomplete_model._meta.verbose_name
+
+        with transaction.atomic():
+            # Records were validated without locks, so a concurrent run may
+            # have promoted or be promoting some of them. Those are locked or
+            # gone; the rest are read again under lock and revalidated.
+            records = [
+                record
+                for record in self.get_queryset()
+                .select_for_update(skip_locked=True, of=("self",))
+                .filter(id__in=[record.id for record in records])
+                if not self.validate(record)
+            ]
+
+            if not records:
+                return []
+
+            instances = self.model.objects.bulk_create(self.build_instances(records))
+            logger.debug(f"{len(instances)} {self.model._meta.verbose_name} created.")
+
+            # bulk_create skips the signals that invalidate cached profiles
+            invalidate_employee_profiles(
+                {instance.employee_id for instance in instances}
+            )
+
+            delete_flags(records, user)
+
+            self.incomplete_model.objects.filter(
+                id__in=[record.id for record in records]
+            ).delete()
+            logger.debug(f"{len(records)} {label} deleted.")
+
+            self.after_reconcile(instances)
+
+            ActivityFeeds.objects.create(
+                creator=user,
+                activity=f"{user} reconciled {len(instances)} {label} record(s) ({skipped} skipped)",
+            )
+            logger.debug(
+                f"Activity feed({user} reconciled {len(instances)} {label} record(s) ({skipped} skipped)) created."
+            )
+
+        return instances
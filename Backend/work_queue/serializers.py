@@ -0,0 +1,45 @@
+from rest_framework import serializers
+from django.utils import timezone
+from .models import WorkItem
+
+
+class WorkItemReadSerializer(serializers.ModelSerializer):
+    model = serializers.SerializerMethodField()
+    age = serializers.SerializerMethodField()
+    unit_display = serializers.StringRelatedField(source="unit", read_only=True)
+    assigned_to_display = serializers.StringRelatedField(
+        source="assigned_to", read_only=True
+    )
+    created_at = serializers.DateTimeField(format="%Y-%m-%d %I:%M %p", read_only=True)
+
+    class Meta:
+        model = WorkItem
+        fields = "__all__"
+
+    def get_model(self, obj):
+        return obj.content_type.name.replace("_", " ").capitalize()
+
+    def get_age(self, obj):
+        return (timezone.now() - obj.created_at).days
+
+
+class WorkItemAssignSerializer(serializers.ModelSerializer):
+
+    class Meta:
+        model = WorkItem
+        fields = ["assigned_to"]
+
+
+class ReconcileSerializer(serializers.Serializer):
+    model = serializers.CharField()
+    dry_run = serializers.BooleanField(default=False)
+
+    def validate_model(self, value):
+        from .reconciliation import RECONCILERS
+
+        if value.lower() not in RECONCILERS:
+            raise serializers.ValidationError(
+                f"Records of {value} cannot be reconciled."
+            )
+
+        return value.lower()
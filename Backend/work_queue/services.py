@@ -0,0 +1,177 @@
+import logging
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import CharField, Q
+from django.db.models.functions import Cast
+from django.utils import timezone
+from employees.models import Employee, UnregisteredEmployees
+from occurance.models import IncompleteOccurrence
+from children.models import InCompleteChildRecords
+from courses.models import IncompleteCourseRecords
+from previous_government_service.models import (
+    IncompletePreviousGovernmentServiceRecords,
+)
+from service_with_forces.models import IncompleteServiceWithForcesRecords
+from termination_of_appointment.models import (
+    IncompleteTerminationOfAppointmentRecords,
+)
+from flags.models import Flags
+from flags.resolvers import get_service_id
+from .models import WorkItem
+
+logger = logging.getLogger(__name__)
+
+_deferred_work_items = threading.local()
+
+
+INCOMPLETE_RECORD_MODELS = [
+    UnregisteredEmployees,
+    IncompleteOccurrence,
+    InCompleteChildRecords,
+    IncompleteCourseRecords,
+    IncompletePreviousGovernmentServiceRecords,
+    IncompleteServiceWithForcesRecords,
+    IncompleteTerminationOfAppointmentRecords,
+    Flags,
+]
+
+
+def get_created_at(instance):
+    return (
+        getattr(instance, "date_added", None)
+        or getattr(instance, "created_at", None)
+        or timezone.now()
+    )
+
+
+def is_work_item_source(instance):
+    # A flag on an incomplete record would list the record twice, the record
+    # has its own item
+    if isinstance(instance, Flags):
+        content_type = ContentType.objects.get_for_id(instance.content_type_id)
+        return content_type.model_class() not in INCOMPLETE_RECORD_MODELS
+
+    return True
+
+
+def sync_work_items(instances):
+    instances = [instance for instance in instances if is_work_item_source(instance)]
+
+    if not instances:
+        return []
+
+    # Units of the employees the records belong to, fetched in one query
+    service_ids = {get_service_id(instance) for instance in instances} - {None}
+    units = dict(
+        Employee.objects.filter(pk__in=service_ids).values_list("service_id", "unit")
+    )
+
+    work_items = []
+
+    for instance in instances:
+        service_id = get_service_id(instance)
+
+        work_items.append(
+            WorkItem(
+                content_type=ContentType.objects.get_for_model(instance),
+                object_id=str(instance.pk),
+                service_id=service_id,
+                unit_id=getattr(instance, "unit_id", None) or units.get(service_id),
+                # Whoever added the record is the first to finish it
+                assigned_to_id=getattr(instance, "created_by_id", None),
+                created_at=get_created_at(instance),
+            )
+        )
+
+    # Existing items keep their assignee and age
+    work_items = WorkItem.objects.bulk_create(
+        work_items,
+        update_conflicts=True,
+        unique_fields=["content_type", "object_id"],
+        update_fields=["service_id", "unit"],
+    )
+    logger.debug(f"{len(work_items)} Work items synced.")
+
+    return work_items
+
+
+def get_object_ids(instances, object_ids=None):
+    # ContentType -> primary keys, as WorkItem stores them
+    object_ids = defaultdict(list) if object_ids is None else object_ids
+
+    for instance in instances:
+        content_type = ContentType.objects.get_for_model(instance)
+        object_ids[content_type].append(str(instance.pk))
+
+    return object_ids
+
+
+def remove_work_items(instances):
+    return delete_work_items(get_object_ids(instances))
+
+
+def delete_work_items(object_ids):
+    if not object_ids:
+        return 0
+
+    query = Q()
+    for content_type, ids in object_ids.items():
+        query |= Q(content_type=content_type, object_id__in=ids)
+
+    deleted, _ = WorkItem.objects.filter(query).delete()
+    logger.debug(f"{deleted} Work items removed.")
+
+    return deleted
+
+
+def schedule_work_item_removal(instance):
+    deferred = getattr(_deferred_work_items, "object_ids", None)
+
+    if deferred is None:
+        remove_work_items([instance])
+    else:
+        # Read now, deleted instances lose their pk once the delete finishes
+        get_object_ids([instance], deferred)
+
+
+@contextmanager
+def defer_work_item_removal():
+    # Collects the records deleted inside the block and removes their work
+    # items with one DELETE when it exits
+    _deferred_work_items.object_ids = defaultdict(list)
+
+    try:
+        yield
+        object_ids = _deferred_work_items.object_ids
+    finally:
+        _deferred_work_items.object_ids = None
+
+    delete_work_items(object_ids)
+
+
+def delete_duplicate_work_items():
+    # Items synced for flags on incomplete records before those were skipped
+    content_types = ContentType.objects.get_for_models(*INCOMPLETE_RECORD_MODELS)
+    flag_ids = (
+        Flags.objects.filter(content_type__in=content_types.values())
+        .annotate(flag_id=Cast("pk", output_field=CharField()))
+        .values("flag_id")
+    )
+
+    deleted, _ = WorkItem.objects.filter(
+        content_type=ContentType.objects.get_for_model(Flags),
+        object_id__in=flag_ids,
+    ).delete()
+    logger.debug(f"{deleted} Duplicate work items removed.")
+
+    return deleted
+
+
+def update_work_items_unit(service_id, unit_id):
+    return (
+        WorkItem.objects.filter(service_id=service_id)
+        .exclude(unit_id=unit_id)
+        .update(unit_id=unit_id)
+    )
@@ -0,0 +1,35 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from employees.models import Employee
+from .services import (
+    INCOMPLETE_RECORD_MODELS,
+    is_work_item_source,
+    remove_work_items,
+    sync_work_items,
+    schedule_work_item_removal,
+    update_work_items_unit,
+)
+
+
+def handle_incomplete_record_save(sender, instance, created, **kwargs):
+    if is_work_item_source(instance):
+        sync_work_items([instance])
+
+    elif not created:
+        # A flag moved onto an incomplete record, which has its own item
+        remove_work_items([instance])
+
+
+def handle_incomplete_record_delete(sender, instance, **kwargs):
+    schedule_work_item_removal(instance)
+
+
+for model in INCOMPLETE_RECORD_MODELS:
+    post_save.connect(handle_incomplete_record_save, sender=model)
+    post_delete.connect(handle_incomplete_record_delete, sender=model)
+
+
+@receiver(post_save, sender=Employee)
+def handle_employee_unit_save(sender, instance, **kwargs):
+    # Records added before the employee was registered get their unit here
+    update_work_items_unit(instance.service_id, instance.unit_id)
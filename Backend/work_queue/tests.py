@@ -0,0 +1,148 @@
+from io import StringIO
+from django.contrib.contenttypes.models import ContentType
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+from employees.tests.base import EmployeeBaseAPITestCase
+from employees.models import Employee, UnregisteredEmployees, Units
+from children.models import InCompleteChildRecords
+from flags.models import Flags
+from work_queue.models import WorkItem
+
+
+class ListWorkItemsAPITest(EmployeeBaseAPITestCase):
+
+    def setUp(self):
+        self.create_employee_url = reverse("create-employee")
+        self.list_work_items_url = reverse("list-work-items")
+
+        self.other_unit = Units.objects.create(unit_name="5 BN", city="Accra")
+
+        self.authenticate_admin()
+
+    def test_oldest_items_for_unit(self):
+        first = UnregisteredEmployees.objects.create(
+            service_id="000111", unit=self.unit, created_by=self.admin
+        )
+        UnregisteredEmployees.objects.create(service_id="000222", unit=self.other_unit)
+        second = UnregisteredEmployees.objects.create(
+            service_id="000333", unit=self.unit
+        )
+
+        # Send list request
+        response = self.client.get(
+            self.list_work_items_url, {"unit": self.unit.id, "page_size": 1}
+        )
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertEqual(response.data["results"][0]["object_id"], str(first.id))
+        self.assertEqual(response.data["results"][0]["assigned_to"], self.admin.id)
+        self.assertEqual(response.data["results"][0]["age"], 0)
+
+        # Send next page request
+        response = self.client.get(response.data["next"])
+
+        # Assertions
+        self.assertEqual(response.data["results"][0]["object_id"], str(second.id))
+        self.assertIsNone(response.data["next"])
+
+    def test_unit_resolved_from_employee(self):
+        InCompleteChildRecords.objects.create(service_id="000993")
+
+        # Assertions
+        self.assertIsNone(WorkItem.objects.get(service_id="000993").unit)
+
+        # Send create employee request
+        self.client.post(self.create_employee_url, self.employee_data, format="json")
+
+        # Send list request
+        response = self.client.get(self.list_work_items_url, {"unit": self.unit.id})
+
+        # Assertions
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertEqual(
+            response.data["results"][0]["model"], "Incomplete child records"
+        )
+
+    def test_deleted_record_leaves_queue(self):
+        record = UnregisteredEmployees.objects.create(service_id="000111")
+
+        # Assertions
+        self.assertEqual(WorkItem.objects.count(), 1)
+
+        record.delete()
+
+        # Assertions
+        self.assertEqual(WorkItem.objects.count(), 0)
+
+    def test_flagged_record_listed_once(self):
+        record = UnregisteredEmployees.objects.create(service_id="000111")
+        Flags.objects.create(
+            content_object=record, reason="Incomplete Record", service_id="000111"
+        )
+
+        # Send list request
+        response = self.client.get(self.list_work_items_url)
+
+        # Assertions
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertEqual(response.data["results"][0]["object_id"], str(record.id))
+
+    def test_flagged_employee_listed(self):
+        # Send create employee request
+        self.client.post(self.create_employee_url, self.employee_data, format="json")
+
+        flag = Flags.objects.create(
+            content_type=ContentType.objects.get_for_model(Employee),
+            object_id="000993",
+            reason="Employee data is invalid",
+            service_id="000993",
+        )
+
+        # Send list request
+        response = self.client.get(self.list_work_items_url)
+
+        # Assertions
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertEqual(response.data["results"][0]["object_id"], str(flag.id))
+
+    def test_sync_removes_duplicates(self):
+        record = UnregisteredEmployees.objects.create(service_id="000111")
+        flag = Flags.objects.create(
+            content_object=record, reason="Incomplete Record", service_id="000111"
+        )
+
+        # Synced before flags on incomplete records were skipped
+        WorkItem.objects.create(
+            content_type=ContentType.objects.get_for_model(Flags),
+            object_id=str(flag.id),
+            service_id="000111",
+        )
+
+        call_command("sync_work_queue", stdout=StringIO())
+
+        # Assertions
+        self.assertEqual(WorkItem.objects.get().object_id, str(record.id))
+
+
+class AssignWorkItemAPITest(EmployeeBaseAPITestCase):
+
+    def setUp(self):
+        self.authenticate_admin()
+
+    def test_successful_assignment(self):
+        UnregisteredEmployees.objects.create(service_id="000111")
+        work_item = WorkItem.objects.get()
+
+        # Send assign request
+        response = self.client.patch(
+            reverse("assign-work-item", kwargs={"pk": work_item.id}),
+            {"assigned_to": self.admin.id},
+            format="json",
+        )
+
+        # Assertions
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["assigned_to_display"], "Admin")
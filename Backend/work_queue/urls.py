@@ -0,0 +1,16 @@
+from django.urls import path
+from . import views
+
+urlpatterns = [
+    path("", views.ListWorkItemsAPIView.as_view(), name="list-work-items"),
+    path(
+        "reconcile/",
+        views.ReconcileIncompleteRecordsAPIView.as_view(),
+        name="reconcile-incomplete-records",
+    ),
+    path(
+        "<str:pk>/assign/",
+        views.AssignWorkItemAPIView.as_view(),
+        name="assign-work-item",
+    ),
+]
@@ -0,0 +1,101 @@
+from rest_framework import generics, pagination
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
+from api.throttles import BulkThrottle, WriteThrottle
+from rest_framework.response import Response
+from employees.permissions import IsAdminUserOrStandardUser
+from activity_feeds.models import ActivityFeeds
+from django.db import transaction
+from .models import WorkItem
+from .reconciliation import get_reconciler
+from . import serializers
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class WorkQueuePagination(pagination.CursorPagination):
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 200
+    # Matches the (unit, created_at, id) and (created_at, id) indexes
+    ordering = ("created_at", "id")
+
+
+class ListWorkItemsAPIView(generics.ListAPIView):
+    serializer_class = serializers.WorkItemReadSerializer
+    permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
+    throttle_classes = []
+    pagination_class = WorkQueuePagination
+
+    def get_queryset(self):
+        unit = self.request.query_params.get("unit")
+        service_id = self.request.query_params.get("service_id")
+        assigned_to = self.request.query_params.get("assigned_to")
+        model = self.request.query_params.get("model")
+
+        qs = WorkItem.objects.select_related("content_type", "unit", "assigned_to")
+
+        if unit:
+            qs = qs.filter(unit=unit)
+
+        if service_id:
+            qs = qs.filter(service_id=service_id)
+
+        if assigned_to:
+            qs = qs.filter(assigned_to=assigned_to)
+
+        if model:
+            qs = qs.filter(content_type__model=model.lower())
+
+        return qs
+
+
+class AssignWorkItemAPIView(generics.UpdateAPIView):
+    queryset = WorkItem.objects.all()
+    lookup_field = "pk"
+    serializer_class = serializers.WorkItemAssignSerializer
+    permission_classes = [IsAuthenticated, IsAdminUserOrStandardUser]
+    throttle_classes = [WriteThrottle]
+
+    def update(self, request, *args, **kwargs):
+        partial = kwargs.pop("partial", False)
+        instance = self.get_object()
+        serializer = self.get_serializer(instance, data=request.data, partial=partial)
+        serializer.is_valid(raise_exception=True)
+
+        self.perform_update(serializer)
+
+        read_serializer = serializers.WorkItemReadSerializer(self.work_item)
+
+        return Response(read_serializer.data)
+
+    def perform_update(self, serializer):
+        with transaction.atomic():
+            self.work_item = serializer.save()
+            logger.debug(f"Work Item({self.work_item}) assigned.")
+
+            ActivityFeeds.objects.create(
+                creator=self.request.user,
+                activity=f"{self.request.user} assigned Work Item({self.work_item}) to {self.work_item.assigned_to or 'N/A'}",
+            )
+            logger.debug(
+                f"Activity feed({self.request.user} assigned Work Item({self.work_item}) to {self.work_item.assigned_to or 'N/A'}) created."
+            )
+
+
+class ReconcileIncompleteRecordsAPIView(generics.GenericAPIView):
+    serializer_class = serializers.ReconcileSerializer
+    permission_classes = [IsAdminUser, IsAuthenticated]
+    throttle_classes = [BulkThrottle]
+
+    def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        reconciler = get_reconciler(serializer.validated_data["model"])
+        report = reconciler.reconcile(
+            request.user, dry_run=serializer.validated_data["dry_run"]
+        )
+        logger.debug(f"Reconciliation({report['model']}) completed.")
+
+        return Response(report)
@@ -12,6 +12,14 @@ import ActivityFeeds from "../../Dashboard/Components/ActivityFeedsComponent";
 import Notification from "../../../Components/Common/NotificationComponent";
 import getResponseMessages from "../../../utils/extractResponseMessage";
 import { useNavigate } from "react-router-dom";
+import { ACCESS_TOKEN } from "../../../constants";
+import applyDashboardDelta from "../../../utils/applyDashboardDelta";
+
+const DASHBOARD_TOPICS = {
+  user_update: "users",
+  employee_update: "employees",
+  feeds_update: "feeds",
+};
 
 export default function Dashboard() {
   const [totalUsersPerRole, setTotalUsersPerRole] = useState(null);
@@ -28,6 +36,7 @@ export default function Dashboard() {
   const reconnectRef = useRef(true);
   const socketTimerRef = useRef(null);
   const retriesRef = useRef(0);
+  const snapshotsRef = useRef({});
   const navigate = useNavigate();
 
   const { theme } = useTheme();
@@ -63,12 +72,19 @@ export default function Dashboard() {
       const MAX_RETRIES = 5;
       const WS_URL = import.meta.env.VITE_WS_URL;
 
-      const socket = new WebSocket(`${WS_URL}/ws/dashboard/`);
+      const socket = new WebSocket(`${WS_URL}/ws/dashboard/`, [
+        "access_token",
+        localStorage.getItem(ACCESS_TOKEN),
+      ]);
       socketInstance.current = socket;
 
       socket.onopen = () => {
         console.log("Websocket connected...");
         retriesRef.current = 0;
+
+        ["users", "employees", "feeds"].forEach((topic) =>
+          socket.send(JSON.stringify({ action: "subscribe", topic }))
+        );
       };
 
       socket.onmessage = (event) => {
@@ -81,7 +97,27 @@ export default function Dashboard() {
           return;
         }
 
-        const { type, data } = dataReceived;
+        const { type, version, ops } = dataReceived;
+        const topic = DASHBOARD_TOPICS[type];
+
+        if (!topic) return;
+
+        let data = dataReceived.data;
+
+        if (ops) {
+          const snapshot = snapshotsRef.current[type];
+
+          // Deltas only apply to the version before them; after a missed
+          // one the server answers with a full snapshot
+          if (!snapshot || snapshot.version !== version - 1) {
+            socket.send(JSON.stringify({ action: "resync", topic }));
+            return;
+          }
+
+          data = applyDashboardDelta(snapshot.data, ops);
+        }
+
+        snapshotsRef.current[type] = { version, data };
 
         switch (type) {
           case "user_update":
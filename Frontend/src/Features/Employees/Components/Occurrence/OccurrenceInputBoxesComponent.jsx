@@ -195,12 +195,12 @@ export default function OccurrenceInputBoxes(props) {
     );
   };
 
-  const verifyLevelStepToAssignSalary = async (label, levelStep) => {
-    if (label !== "LevelStep") return;
-
+  const assignSalary = async (levelStep, wefDate) => {
     try {
+      // Priced at the rate in force on the WEF date, today's rate without one
       const res = await api.get(
         `api/occurrence/level-step/${levelStep}/annual-salary/`,
+        { params: wefDate ? { wef_date: wefDate } : {} },
       );
       props.setFormData((prev) => ({
         ...prev,
@@ -217,6 +217,20 @@ export default function OccurrenceInputBoxes(props) {
     }
   };
 
+  const verifyLevelStepToAssignSalary = (label, levelStep) => {
+    if (label !== "LevelStep") return;
+
+    assignSalary(levelStep, props.formData.wefDate);
+  };
+
+  const verifyWefDateToAssignSalary = (label, wefDate) => {
+    const levelStep = props.formData.levelStep?.value;
+    // Salaries entered by hand are left as they are
+    if (label !== "WEF Date" || !levelStep || editStatus) return;
+
+    assignSalary(levelStep, wefDate);
+  };
+
   const verifyEventToDisplayPercentageDropdown = (label, eventName) => {
     if (label !== "Event") return;
 
@@ -297,6 +311,7 @@ export default function OccurrenceInputBoxes(props) {
                 type={type}
                 value={props.formData[labelKey(label)]}
                 onChange={(e) => {
+                  verifyWefDateToAssignSalary(label, e.target.value);
                   props.setFormData((prev) => ({
                     ...prev,
                     [labelKey(label)]: e.target.value,
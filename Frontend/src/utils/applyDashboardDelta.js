@@ -0,0 +1,29 @@
+// Applies the ops of a realtime dashboard delta to a copy of the topic's
+// last snapshot. The ops are described in Backend/realtime/deltas.py.
+export default function applyDashboardDelta(data, ops) {
+  // Wrapped so ops on the whole payload have a parent too
+  const container = { root: structuredClone(data) };
+
+  ops.forEach(([op, path, values]) => {
+    const keys = ["root", ...path];
+    const key = keys.pop();
+    const parent = keys.reduce((node, k) => node[k], container);
+
+    switch (op) {
+      case "set":
+        parent[key] = values;
+        break;
+      case "unset":
+        delete parent[key];
+        break;
+      case "add":
+        parent[key] = [...parent[key], ...values];
+        break;
+      case "remove":
+        parent[key] = parent[key].filter((value) => !values.includes(value));
+        break;
+    }
+  });
+
+  return container.root;
+}